@@ -0,0 +1,150 @@
+"""
+Benchmark for scraper.extract_product_data().
+Compares the "live" mode (per-element WebDriver calls) with the "script"
+mode (one injected script per page) on the same loaded page, reporting
+wall time and the number of WebDriver commands sent to chromedriver.
+
+The extraction backends of category_engine.extract_products() are
+compared on the same page too: "live" (find_element per card) against
+"html" (one outerHTML dump) with the lxml and html.parser parsers.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+import category_engine
+import html_extraction
+import location_session
+import scrape_fruits_vegetables
+import scraper
+
+OUTPUT_BENCHMARK = "output/benchmark_extraction.json"
+ENGINE_BACKENDS = [("live", None), ("html", "lxml"), ("html", "html.parser")]
+
+
+@contextmanager
+def count_commands(driver):
+    """Counts every WebDriver command sent while the block runs."""
+    counts = Counter()
+    original_execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counts[driver_command] += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = counting_execute
+    try:
+        yield counts
+    finally:
+        driver.execute = original_execute
+
+
+def run_mode(driver, mode):
+    """Runs one extraction mode and returns its measurements."""
+    with count_commands(driver) as counts:
+        start = time.perf_counter()
+        products = scraper.extract_product_data(driver, mode=mode)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 3),
+        "commands": sum(counts.values()),
+        "commands_by_type": dict(counts.most_common()),
+        "products": len(products),
+        "product_urls": sorted({p["product_url"] for p in products}),
+    }
+
+
+def run_engine_backend(driver, backend, parser=None):
+    """Runs category_engine.extract_products() with one backend and returns its measurements."""
+    saved = category_engine.EXTRACTION_BACKEND, html_extraction.HTML_PARSER
+    category_engine.EXTRACTION_BACKEND = backend
+    html_extraction.HTML_PARSER = parser or html_extraction.HTML_PARSER
+    try:
+        with count_commands(driver) as counts:
+            start = time.perf_counter()
+            products = scrape_fruits_vegetables.extract_products(driver)
+            elapsed = time.perf_counter() - start
+    finally:
+        category_engine.EXTRACTION_BACKEND, html_extraction.HTML_PARSER = saved
+
+    return {
+        "mode": f"{backend}:{parser}" if parser else backend,
+        "seconds": round(elapsed, 3),
+        "commands": sum(counts.values()),
+        "commands_by_type": dict(counts.most_common()),
+        "products": len(products),
+        "product_urls": sorted({p["product_url"] for p in products}),
+    }
+
+
+def print_results(results):
+    print(f"{'Mode':<18}{'Seconds':>10}{'Commands':>12}{'Products':>10}")
+    for result in results:
+        print(f"{result['mode']:<18}{result['seconds']:>10.2f}{result['commands']:>12}{result['products']:>10}")
+
+
+def main():
+    print("=" * 60)
+    print("Extraction Benchmark: live vs script vs html")
+    print("=" * 60)
+
+    driver = None
+    try:
+        driver = scraper.setup_driver(headless=scraper.HEADLESS_MODE)
+        driver.get(scraper.ZEPTO_URL)
+        location_session.ensure_location(driver, scraper.WHITEFIELD_PIN,
+                                         set_location=scraper.set_location_whitefield)
+
+        scraper.navigate_to_fruits_vegetables_category(driver)
+        scraper.scroll_and_load_products(driver, max_scrolls=10)
+
+        results = [run_mode(driver, "live"), run_mode(driver, "script")]
+        live, script = results
+        engine_results = [run_engine_backend(driver, backend, parser) for backend, parser in ENGINE_BACKENDS]
+
+        print("\n" + "=" * 60)
+        print_results(results)
+        if script["seconds"] > 0:
+            print(f"\nSpeed-up: {live['seconds'] / script['seconds']:.1f}x, "
+                  f"commands: {live['commands']} -> {script['commands']}")
+        if set(live["product_urls"]) != set(script["product_urls"]):
+            print("[WARNING] The two modes returned different product URLs")
+
+        print("\ncategory_engine.extract_products() backends:")
+        print_results(engine_results)
+        engine_live = engine_results[0]
+        for result in engine_results[1:]:
+            if result["seconds"] > 0:
+                print(f"  {result['mode']}: {engine_live['seconds'] / result['seconds']:.1f}x faster than live")
+            if set(result["product_urls"]) != set(engine_live["product_urls"]):
+                print(f"  [WARNING] {result['mode']} returned different product URLs than live")
+        print("=" * 60)
+
+        os.makedirs(os.path.dirname(OUTPUT_BENCHMARK), exist_ok=True)
+        with open(OUTPUT_BENCHMARK, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "url": driver.current_url,
+                    "run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "results": results,
+                    "engine_results": engine_results,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"Results saved to {OUTPUT_BENCHMARK}")
+
+    finally:
+        if driver:
+            driver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark for the browser profiles of scraper.setup_driver().
+Loads the same category page with the "full" and the "lean" profile and
+reports page-load time, scroll time, bytes transferred and how many image
+URLs are still readable, side by side.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+import location_session
+import scraper
+
+OUTPUT_BENCHMARK = "output/benchmark_profiles.json"
+PROFILES = ["full", "lean"]
+ROUNDS = 3  # Page loads per profile
+
+# Bytes transferred by the page and how many product images still have a URL
+PAGE_STATS_SCRIPT = """
+var resources = performance.getEntriesByType('resource');
+var bytes = resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, 0);
+var nav = performance.getEntriesByType('navigation')[0];
+var images = Array.prototype.slice.call(document.images);
+return {
+    requests: resources.length,
+    bytes: bytes + (nav ? nav.transferSize || 0 : 0),
+    images: images.length,
+    image_urls: images.filter(function (img) {
+        return img.getAttribute('src') || img.getAttribute('data-src');
+    }).length
+};
+"""
+
+
+def run_profile(profile, url):
+    """Loads the page ROUNDS times with one profile and returns its measurements."""
+    print(f"\n[{profile}] Launching browser...")
+    driver = scraper.setup_driver(headless=scraper.HEADLESS_MODE, profile=profile)
+    rounds = []
+    try:
+        driver.get(scraper.ZEPTO_URL)
+        location_session.ensure_location(driver, scraper.WHITEFIELD_PIN,
+                                         set_location=scraper.set_location_whitefield)
+
+        for i in range(ROUNDS):
+            start = time.perf_counter()
+            driver.get(url)
+            WebDriverWait(driver, 30).until(
+                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), '₹')]"))
+            )
+            load_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            scraper.scroll_and_load_products(driver, max_scrolls=10)
+            scroll_seconds = time.perf_counter() - start
+
+            stats = driver.execute_script(PAGE_STATS_SCRIPT)
+            stats.update({
+                "load_seconds": round(load_seconds, 3),
+                "scroll_seconds": round(scroll_seconds, 3),
+            })
+            rounds.append(stats)
+            print(f"  Round {i+1}/{ROUNDS}: load {load_seconds:.2f}s, scroll {scroll_seconds:.2f}s, "
+                  f"{stats['bytes'] / 1024:.0f} KB, {stats['image_urls']}/{stats['images']} image URLs")
+    finally:
+        driver.quit()
+
+    def average(key):
+        return round(sum(r[key] for r in rounds) / len(rounds), 3) if rounds else 0
+
+    return {
+        "profile": profile,
+        "load_seconds": average("load_seconds"),
+        "scroll_seconds": average("scroll_seconds"),
+        "kilobytes": round(average("bytes") / 1024, 1),
+        "requests": average("requests"),
+        "image_urls": average("image_urls"),
+        "images": average("images"),
+        "rounds": rounds,
+    }
+
+
+def main():
+    print("=" * 60)
+    print("Browser Profile Benchmark: full vs lean")
+    print("=" * 60)
+
+    url = scraper.FRUITS_VEGETABLES_URL
+    results = [run_profile(profile, url) for profile in PROFILES]
+    full, lean = results
+
+    print("\n" + "=" * 60)
+    print(f"{'':<16}{'full':>12}{'lean':>12}")
+    for key, label in [("load_seconds", "Page load (s)"), ("scroll_seconds", "Scroll (s)"),
+                       ("kilobytes", "Transferred KB"), ("requests", "Requests"),
+                       ("image_urls", "Image URLs")]:
+        print(f"{label:<16}{full[key]:>12}{lean[key]:>12}")
+    if lean["load_seconds"] and lean["scroll_seconds"]:
+        print(f"\nSpeed-up: page load {full['load_seconds'] / lean['load_seconds']:.1f}x, "
+              f"scroll {full['scroll_seconds'] / lean['scroll_seconds']:.1f}x")
+    if lean["image_urls"] < full["image_urls"]:
+        print("[WARNING] The lean profile returned fewer image URLs")
+    print("=" * 60)
+
+    os.makedirs(os.path.dirname(OUTPUT_BENCHMARK), exist_ok=True)
+    with open(OUTPUT_BENCHMARK, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "url": url,
+                "run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "results": results,
+            },
+            f,
+            indent=2,
+            ensure_ascii=False,
+        )
+    print(f"Results saved to {OUTPUT_BENCHMARK}")
+
+
+if __name__ == "__main__":
+    main()
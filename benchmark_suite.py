@@ -0,0 +1,357 @@
+"""
+Benchmark suite for the extraction and filtering hot paths.
+
+Runs without a browser, against synthetic category pages (100 to 10,000
+product cards, generated from each category's keywords) and the recorded
+fixtures (catalog responses, saved page snapshots). For every category and
+page size it times:
+
+    extract_products   card extraction from the page HTML (html_extraction)
+    is_valid_product   the category filter over every card
+    dedup              add_unique_products() over pages with repeated cards
+    breakdown          the category's print_breakdown() counters
+    save_data          CSV + JSON output through the product sink
+
+Results are written as JSON (median and best of BENCH_REPEAT runs). Save
+one run as the baseline, then compare later runs against it; timings that
+got slower by more than the threshold are flagged and the command exits 1.
+
+Usage:
+    python benchmark_suite.py                              # all categories, all sizes
+    python benchmark_suite.py munchies --sizes 100 1000    # subset
+    python benchmark_suite.py --save-baseline              # run and store as the baseline
+    python benchmark_suite.py --compare                    # run and compare with the baseline
+    python benchmark_suite.py --compare --results output/benchmark_suite.json
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import catalog_capture
+import category_engine
+import html_extraction
+import page_snapshots
+from product_sink import ProductSink
+
+# Configuration
+OUTPUT_RESULTS = "output/benchmark_suite.json"
+BASELINE_FILE = "fixtures/benchmark_baseline.json"
+BENCH_SIZES = [100, 1000, 10000]  # Product cards per synthetic page
+BENCH_REPEAT = 3  # Runs per timing (median and best are reported)
+REGRESSION_THRESHOLD = 0.20  # Flag timings more than 20% slower than the baseline
+REGRESSION_MIN_SECONDS = 0.002  # Ignore differences smaller than this (timer noise)
+DUPLICATE_RATE = 0.15  # Share of cards repeated on a later page (dedup benchmark)
+INVALID_RATE = 0.10  # Share of cards from another category (filter benchmark)
+BANNER_RATE = 0.03  # Share of promotional banners between the cards
+
+PAGE_URL = "https://www.zepto.com/cn/{key}/{key}/cid/bench/scid/bench"
+BRANDS = ["Zepto", "Fresh", "Tata", "Amul", "Haldiram's", "Britannia", "ITC", "Nestle", "Mother Dairy"]
+VARIANTS = ["Classic", "Premium", "Family Pack", "Value", "Organic", "Spicy", "Lite", "Combo"]
+QUANTITIES = ["100 g", "200 g", "500 g", "1 kg", "250 ml", "1 l", "6 pcs", "2 pack"]
+
+
+def _keywords(definition, field):
+    return [kw for kw in definition.get(field) or [] if kw.strip()] or ["item"]
+
+
+def synthetic_cards(definition, cards, seed=0):
+    """
+    Product cards for a synthetic category page.
+
+    Most names contain one of the category's valid keywords; INVALID_RATE of
+    them use an invalid keyword instead, so the filter has work to do.
+
+    Returns:
+        list: Card dicts (name, slug, pvid, price, mrp, quantity, image)
+    """
+    rng = random.Random(f"{definition['key']}:{cards}:{seed}")
+    valid = _keywords(definition, "valid_keywords")
+    invalid = _keywords(definition, "invalid_keywords")
+    result = []
+    for idx in range(cards):
+        keyword = rng.choice(invalid if rng.random() < INVALID_RATE else valid)
+        name = f"{rng.choice(BRANDS)} {keyword.title()} {rng.choice(VARIANTS)} {idx}"
+        slug = "-".join(name.lower().replace("'", "").split())
+        price = rng.randint(10, 900)
+        result.append({
+            "name": name,
+            "slug": slug,
+            "pvid": f"{rng.getrandbits(64):016x}-bench-{idx}",
+            "price": price,
+            "mrp": price + rng.choice([0, 0, 5, 10, 25, 50]),
+            "quantity": rng.choice(QUANTITIES),
+            "image": f"https://cdn.zeptonow.com/production/bench/{slug}.jpeg",
+        })
+    return result
+
+
+def render_page(cards, seed=0):
+    """Zepto-like product-grid HTML for synthetic cards, with banners in between."""
+    rng = random.Random(f"render:{len(cards)}:{seed}")
+    parts = ['<div class="grid">']
+    for card in cards:
+        if rng.random() < BANNER_RATE:
+            parts.append('<div class="banner"><div>Explore new arrivals</div><div>Up to 60% off, from ₹49</div></div>')
+        off = card["mrp"] - card["price"]
+        parts.append(
+            f'<div class="card"><a href="/pn/{card["slug"]}/pvid/{card["pvid"]}">'
+            f'<div><img src="{card["image"]}" alt=""></div>'
+            f'<div><span>₹{card["price"]}</span>'
+            + (f'<span class="mrp">₹{card["mrp"]}</span></div><div>₹{off} OFF</div>' if off else "</div>")
+            + f'<div class="product-name">{card["name"]}</div><div>{card["quantity"]}</div>'
+            f'<button>ADD</button></a></div>'
+        )
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def card_products(cards, page_url):
+    """Product dicts for synthetic cards, as the extraction returns them."""
+    scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    origin = html_extraction.ORIGIN_PATTERN.match(page_url).group(0)
+    return [
+        {
+            "name": " ".join(word.capitalize() for word in card["slug"].split("-")),
+            "price": str(card["price"]),
+            "discount": f"₹{card['mrp'] - card['price']}" if card["mrp"] != card["price"] else "N/A",
+            "quantity": card["quantity"],
+            "image_url": card["image"],
+            "product_url": f"{origin}/pn/{card['slug']}/pvid/{card['pvid']}",
+            "scraped_at": scraped_at,
+        }
+        for card in cards
+    ]
+
+
+def paged_with_duplicates(products, page_size=50, seed=0):
+    """Splits products into pages and repeats DUPLICATE_RATE of them on later pages."""
+    rng = random.Random(f"pages:{len(products)}:{seed}")
+    pages = [list(products[i:i + page_size]) for i in range(0, len(products), page_size)]
+    for page in pages[1:]:
+        page.extend(rng.sample(products, min(len(products), int(page_size * DUPLICATE_RATE))))
+    return pages
+
+
+def measure(func, repeat=BENCH_REPEAT):
+    """Runs func() `repeat` times (stdout silenced) and returns timing stats and its last result."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+    return {
+        "median": round(statistics.median(timings), 6),
+        "best": round(min(timings), 6),
+        "runs": len(timings),
+    }, result
+
+
+def bench_category(key, definition, sizes, repeat, results, scratch_dir):
+    module = importlib.import_module(definition["script"])
+    page_url = PAGE_URL.format(key=key)
+    backend = html_extraction.get_backend()
+
+    for size in sizes:
+        cards = synthetic_cards(definition, size)
+        html = render_page(cards)
+        products = card_products(cards, page_url)
+
+        stats, extracted = measure(
+            lambda: html_extraction.extract_products_from_html(
+                html, definition, module.is_valid_product, page_url=page_url, backend=backend
+            ),
+            repeat,
+        )
+        results[f"extract_products/{key}/{size}"] = dict(stats, items=len(extracted))
+
+        stats, valid = measure(lambda: [p for p in products if module.is_valid_product(p)], repeat)
+        results[f"is_valid_product/{key}/{size}"] = dict(stats, items=len(valid))
+
+        pages = paged_with_duplicates(valid)
+
+        def dedup():
+            sink = ProductSink(os.path.join(scratch_dir, f"dedup_{key}_{size}.csv"),
+                               os.path.join(scratch_dir, f"dedup_{key}_{size}.json"),
+                               fieldnames=category_engine.CSV_FIELDNAMES)
+            for page in pages:
+                category_engine.add_unique_products(page, sink)
+            sink.close()
+            return sink.read_products()
+
+        stats, unique = measure(dedup, repeat)
+        results[f"dedup/{key}/{size}"] = dict(stats, items=len(unique))
+
+        stats, _ = measure(lambda: module.print_breakdown(unique), repeat)
+        results[f"breakdown/{key}/{size}"] = dict(stats, items=len(unique))
+
+        output_csv = os.path.join(scratch_dir, f"{key}_{size}.csv")
+        output_json = os.path.join(scratch_dir, f"{key}_{size}.json")
+        stats, _ = measure(lambda: category_engine.save_data(unique, output_csv, output_json), repeat)
+        results[f"save_data/{key}/{size}"] = dict(stats, items=len(unique))
+
+        print(f"  {key:<22} {size:>6} cards: extract {results[f'extract_products/{key}/{size}']['median']:.3f}s, "
+              f"{len(extracted)} products")
+
+
+def bench_fixtures(keys, repeat, results):
+    """Timings over the recorded fixtures (catalog responses, saved page snapshots)."""
+    if os.path.exists(catalog_capture.FIXTURE_PATH):
+        responses = catalog_capture.load_fixture()
+        stats, products = measure(lambda: catalog_capture.products_from_responses(responses), repeat)
+        results["fixture/catalog_responses"] = dict(stats, items=len(products))
+
+    snapshots = page_snapshots.load_snapshots(keys)
+    if snapshots:
+        pages = [(entry, page_snapshots.read_snapshot(entry)) for entry in snapshots]
+        categories = category_engine.load_categories()
+
+        def replay():
+            count = 0
+            for entry, html in pages:
+                definition = categories.get(entry["key"])
+                if definition:
+                    module = importlib.import_module(definition["script"])
+                    count += len(html_extraction.extract_products_from_html(
+                        html, definition, module.is_valid_product, page_url=entry["url"]
+                    ))
+            return count
+
+        stats, count = measure(replay, repeat)
+        results["fixture/page_snapshots"] = dict(stats, items=count, snapshots=len(pages))
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_suite(keys=None, sizes=None, repeat=BENCH_REPEAT):
+    """
+    Runs the benchmarks.
+
+    Returns:
+        dict: Run metadata and "results": benchmark name -> {"median", "best", "runs", "items"}
+    """
+    categories = category_engine.load_categories()
+    keys = keys or list(categories)
+    sizes = sizes or BENCH_SIZES
+    results = {}
+
+    print("=" * 60)
+    print(f"Benchmark suite: {len(keys)} categories, sizes {sizes}, {repeat} runs each")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        for key in keys:
+            bench_category(key, categories[key], sizes, repeat, results, scratch_dir)
+    bench_fixtures(keys, repeat, results)
+
+    return {
+        "run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "html_parser": html_extraction.get_backend().name,
+        "sizes": sizes,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save_results(run, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(run, f, indent=2, ensure_ascii=False)
+    print(f"Results saved to {path}")
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(run, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compares a run with the baseline by median time.
+
+    Returns:
+        list: (name, baseline seconds, current seconds, change) of every regression
+    """
+    regressions = []
+    print("\n" + "=" * 60)
+    print(f"Compared with baseline {baseline.get('commit') or ''} ({baseline.get('run_at', '?')}), "
+          f"threshold {threshold:.0%}")
+    print("=" * 60)
+    print(f"  {'Benchmark':<44}{'Baseline':>10}{'Current':>10}{'Change':>9}")
+    for name, current in run["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        before, after = previous["median"], current["median"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold and after - before > REGRESSION_MIN_SECONDS:
+            regressions.append((name, before, after, change))
+            flag = "  [REGRESSION]"
+        print(f"  {name:<44}{before:>10.4f}{after:>10.4f}{change:>+9.0%}{flag}")
+
+    missing = sorted(set(baseline.get("results", {})) - set(run["results"]))
+    if missing:
+        print(f"\n  [INFO] {len(missing)} baseline benchmark(s) not in this run")
+    if regressions:
+        print(f"\n[WARNING] {len(regressions)} benchmark(s) slower than the baseline by more than {threshold:.0%}")
+    else:
+        print("\n[OK] No regressions")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extraction and filtering hot paths.")
+    parser.add_argument("categories", nargs="*", help="Category keys (or parts of keys) to benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"Cards per synthetic page (default: {BENCH_SIZES})")
+    parser.add_argument("--repeat", type=int, default=BENCH_REPEAT, help="Runs per timing")
+    parser.add_argument("--output", default=OUTPUT_RESULTS, help="Where to write this run's results")
+    parser.add_argument("--results", help="Compare an existing results file instead of running")
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also store this run as {BASELINE_FILE}")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_FILE, help="Compare with a baseline file")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Regression threshold (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.results:
+        run = load_results(args.results)
+    else:
+        keys = category_engine.select_categories(args.categories) if args.categories else None
+        if args.categories and not keys:
+            print(f"No categories match: {' '.join(args.categories)}")
+            return
+        run = run_suite(keys, args.sizes, args.repeat)
+        save_results(run, args.output)
+        if args.save_baseline:
+            save_results(run, BASELINE_FILE)
+
+    if args.compare:
+        if not os.path.exists(args.compare):
+            print(f"[ERROR] Baseline not found: {args.compare} (create it with --save-baseline)")
+            sys.exit(2)
+        if compare(run, load_results(args.compare), args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
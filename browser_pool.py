@@ -0,0 +1,197 @@
+"""
+Warm Chrome session pool shared across the category scrapers.
+
+Keeps N Chrome instances open with the delivery location already applied
+and leases them to category jobs. Sessions are health-checked on every
+lease and recycled after a configurable number of page loads, so a full
+catalog refresh pays the ChromeDriver install and browser startup cost once
+per session instead of once per category.
+
+Usage:
+    with SessionPool(size=2) as pool:
+        with pool.lease() as session:
+            session.driver.get(url)
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+import location_session
+import scraper
+
+# Configuration
+POOL_SIZE = 2  # Number of warm Chrome sessions
+PAGES_PER_SESSION = 40  # Recycle a session after this many page loads
+LEASE_TIMEOUT = 600  # Seconds to wait for a free session
+
+
+class BrowserSession:
+    """A pooled Chrome driver that counts its page loads."""
+
+    def __init__(self, driver, session_id, slot=None):
+        self.driver = driver
+        self.session_id = session_id
+        self.slot = slot
+        self.pages = 0
+        self.created_at = time.time()
+
+        # Count every navigation made through the driver
+        original_get = driver.get
+
+        def counting_get(url):
+            self.pages += 1
+            return original_get(url)
+
+        driver.get = counting_get
+
+    def is_healthy(self):
+        """Cheap liveness check: the browser must still answer a script call."""
+        try:
+            return self.driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    def close(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class _EmptySlot:
+    """Idle-queue marker for a slot whose replacement session could not be launched."""
+
+    def __init__(self, slot):
+        self.slot = slot
+
+
+class SessionPool:
+    """
+    Pool of warm Chrome sessions with the delivery location already set.
+
+    Args:
+        size (int): Number of sessions kept warm
+        pin_code (str): Delivery PIN code applied to each new session
+        max_pages (int): Page loads after which a session is recycled
+        headless (bool): Run the browsers headless
+        interactive (bool): Ask the user to set the location manually if
+            set_location_whitefield() fails
+        profile_dir (str): Give every session its own Chrome profile in
+            <profile_dir>/session_<n> (default: a fresh temporary profile)
+        driver_path (str): Already-installed ChromeDriver (skips the install in start())
+        require_location (bool): Fail instead of continuing when the location
+            cannot be set (e.g. unattended multi-location runs)
+    """
+
+    def __init__(self, size=POOL_SIZE, pin_code=scraper.WHITEFIELD_PIN,
+                 max_pages=PAGES_PER_SESSION, headless=scraper.HEADLESS_MODE,
+                 interactive=True, profile_dir=None, driver_path=None, require_location=False):
+        self.size = size
+        self.pin_code = pin_code
+        self.max_pages = max_pages
+        self.headless = headless
+        self.interactive = interactive
+        self.profile_dir = profile_dir
+        self.driver_path = driver_path
+        self.require_location = require_location
+        self.sessions_created = 0
+        self.sessions_recycled = 0
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._all_sessions = []
+
+    def start(self):
+        """Installs ChromeDriver once and launches all sessions."""
+        print("=" * 60)
+        print(f"Starting browser pool ({self.size} sessions, PIN {self.pin_code})")
+        print("=" * 60)
+        self.driver_path = self.driver_path or ChromeDriverManager().install()
+        for slot in range(1, self.size + 1):
+            self._idle.put(self._create_session(slot))
+        return self
+
+    def _create_session(self, slot=None):
+        with self._lock:
+            self.sessions_created += 1
+            session_id = self.sessions_created
+
+        print(f"\n[Pool] Launching session {session_id}...")
+        session = BrowserSession(self._launch(session_id, slot), session_id, slot)
+        with self._lock:
+            self._all_sessions.append(session)
+        print(f"[Pool] Session {session_id} ready")
+        return session
+
+    def _launch(self, session_id, slot):
+        """Starts Chrome for a new session and sets its location. Returns the driver."""
+        user_data_dir = os.path.join(self.profile_dir, f"session_{slot}") if self.profile_dir else None
+        driver = scraper.setup_driver(headless=self.headless, driver_path=self.driver_path,
+                                      user_data_dir=user_data_dir)
+        driver.get(scraper.ZEPTO_URL)
+        if not location_session.ensure_location(driver, self.pin_code,
+                                                set_location=scraper.set_location_whitefield,
+                                                interactive=self.interactive):
+            if self.require_location:
+                driver.quit()
+                raise RuntimeError(f"Session {session_id}: could not set location {self.pin_code}")
+            print(f"  [WARNING] Session {session_id}: location could not be verified")
+        return driver
+
+    def _recycle(self, session, reason):
+        print(f"\n[Pool] Recycling session {session.session_id} ({reason})")
+        session.close()
+        with self._lock:
+            if session in self._all_sessions:
+                self._all_sessions.remove(session)
+            self.sessions_recycled += 1
+        # The replacement takes over the closed session's profile directory
+        return self._create_session(session.slot)
+
+    @contextmanager
+    def lease(self):
+        """
+        Leases a healthy session for the duration of the block.
+
+        Yields:
+            BrowserSession: Session whose driver already has the location set
+        """
+        session = self._idle.get(timeout=LEASE_TIMEOUT)
+        try:
+            if isinstance(session, _EmptySlot):
+                print(f"\n[Pool] Relaunching the session of slot {session.slot}")
+                session = self._create_session(session.slot)
+            elif not session.is_healthy():
+                session = self._recycle(session, "failed health check")
+            elif session.pages >= self.max_pages:
+                session = self._recycle(session, f"served {session.pages} pages")
+        except Exception:
+            # The old session is closed; keep the slot so the next lease launches a new one
+            self._idle.put(_EmptySlot(session.slot))
+            raise
+
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
+    def close(self):
+        """Quits every session in the pool."""
+        with self._lock:
+            sessions = list(self._all_sessions)
+            self._all_sessions.clear()
+        for session in sessions:
+            session.close()
+        print(f"[Pool] Closed {len(sessions)} session(s) "
+              f"({self.sessions_created} launched, {self.sessions_recycled} recycled)")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,172 @@
+"""
+In-page product-card collector with delta polling.
+
+Instead of Python re-querying //*[contains(text(), '₹')] over the whole
+document after every scroll and again for extraction, COLLECTOR_JS
+installs a small agent in the page: a MutationObserver that records every
+product card as it renders - keyed by /pvid/ product ID - in an in-page
+buffer. Cards are recorded once they show a price, and recycled nodes of
+virtualized lists are picked up when their link changes, so cards that
+later leave the DOM are kept.
+
+Python polls with a cursor and gets only the entries added since its last
+poll, so each poll costs O(new cards) and one round-trip:
+
+    collector = card_collector.for_driver(driver)
+    collector.poll(driver)                # installs the agent on first use
+    ...scroll...
+    collector.poll(driver)                # only the new cards
+    products = collector.products(definition)
+
+Enable with category_engine.CARD_COLLECTOR = True or
+python category_engine.py --collector.
+"""
+
+import html_extraction
+
+# Configuration
+PENDING_LIMIT = 500  # Links still waiting for their price, re-checked on every DOM change
+
+# Defines `collector` (installing it if this page has none yet). The agent
+# survives between WebDriver calls until the next page load.
+COLLECTOR_JS = r"""
+var PENDING_LIMIT = %d;
+var collector = window.__cardCollector;
+var freshCollector = !collector || collector.url !== location.href;
+if (freshCollector) {
+    if (collector) { collector.observer.disconnect(); }
+    collector = window.__cardCollector = {url: location.href, ids: {}, entries: [], pending: [],
+                                          mutations: 0, lastMutation: 0};
+
+    collector.productId = function (href) {
+        if (href.indexOf('/pvid/') === -1) { return href; }
+        return href.split('/pvid/')[1].split(/[/?#]/)[0];
+    };
+    // Card of a product link: the link, or its closest ancestor showing a
+    // price that holds no other product link (else the price is a neighbour's)
+    collector.card = function (link) {
+        var card = link;
+        for (var up = 0; up < 5 && card.textContent.indexOf('₹') === -1; up++) {
+            var parent = card.parentElement;
+            if (!parent || parent.querySelectorAll("a[href*='/pn/']").length > 1) { return null; }
+            card = parent;
+        }
+        return card.textContent.indexOf('₹') === -1 ? null : card;
+    };
+    collector.add = function (link) {
+        var href = link.href;
+        if (!href || href.indexOf('/pn/') === -1) { return true; }
+        var id = collector.productId(href);
+        if (collector.ids[id]) { return true; }
+        var card = collector.card(link);
+        if (!card) { return false; }
+        collector.ids[id] = true;
+        collector.entries.push([id, card.outerHTML]);
+        return true;
+    };
+    collector.scan = function (node) {
+        if (node.nodeType !== 1) { return; }
+        var links = node.matches("a[href*='/pn/']") ? [node] : node.querySelectorAll("a[href*='/pn/']");
+        for (var i = 0; i < links.length; i++) {
+            if (!collector.add(links[i]) && collector.pending.length < PENDING_LIMIT) {
+                collector.pending.push(links[i]);
+            }
+        }
+    };
+    collector.observer = new MutationObserver(function (records) {
+        collector.mutations++;
+        collector.lastMutation = performance.now();
+        // Links still missing their price first (the price may be this batch)
+        var pending = collector.pending;
+        collector.pending = [];
+        for (var p = 0; p < pending.length; p++) {
+            if (pending[p].isConnected && !collector.add(pending[p])) { collector.pending.push(pending[p]); }
+        }
+        for (var i = 0; i < records.length; i++) {
+            var record = records[i];
+            if (record.type === 'attributes') {
+                collector.scan(record.target);  // recycled node, new product link
+            } else {
+                for (var j = 0; j < record.addedNodes.length; j++) { collector.scan(record.addedNodes[j]); }
+            }
+        }
+    });
+    collector.poll = function (cursor) {
+        return {url: collector.url, total: collector.entries.length, pending: collector.pending.length,
+                entries: collector.entries.slice(cursor)};
+    };
+    collector.scan(document.body);
+    collector.observer.observe(document.body, {childList: true, subtree: true, characterData: true,
+                                               attributes: true, attributeFilter: ['href']});
+}
+""" % PENDING_LIMIT
+
+# Returns the entries after arguments[0] (all of them for a new page)
+POLL_SCRIPT = COLLECTOR_JS + r"""
+var result = collector.poll(freshCollector ? 0 : arguments[0]);
+result.fresh = freshCollector;
+return result;
+"""
+
+
+class CardCollector:
+    """Python side of a page's collector: the poll cursor and the cards received so far."""
+
+    def __init__(self):
+        self.url = None
+        self.cursor = 0
+        self.cards = {}  # Product ID -> card HTML, in render order
+        self.pending = 0
+
+    def absorb(self, result):
+        """
+        Takes in one poll result (from POLL_SCRIPT or a script built on COLLECTOR_JS).
+
+        Returns:
+            list: (product ID, card HTML) of the cards not seen before
+        """
+        if result.get("fresh") or result["url"] != self.url:
+            self.url = result["url"]
+            self.cards = {}
+        self.cursor = result["total"]
+        self.pending = result.get("pending", 0)
+        new = []
+        for product_id, html in result["entries"]:
+            if product_id not in self.cards:
+                self.cards[product_id] = html
+                new.append((product_id, html))
+        return new
+
+    def poll(self, driver):
+        """
+        Fetches the cards rendered since the last poll, installing the agent if needed.
+
+        Returns:
+            list: (product ID, card HTML) of the new cards
+        """
+        return self.absorb(driver.execute_script(POLL_SCRIPT, self.cursor))
+
+    def products(self, definition, cards=None, backend=None):
+        """
+        Product records of collected cards (before the category filter).
+
+        Args:
+            definition (dict): Category definition from categories.json
+            cards (list): (product ID, card HTML) pairs (default: every card collected)
+            backend: html_extraction parser backend or its name
+        """
+        cards = self.cards.items() if cards is None else cards
+        # One wrapper per card keeps find_cards() from merging neighbours
+        html = "".join(f"<div>{card}</div>" for _, card in cards)
+        return html_extraction.products_from_html(html, definition, self.url or "", backend)
+
+    def __len__(self):
+        return len(self.cards)
+
+
+def for_driver(driver):
+    """The driver's CardCollector (one per browser session, reset on every new page)."""
+    collector = getattr(driver, "_card_collector", None)
+    if collector is None:
+        collector = driver._card_collector = CardCollector()
+    return collector
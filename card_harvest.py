@@ -0,0 +1,131 @@
+"""
+Harvest product cards while scrolling.
+
+scroll_page() scrolls to the bottom first and extract_products() then
+reads the whole grid, so every card must still be in the DOM at the end.
+Virtualized lists recycle the nodes of cards scrolled out of view, and
+those products are lost. Harvesting instead scrolls one viewport at a
+time; after each step HARVEST_SCRIPT returns the HTML of only the cards
+rendered since the previous step, taken from the in-page card_collector
+agent. Python parses that small batch with html_extraction and merges it
+by /pvid/ product ID, so extraction runs alongside the scroll instead of
+as one big pass after it.
+
+Enable with category_engine.SCROLL_HARVEST = True or
+python category_engine.py --harvest.
+"""
+
+import card_collector
+import html_extraction
+import run_trace
+import scraper
+from product_sink import product_key
+
+# Configuration
+HARVEST_STEP = 0.8  # Scroll this fraction of the viewport per step
+HARVEST_MAX_STEPS = 300  # Longest harvest per page
+HARVEST_STEP_SETTLE_MS = 250  # Wait after a mid-page step that renders nothing
+HARVEST_IDLE_ROUNDS = 3  # Stop after this many steps at the bottom without new cards
+HARVEST_MAX_WAIT_MS = scraper.SCROLL_MAX_WAIT_MS  # Longest wait for one step to settle
+
+# One scroll step, then the collector's entries after arguments[0] - the
+# cards rendered since the previous step, recorded by the in-page
+# card_collector agent even if they already left the DOM again.
+# Run with execute_async_script.
+HARVEST_SCRIPT = card_collector.COLLECTOR_JS + r"""
+var cursor = arguments[0], scroll = arguments[1], step = arguments[2], quietMs = arguments[3],
+    settleMs = arguments[4], bottomSettleMs = arguments[5], maxWaitMs = arguments[6];
+var done = arguments[arguments.length - 1];
+
+function atBottom() {
+    return window.innerHeight + window.scrollY >= document.body.scrollHeight - 2;
+}
+
+function finish() {
+    var result = collector.poll(freshCollector ? 0 : cursor);
+    result.fresh = freshCollector;
+    result.at_bottom = atBottom();
+    result.height = document.body.scrollHeight;
+    done(result);
+}
+
+try {
+    if (!scroll) { return finish(); }
+    var before = collector.mutations, t0 = performance.now();
+    window.scrollBy(0, Math.max(1, Math.round(window.innerHeight * step)));
+    // At the bottom the next batch comes from the network, so wait longer
+    var settle = atBottom() ? bottomSettleMs : settleMs;
+    (function wait() {
+        var now = performance.now(), changed = collector.mutations > before;
+        var settled = changed ? now - collector.lastMutation >= quietMs : now - t0 >= settle;
+        if (!settled && now - t0 < maxWaitMs) { return setTimeout(wait, 50); }
+        finish();
+    })();
+} catch (e) { done({error: String(e)}); }
+"""
+
+
+def harvest_key(product):
+    """Merge key: /pvid/ product ID, else product URL or name+price."""
+    return html_extraction.pvid(product.get("product_url")) or product_key(product)
+
+
+@run_trace.traced("harvest_page")
+def harvest_page(driver, definition, max_steps=HARVEST_MAX_STEPS, idle_rounds=HARVEST_IDLE_ROUNDS):
+    """
+    Scrolls the current page one viewport at a time, extracting new cards after each step.
+
+    Args:
+        driver: Selenium WebDriver instance on a listing page
+        definition (dict): Category definition from categories.json
+        max_steps (int): Maximum number of scroll steps
+        idle_rounds (int): Steps at the bottom without new cards before stopping
+
+    Returns:
+        list: Product dictionaries (before the category filter, without
+            scraped_at), merged by product ID, or None if the script failed
+            and the caller should fall back to scroll-then-extract
+    """
+    backend = html_extraction.get_backend()
+    collector = card_collector.for_driver(driver)
+    products = {}
+    height = 0
+    idle = 0
+    steps = 0
+    driver.set_script_timeout(HARVEST_MAX_WAIT_MS / 1000 + 10)
+
+    for step in range(max_steps + 1):
+        try:
+            result = driver.execute_async_script(
+                HARVEST_SCRIPT, collector.cursor, step > 0, HARVEST_STEP, scraper.SCROLL_QUIET_MS,
+                HARVEST_STEP_SETTLE_MS, scraper.SCROLL_SETTLE_MS, HARVEST_MAX_WAIT_MS
+            ) or {"error": "no result"}
+        except Exception as e:
+            result = {"error": str(e)}
+        if result.get("error"):
+            print(f"  [WARNING] Card harvest failed ({result['error'][:60]}), falling back to scroll loop")
+            return None
+        steps = step
+
+        added = 0
+        new_cards = collector.absorb(result)
+        if new_cards:
+            for product in collector.products(definition, new_cards, backend):
+                key = harvest_key(product)
+                if key not in products:
+                    products[key] = product
+                    added += 1
+        if added:
+            print(f"  Step {step} - harvested {added} new cards ({len(products)} total)")
+
+        grew = result["height"] > height
+        height = max(height, result["height"])
+        if result["at_bottom"] and not added and not grew:
+            idle += 1
+            if idle >= idle_rounds:
+                break
+        else:
+            idle = 0
+
+    print(f"  [OK] Harvested {len(products)} cards in {steps} scroll steps")
+    return list(products.values())
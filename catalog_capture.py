@@ -0,0 +1,289 @@
+"""
+Catalog capture - builds product records from Zepto's own JSON responses.
+
+The listing pages are filled from JSON API responses. With capture enabled
+in scraper.setup_driver(), Chrome's performance log records every network
+event; after scrolling, the JSON response bodies are fetched over the
+DevTools protocol and walked for product objects. Prices, MRP, discount,
+pack size and IDs then come straight from the API instead of from regexes
+over rendered text, and no DOM walk is needed.
+
+Recorded responses can be saved as a fixture and parsed offline:
+    python catalog_capture.py fixtures/zepto_catalog_responses.json
+"""
+
+import json
+import re
+import sys
+from datetime import datetime
+
+# Configuration
+CAPTURE_URL_HINTS = ["zepto"]  # Only responses whose URL contains one of these are read
+IMAGE_BASE_URL = "https://cdn.zeptonow.com/production/"
+PRODUCT_BASE_URL = "https://www.zepto.com/pn"
+PRICE_IN_PAISE = True  # The API sends prices as integer paise (3600 = ₹36)
+FIXTURE_PATH = "fixtures/zepto_catalog_responses.json"
+
+# Field names seen in the catalog payloads, most specific first
+NAME_KEYS = ["name", "productName", "displayName", "title"]
+PRICE_KEYS = ["discountedSellingPrice", "sellingPrice", "offerPrice", "price"]
+MRP_KEYS = ["mrp", "maxRetailPrice", "originalPrice"]
+DISCOUNT_PERCENT_KEYS = ["discountPercent", "discountPercentage"]
+PACK_SIZE_KEYS = ["formattedPacksize", "packsize", "packSize", "weight", "unitQuantity"]
+IMAGE_KEYS = ["images", "image", "imageUrl", "thumbnail"]
+NESTED_KEYS = ["product", "productVariant", "variant"]
+
+
+def enable_capture(chrome_options):
+    """Turns on Chrome's performance log (network events) for a new driver."""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def _read_log(driver):
+    """Returns the DevTools messages logged since the last read, or None if capture is off."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+
+    messages = []
+    for entry in entries:
+        try:
+            messages.append(json.loads(entry["message"])["message"])
+        except (KeyError, ValueError):
+            continue
+    return messages
+
+
+def discard(driver):
+    """Drops buffered network events, e.g. before navigating to the next page."""
+    _read_log(driver)
+
+
+def capture_responses(driver):
+    """
+    Fetches the JSON catalog responses received since the last call.
+
+    Args:
+        driver: Chrome driver created with capture enabled
+
+    Returns:
+        list: {"url": ..., "body": parsed JSON} per response, or None if the
+            driver has no performance log
+    """
+    messages = _read_log(driver)
+    if messages is None:
+        return None
+
+    candidates = {}
+    finished = set()
+    for message in messages:
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.responseReceived":
+            response = params.get("response", {})
+            url = response.get("url", "")
+            if "json" in (response.get("mimeType") or "") and any(
+                hint in url for hint in CAPTURE_URL_HINTS
+            ):
+                candidates[params.get("requestId")] = url
+        elif method == "Network.loadingFinished":
+            finished.add(params.get("requestId"))
+
+    responses = []
+    for request_id, url in candidates.items():
+        if request_id not in finished:
+            continue
+        try:
+            result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            responses.append({"url": url, "body": json.loads(result.get("body") or "null")})
+        except Exception:
+            # Body already evicted (page navigated away) or not JSON
+            continue
+    return responses
+
+
+def _first(sources, keys):
+    """First non-empty value of any key, looking through the sources in order."""
+    for source in sources:
+        for key in keys:
+            value = source.get(key)
+            if value not in (None, "", [], {}):
+                return value
+    return None
+
+
+def _to_rupees(value):
+    if isinstance(value, str):
+        match = re.search(r"\d+(?:\.\d+)?", value.replace(",", ""))
+        if not match:
+            return None
+        return float(match.group(0))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value / 100 if PRICE_IN_PAISE and isinstance(value, int) else float(value)
+    return None
+
+
+def _format_amount(amount):
+    if amount is None:
+        return "N/A"
+    return str(int(amount)) if float(amount).is_integer() else f"{amount:.2f}"
+
+
+def _image_url(value):
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("path") or value.get("url") or value.get("src")
+    if not isinstance(value, str) or not value:
+        return "N/A"
+    return value if value.startswith("http") else IMAGE_BASE_URL + value.lstrip("/")
+
+
+def _slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def build_record(node):
+    """
+    Builds a product record from one product object of a catalog payload.
+
+    The record has the usual extraction fields (name, price, discount,
+    quantity, image_url, product_url) plus original_price, discount_amount,
+    discount_percent, product_id and variant_id.
+
+    Returns:
+        dict: Product record, or None if the object has no name or price
+    """
+    nested = [node[key] for key in NESTED_KEYS if isinstance(node.get(key), dict)]
+    sources = [node] + nested
+    # Names live on the product object; the outer node's "name" can be a widget title
+    name = _first(nested + [node], NAME_KEYS)
+    price = _to_rupees(_first(sources, PRICE_KEYS))
+    if not isinstance(name, str) or price is None:
+        return None
+
+    mrp = _to_rupees(_first(sources, MRP_KEYS))
+    discount_amount = mrp - price if mrp is not None and mrp > price else None
+    discount_percent = _first(sources, DISCOUNT_PERCENT_KEYS)
+    if discount_percent is None and discount_amount:
+        discount_percent = round(discount_amount * 100 / mrp)
+
+    product = node.get("product") if isinstance(node.get("product"), dict) else {}
+    variant = node.get("productVariant") or node.get("variant") or {}
+    if not isinstance(variant, dict):
+        variant = {}
+    product_id = product.get("id") or node.get("productId") or "N/A"
+    variant_id = variant.get("id") or node.get("productVariantId") or node.get("variantId") or "N/A"
+
+    quantity = _first([variant] + sources, PACK_SIZE_KEYS)
+    product_url = (
+        f"{PRODUCT_BASE_URL}/{_slug(name)}/pvid/{variant_id}" if variant_id != "N/A" else "N/A"
+    )
+
+    return {
+        "name": name.strip(),
+        "price": _format_amount(price),
+        "original_price": _format_amount(mrp) if discount_amount else "N/A",
+        "discount": f"₹{_format_amount(discount_amount)}" if discount_amount else "N/A",
+        "discount_amount": _format_amount(discount_amount) if discount_amount else "N/A",
+        "discount_percent": f"{discount_percent}%" if discount_percent else "N/A",
+        "quantity": str(quantity) if quantity is not None else "N/A",
+        "image_url": _image_url(_first([variant] + sources, IMAGE_KEYS)),
+        "product_url": product_url,
+        "product_id": str(product_id),
+        "variant_id": str(variant_id),
+    }
+
+
+def products_from_payload(payload):
+    """
+    Walks any JSON payload and returns a record for every product object in it.
+
+    A product object is a dict with a name and a price, either directly or
+    through its "product"/"productVariant" children. Unknown wrappers
+    (layouts, widgets, pagination) are walked through, so the parser does
+    not depend on the exact response shape.
+    """
+    records = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            record = build_record(node)
+            if record:
+                records.append(record)
+                continue
+            stack.extend(reversed(list(node.values())))
+    return records
+
+
+def products_from_responses(responses):
+    """Product records from captured responses, de-duplicated by variant ID (or name+price)."""
+    products = []
+    seen = set()
+    scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for response in responses:
+        for record in products_from_payload(response.get("body")):
+            key = record["variant_id"] if record["variant_id"] != "N/A" else f"{record['name']}|{record['price']}"
+            if key in seen:
+                continue
+            seen.add(key)
+            record["scraped_at"] = scraped_at
+            products.append(record)
+    return products
+
+
+def collect_products(driver):
+    """
+    Product records from the catalog responses received since the last call.
+
+    Returns:
+        list: Product records, or None if the driver was not started with
+            capture enabled (callers fall back to DOM extraction)
+    """
+    responses = capture_responses(driver)
+    if responses is None:
+        return None
+    products = products_from_responses(responses)
+    print(f"  [OK] Captured {len(responses)} catalog responses, {len(products)} products")
+    return products
+
+
+def save_fixture(responses, path=FIXTURE_PATH):
+    """Saves captured responses so the parser can be re-run offline."""
+    import os
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"responses": responses}, f, indent=2, ensure_ascii=False)
+    print(f"Saved {len(responses)} responses to {path}")
+
+
+def load_fixture(path=FIXTURE_PATH):
+    """Loads recorded responses saved by save_fixture()."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["responses"]
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else FIXTURE_PATH
+    responses = load_fixture(path)
+    products = products_from_responses(responses)
+
+    print("=" * 60)
+    print(f"Catalog capture - {len(responses)} responses from {path}")
+    print("=" * 60)
+    for idx, product in enumerate(products, 1):
+        print(
+            f"  [{idx}] {product['name'][:40]:<40} | ₹{product['price']:<6} "
+            f"| MRP {product['original_price']:<6} | {product['quantity']:<10} | {product['variant_id']}"
+        )
+    print(f"\nTotal: {len(products)} products")
+
+
+if __name__ == "__main__":
+    main()
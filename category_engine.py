@@ -0,0 +1,971 @@
+"""
+Zepto Category Engine
+Runs any subset of the category scrapers in one process, on one warm
+browser session with the location set once.
+
+Per-category settings (URL, output paths, page hints, scroll settings and
+the product/subcategory keyword lists) live in categories.json. Each
+scrape_*.py keeps only its category-specific logic: is_valid_product(),
+find_subcategories() and print_breakdown().
+
+Usage:
+    python category_engine.py                   # all categories
+    python category_engine.py munchies frozen   # categories matching these keys
+    python category_engine.py --workers 3       # crawl subcategories in parallel
+    python category_engine.py --http            # browser sets location, pages fetched over HTTP
+    python category_engine.py --profile lean    # block images, fonts and trackers
+    python category_engine.py frozen --resume   # continue an interrupted crawl
+    python category_engine.py --incremental     # skip subcategories that did not change
+    python category_engine.py --record-snapshots  # save page HTML for page_snapshots.py replay
+    python category_engine.py --extraction html   # parse one outerHTML dump per page (lxml)
+    python category_engine.py --count-commands    # WebDriver commands per phase, caller and page
+    python category_engine.py --harvest           # extract cards while scrolling (virtualized lists)
+    python category_engine.py --collector         # in-page card collector, polled for new cards
+    python category_engine.py --no-store          # dedup in memory, skip the SQLite product store
+    python category_engine.py --no-history        # skip the Parquet price history
+    python category_engine.py --no-parquet        # CSV/JSON only, no typed .parquet files
+    python category_engine.py --list            # show configured categories
+"""
+
+from selenium.webdriver.common.by import By
+import argparse
+import functools
+import importlib
+import json
+import os
+import time
+from datetime import datetime
+
+import card_collector
+import card_harvest
+import catalog_capture
+import driver_accounting
+import html_extraction
+import http_fetcher
+import page_snapshots
+import parquet_output
+import price_history
+import product_identity
+import run_trace
+import scraper
+from browser_pool import SessionPool
+from crawl_fingerprints import FingerprintStore, page_fingerprint
+from crawl_journal import CrawlJournal
+from product_sink import ProductSink
+from product_store import ProductStore
+from parallel_crawl import crawl_subcategories
+
+# Configuration
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "categories.json")
+LOCATION_OUTPUT_DIR = "output/locations"  # Per-PIN outputs of run_categories(pin_code=...)
+PARQUET_OUTPUT = True  # True = also write typed Parquet next to each CSV (needs pyarrow)
+PRICE_HISTORY = True  # True = append each category's products to the Parquet price history (needs pyarrow)
+PRODUCT_STORE = True  # True = dedup and persist products in SQLite (product_store.py) instead of in memory
+CARD_COLLECTOR = False  # True = in-page MutationObserver records cards as they render; Python polls only new ones
+SCROLL_HARVEST = False  # True = extract new cards after every scroll step (card_harvest), for virtualized lists
+EXTRACTION_BACKEND = "live"  # "live" = per-element WebDriver calls, "html" = one outerHTML dump parsed by html_extraction
+CSV_FIELDNAMES = [
+    "name",
+    "price",
+    "discount",
+    "quantity",
+    "image_url",
+    "product_url",
+    "scraped_at",
+]
+KEYWORD_FIELDS = [
+    "valid_keywords",
+    "invalid_keywords",
+    "subcategory_keywords",
+    "excluded_subcategory_keywords",
+]
+
+
+def _flatten_keywords(value):
+    """Keyword lists may be grouped ({"Chips & Crisps": [...]}) for readability."""
+    if isinstance(value, dict):
+        return [kw for group in value.values() for kw in group]
+    return list(value or [])
+
+
+def load_categories(path=CATEGORIES_FILE):
+    """Load all category definitions, keyed by category key (file order)."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    categories = {}
+    for definition in data["categories"]:
+        for field in KEYWORD_FIELDS:
+            definition[field] = _flatten_keywords(definition.get(field))
+        categories[definition["key"]] = definition
+    return categories
+
+
+def load_category(key, path=CATEGORIES_FILE):
+    """Load a single category definition."""
+    categories = load_categories(path)
+    if key not in categories:
+        raise KeyError(f"Unknown category '{key}'. Known: {', '.join(categories)}")
+    return categories[key]
+
+
+@run_trace.traced("scroll_page")
+def scroll_page(driver, times=30, max_no_change=5, pause=3, mode=None):
+    """Scroll page to load products - stops when no new products found."""
+    print("Scrolling to load products...")
+    if (mode or scraper.SCROLL_MODE) == "async" and scraper.scroll_page_async(driver, max_scrolls=times):
+        return
+
+    last_count = 0
+    no_change_count = 0
+
+    for i in range(times):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        run_trace.sleep(pause)  # Wait for lazy loading
+
+        try:
+            if CARD_COLLECTOR:
+                # Only the cards rendered since the last poll cross the wire
+                collector = card_collector.for_driver(driver)
+                collector.poll(driver)
+                current_count = len(collector)
+            else:
+                current_count = len(
+                    driver.find_elements(By.XPATH, "//*[contains(text(), '₹')]")
+                )
+            if current_count > last_count:
+                print(
+                    f"  Scroll {i+1}/{times} - Found {current_count} {'cards' if CARD_COLLECTOR else 'price elements'}"
+                    f" (+{current_count - last_count} new)"
+                )
+                last_count = current_count
+                no_change_count = 0
+            else:
+                no_change_count += 1
+                print(
+                    f"  Scroll {i+1}/{times} - No new products ({current_count} total)"
+                )
+                if no_change_count >= max_no_change:
+                    print(
+                        f"  No new products for {max_no_change} scrolls. Assuming all products loaded."
+                    )
+                    break
+        except Exception:
+            print(f"  Scroll {i+1}/{times}")
+            no_change_count += 1
+
+    print(f"\n  Final count: {last_count} {'cards' if CARD_COLLECTOR else 'price elements'} found")
+    driver.execute_script("window.scrollTo(0, 0);")
+    run_trace.sleep(2)
+
+
+def scroll_category_page(driver, definition, times=None):
+    """
+    scroll_page() with the category's scroll settings.
+
+    With SCROLL_HARVEST the cards are extracted during the scroll instead
+    and returned (see scroll_and_extract()). With CARD_COLLECTOR the
+    in-page collector is installed before the scroll, so it records every
+    card that renders while scrolling.
+
+    Returns:
+        list: Harvested product records (before the category filter), or
+            None when the page was only scrolled
+    """
+    if SCROLL_HARVEST:
+        print("Scrolling and harvesting products...")
+        harvested = card_harvest.harvest_page(driver, definition)
+        if harvested is not None:
+            return harvested
+    if CARD_COLLECTOR:
+        try:
+            card_collector.for_driver(driver).poll(driver)
+        except Exception as e:
+            print(f"  [WARNING] Could not install the card collector: {str(e)[:60]}")
+    scroll_page(
+        driver,
+        times=times or definition["scroll_times"],
+        max_no_change=definition["scroll_idle_limit"],
+        pause=definition["scroll_pause"],
+    )
+    return None
+
+
+def save_page_snapshot(driver, definition):
+    """Saves the current page's grid HTML when RECORD_SNAPSHOTS is on."""
+    if page_snapshots.RECORD_SNAPSHOTS:
+        try:
+            page_snapshots.save_snapshot(driver, definition["key"])
+        except Exception as e:
+            print(f"  [WARNING] Could not save page snapshot: {e}")
+
+
+def scroll_and_extract(driver, definition, module):
+    """
+    Scrolls the current page and returns its products for the category.
+
+    Args:
+        driver: Selenium WebDriver instance on the page
+        definition (dict): Category definition from categories.json
+        module: The category script (extract_products, is_valid_product)
+
+    Returns:
+        list: Product dictionaries that passed the category filter
+    """
+    harvested = scroll_category_page(driver, definition)
+    if harvested is None:
+        return module.extract_products(driver)
+    # Harvest mode skips extract_products(), which records the snapshots otherwise
+    save_page_snapshot(driver, definition)
+    products = []
+    scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for product in harvested:
+        if module.is_valid_product(product):
+            product["scraped_at"] = scraped_at
+            products.append(product)
+    print(f"  {len(products)} of {len(harvested)} harvested products belong to {definition['name']}")
+    return products
+
+
+def _find_name_element(container):
+    """Product name from the first matching name element of a live card."""
+    for selector in html_extraction.NAME_SELECTORS:
+        try:
+            name_elem = container.find_element(By.CSS_SELECTOR, selector)
+            name_text = (name_elem.text or "").strip()
+            if html_extraction.is_name_text(name_text):
+                return name_text
+        except Exception:
+            continue
+    return None
+
+
+def _read_card(container, heading_terms):
+    """Product record of one live card element (None if it has no usable name)."""
+    container_text = (container.text or "").strip()
+
+    href = None
+    try:
+        href = container.get_attribute("href")
+        if not href:
+            try:
+                a_tag = container.find_element(By.TAG_NAME, "a")
+                href = a_tag.get_attribute("href") or ""
+            except Exception:
+                try:
+                    a_tag = container.find_element(
+                        By.XPATH, ".//a[@href]"
+                    )
+                    href = a_tag.get_attribute("href") or ""
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+    try:
+        img = container.find_element(By.TAG_NAME, "img")
+        image_url = img.get_attribute("src") or img.get_attribute("data-src")
+    except Exception:
+        image_url = None
+
+    return html_extraction.card_product(
+        container_text,
+        href,
+        image_url,
+        heading_terms,
+        find_name=functools.partial(_find_name_element, container),
+    )
+
+
+@run_trace.traced("extract_products")
+def extract_products(driver, definition, is_valid_product):
+    """
+    Extract products from current page - SIMPLE AND RELIABLE.
+
+    Args:
+        driver: Selenium WebDriver instance
+        definition (dict): Category definition from categories.json
+        is_valid_product: The category's product filter
+
+    Returns:
+        list: Product dictionaries that passed is_valid_product()
+    """
+    print("\nExtracting products...")
+    products = []
+    save_page_snapshot(driver, definition)
+
+    if scraper.CAPTURE_MODE:
+        captured = catalog_capture.collect_products(driver)
+        if captured:
+            scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            for product in captured:
+                if is_valid_product(product):
+                    product["scraped_at"] = scraped_at
+                    products.append(product)
+            print(f"  {len(products)} of {len(captured)} captured products belong to {definition['name']}")
+            return products
+
+    if CARD_COLLECTOR:
+        collector = card_collector.for_driver(driver)
+        try:
+            collector.poll(driver)
+        except Exception as e:
+            print(f"  [WARNING] Card collector poll failed: {str(e)[:60]}")
+        if len(collector) and collector.url == driver.current_url:
+            scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            collected, unknown = [], []
+            for product_id, card in collector.cards.items():
+                known = product_identity.REGISTRY.get(product_id)
+                if known is not None:
+                    collected.append(known)
+                else:
+                    unknown.append((product_id, card))
+            reused = len(collected)
+            for product in collector.products(definition, unknown):
+                product_identity.REGISTRY.remember(html_extraction.pvid(product["product_url"]), product)
+                collected.append(product)
+            if reused:
+                print(f"  [OK] Reused {reused} card(s) already extracted in this run")
+            for product in collected:
+                if is_valid_product(product):
+                    product["scraped_at"] = scraped_at
+                    products.append(product)
+            print(f"  {len(products)} of {len(collected)} collected products belong to {definition['name']}")
+            return products
+
+    banner_terms = definition.get("banner_terms") or ["explore", "banner", "up to"]
+    heading_terms = definition.get("heading_terms") or []
+
+    current_url = driver.current_url
+    print(f"  Current URL: {current_url[:80]}...")
+
+    page_hints = definition.get("page_hints") or []
+    if page_hints and not any(hint in current_url.lower() for hint in page_hints):
+        print(f"  [WARNING] Might not be on {definition['name']} page!")
+
+    print("  Finding products by looking for price (₹)...")
+    try:
+        if not scraper.wait_for_product_grid(driver, timeout=10):
+            print("  [WARNING] No price elements found yet, continuing anyway...")
+
+        if EXTRACTION_BACKEND == "html":
+            backend = html_extraction.get_backend()
+            start = time.perf_counter()
+            html = page_snapshots.grid_html(driver)
+            products = html_extraction.extract_products_from_html(
+                html, definition, is_valid_product, page_url=current_url, verbose=True, backend=backend
+            )
+            print(f"  [OK] Parsed {len(html) / 1024:.0f} KB of grid HTML with {backend.name} "
+                  f"in {time.perf_counter() - start:.2f}s")
+            return products
+
+        price_elements = driver.find_elements(
+            By.XPATH, "//*[contains(text(), '₹')]"
+        )
+        print(f"  Found {len(price_elements)} elements with ₹ symbol")
+
+        if len(price_elements) == 0:
+            print("  [ERROR] No price elements found!")
+            print("  Trying to refresh and wait longer...")
+            driver.refresh()
+            scraper.wait_for_product_grid(driver)
+            price_elements = driver.find_elements(
+                By.XPATH, "//*[contains(text(), '₹')]"
+            )
+            print(f"  After refresh: Found {len(price_elements)} elements with ₹")
+
+        if len(price_elements) == 0:
+            print("\n[ERROR] No products found on page!")
+            return products
+
+        product_containers = {}
+
+        for price_elem in price_elements:
+            try:
+                try:
+                    container = price_elem.find_element(
+                        By.XPATH, "./ancestor::a[1]"
+                    )
+                except Exception:
+                    try:
+                        container = price_elem.find_element(
+                            By.XPATH, "./ancestor::div[position()<=5][1]"
+                        )
+                    except Exception:
+                        container = price_elem
+
+                href = None
+                try:
+                    href = container.get_attribute("href")
+                    if not href:
+                        try:
+                            a_tag = container.find_element(
+                                By.XPATH, ".//a[@href]"
+                            )
+                            href = a_tag.get_attribute("href") or ""
+                        except Exception:
+                            pass
+                except Exception:
+                    pass
+
+                container_text = (container.text or "").strip()[:100]
+
+                if html_extraction.is_card_text(container_text, banner_terms):
+                    key = html_extraction.card_key(href, container_text)
+                    if key not in product_containers:
+                        product_containers[key] = container
+            except Exception:
+                continue
+
+        product_list = list(product_containers.items())
+        print(f"  Found {len(product_list)} unique product containers")
+
+        if len(product_list) == 0:
+            print("\n[ERROR] Could not extract product containers!")
+            return products
+
+        print(f"\n  Extracting data from {len(product_list)} products...")
+        reused = 0
+        for key, container in product_list:
+            try:
+                # Card already read on an earlier page of this run (any category)
+                product = product_identity.REGISTRY.get(key)
+                if product is not None:
+                    reused += 1
+                else:
+                    product = _read_card(container, heading_terms)
+                    if product:
+                        product_identity.REGISTRY.remember(html_extraction.pvid(product["product_url"]), product)
+                if product and is_valid_product(product):
+                    product["scraped_at"] = datetime.now().strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    )
+                    products.append(product)
+                    price_display = (
+                        f"₹{product['price']}"
+                        if product["price"] != "N/A"
+                        else "N/A"
+                    )
+                    print(
+                        f"  [{len(products)}] {product['name'][:50]:<50} | {price_display}"
+                    )
+            except Exception:
+                continue
+
+        if reused:
+            print(f"  [OK] Reused {reused} card(s) already extracted in this run")
+
+    except Exception as e:
+        print(f"  [ERROR] {str(e)}")
+        import traceback
+
+        traceback.print_exc()
+
+    return products
+
+
+def save_data(products, output_csv, output_json):
+    """Save products to CSV and JSON."""
+    if not products:
+        print("No products to save!")
+        return
+
+    with ProductSink(output_csv, output_json, fieldnames=CSV_FIELDNAMES) as sink:
+        sink.extend(products)
+    if PARQUET_OUTPUT:
+        parquet_output.write_products(products, parquet_output.parquet_path(output_csv))
+
+
+def add_unique_products(products, all_products, subcategory=None):
+    """
+    Add products that have a URL to the sink, which drops the ones already seen.
+
+    Returns:
+        int: The number added
+    """
+    return all_products.extend([product for product in products if product.get("product_url")],
+                               subcategory=subcategory)
+
+
+def make_page_crawler(definition, module, fingerprints=None):
+    """
+    Returns crawl_page(driver, url) -> products for one subcategory page.
+
+    The page is opened, fingerprinted and - unless `fingerprints` says it is
+    unchanged since the last run, in which case the previous products are
+    carried forward - scrolled and extracted.
+    """
+
+    def crawl_page(driver, url):
+        with run_trace.span("subcategory", url=url):
+            return _crawl_page(driver, url)
+
+    def _crawl_page(driver, url):
+        catalog_capture.discard(driver)
+        ready = scraper.navigate_and_wait(driver, url)
+
+        fingerprint = page_fingerprint(driver) if fingerprints is not None else None
+        if fingerprints is not None and fingerprints.unchanged(url, fingerprint):
+            products = fingerprints.carry_forward(url)
+            print(f"    [SKIP] Unchanged since last run, carried forward {len(products)} products")
+            return products
+
+        if not ready:
+            if definition.get("skip_empty_subcategories", True):
+                print("    [WARNING] No products found, skipping...")
+                return []
+            print("    [INFO] No price elements found initially, will scroll and try again...")
+
+        products = scroll_and_extract(driver, definition, module)
+        if fingerprints is not None:
+            fingerprints.update(url, fingerprint, products)
+        return products
+
+    return crawl_page
+
+
+def crawl_subcategories_sequential(driver, subcategory_urls, subcategory_names,
+                                   all_products, crawl_page, on_done=None):
+    """Visit the subcategories one at a time on a single browser."""
+    for idx, (sub_url, sub_name) in enumerate(
+        zip(subcategory_urls, subcategory_names), 1
+    ):
+        try:
+            print(
+                f"\n  [{idx}/{len(subcategory_urls)}] Extracting from: {sub_name[:50]}"
+            )
+            sub_products = crawl_page(driver, sub_url)
+
+            added_count = add_unique_products(sub_products, all_products, sub_name)
+            if on_done:
+                on_done(sub_url, added_count)
+            if added_count == 0:
+                print(
+                    f"    No new products found in this subcategory (total: {len(all_products)})"
+                )
+            else:
+                print(
+                    f"    Extracted {added_count} new products (total: {len(all_products)})"
+                )
+        except Exception as e:
+            print(f"    [ERROR] Failed to extract from {sub_name}: {str(e)}")
+            continue
+
+
+def open_sink(definition, resume=False, store=None):
+    """Streaming sink for a category's output files (deduplicated through `store` if given)."""
+    if definition.get("pin_code"):
+        return ProductSink(definition["output_csv"], definition["output_json"],
+                           fieldnames=CSV_FIELDNAMES + ["pin_code"], resume=resume,
+                           tags={"pin_code": definition["pin_code"]}, store=store,
+                           category=definition["key"])
+    return ProductSink(definition["output_csv"], definition["output_json"],
+                       fieldnames=CSV_FIELDNAMES, resume=resume, store=store,
+                       category=definition["key"])
+
+
+def localize_definition(definition, pin_code, output_dir=LOCATION_OUTPUT_DIR):
+    """
+    Copy of a category definition for one delivery location.
+
+    Outputs go to <output_dir>/<pin_code>/ and every product is tagged
+    with the PIN code.
+    """
+    location_dir = os.path.join(output_dir, pin_code)
+    return dict(
+        definition,
+        pin_code=pin_code,
+        output_csv=os.path.join(location_dir, os.path.basename(definition["output_csv"])),
+        output_json=os.path.join(location_dir, os.path.basename(definition["output_json"])),
+    )
+
+
+def crawl_category(definition, driver=None, pool=None, workers=1, sink=None, journal=None,
+                   fingerprints=None):
+    """
+    Crawl one category: main page, then every subcategory.
+
+    Either a ready `driver` or a `pool` (browser_pool.SessionPool) must be
+    given; with a pool and workers > 1 the subcategories are crawled in
+    parallel on the pool's sessions (with only a driver, one by one).
+    Products are streamed to `sink` as each page is extracted. With a `journal` (crawl_journal.CrawlJournal)
+    every finished page is recorded, and pages an earlier run finished are
+    skipped - including the category page once the subcategories are known.
+    With `fingerprints` (crawl_fingerprints.FingerprintStore) unchanged
+    subcategories are carried forward instead of re-crawled.
+
+    Returns:
+        ProductSink: The sink holding the category's unique products
+    """
+    module = importlib.import_module(definition["script"])
+    all_products = sink if sink is not None else open_sink(definition)
+    crawl_page = make_page_crawler(definition, module, fingerprints)
+
+    def page_done(url, added_count):
+        # Products must be on disk before the journal says the page is done
+        all_products.flush()
+        if journal is not None:
+            journal.mark_done(url, added_count)
+
+    print("\n" + "=" * 60)
+    print(f"Zepto Scraper - {definition['name']} Category")
+    print("=" * 60)
+
+    @run_trace.traced("category_page")
+    def crawl_main_page(page_driver):
+        print(f"\n[1/3] Navigating to {definition['name']} category...")
+        catalog_capture.discard(page_driver)
+        main_page_ready = scraper.navigate_and_wait(page_driver, definition["url"])
+
+        print("\n[2/3] Finding subcategories...")
+        with run_trace.span("find_subcategories"):
+            subcategory_urls, subcategory_names = module.find_subcategories(page_driver)
+
+        print("\n  Extracting from main category page...")
+        fingerprint = page_fingerprint(page_driver) if fingerprints is not None else None
+        if fingerprints is not None and fingerprints.unchanged(definition["url"], fingerprint):
+            main_products = fingerprints.carry_forward(definition["url"])
+            add_unique_products(main_products, all_products)
+            print(f"  [SKIP] Main page unchanged since last run, carried forward {len(main_products)} products")
+        elif main_page_ready:
+            main_products = scroll_and_extract(page_driver, definition, module)
+            add_unique_products(main_products, all_products)
+            if fingerprints is not None:
+                fingerprints.update(definition["url"], fingerprint, main_products)
+            print(f"  Extracted {len(main_products)} products from main page")
+        else:
+            print("  [WARNING] Could not extract from main page, continuing with subcategories...")
+
+        if not subcategory_urls:
+            print("  [INFO] No subcategories found. Extracting from main page only...")
+            if not all_products:
+                add_unique_products(scroll_and_extract(page_driver, definition, module), all_products)
+        if journal is not None:
+            journal.record_subcategories(subcategory_urls, subcategory_names)
+        page_done(definition["url"], len(all_products))
+        return subcategory_urls, subcategory_names
+
+    def crawl_pending_sequential(page_driver):
+        print(f"\n  Found {len(subcategory_urls)} subcategories. Extracting from each...")
+        crawl_subcategories_sequential(
+            page_driver, subcategory_urls, subcategory_names,
+            all_products, crawl_page, on_done=page_done,
+        )
+
+    if journal is not None and journal.has_subcategories:
+        print(f"\n[1/3] Skipping {definition['name']} category page (done in an earlier run)")
+        subcategory_urls, subcategory_names = journal.pending(
+            journal.subcategory_urls, journal.subcategory_names
+        )
+        print(f"  {len(subcategory_urls)} of {len(journal.subcategory_urls)} subcategories left")
+    elif pool is not None:
+        with pool.lease() as session:
+            subcategory_urls, subcategory_names = crawl_main_page(session.driver)
+    else:
+        subcategory_urls, subcategory_names = crawl_main_page(driver)
+
+    if subcategory_urls and workers > 1 and pool is None:
+        # Parallel workers lease sessions from a pool; a single driver crawls one page at a time
+        print(f"  [WARNING] {workers} workers need a session pool, crawling subcategories on the given driver")
+        workers = 1
+
+    if subcategory_urls and workers <= 1:
+        if pool is not None:
+            with pool.lease() as session:
+                crawl_pending_sequential(session.driver)
+        else:
+            crawl_pending_sequential(driver)
+
+    if subcategory_urls and workers > 1:
+        crawl_subcategories(
+            pool, subcategory_urls, subcategory_names,
+            functools.partial(scroll_page, max_no_change=definition["scroll_idle_limit"],
+                              pause=definition["scroll_pause"]),
+            module.extract_products, all_products,
+            workers=workers, scroll_times=definition["scroll_times"], on_done=page_done,
+            crawl_page=crawl_page,
+        )
+
+    return all_products
+
+
+def store_subcategories(definition, sink):
+    """Product ID -> subcategory name of the category's products, from the sink's store."""
+    if sink.store is None:
+        return {}
+    rows = sink.store.query(category=definition["key"], pin_code=definition.get("pin_code", ""))
+    return {row["product_id"]: row["subcategory"] for row in rows}
+
+
+def save_parquet(definition, sink, subcategories):
+    """Writes the sink's products as typed Parquet next to the category's CSV."""
+    try:
+        parquet_output.write_products(sink.iter_products(), parquet_output.parquet_path(definition["output_csv"]),
+                                      category=definition["key"], subcategories=subcategories,
+                                      pin_code=definition.get("pin_code", ""))
+    except Exception as e:
+        print(f"  [WARNING] Could not write the Parquet output: {e}")
+
+
+def save_history(definition, sink, subcategories):
+    """Appends the sink's products to the price history."""
+    try:
+        price_history.append(sink.iter_products(), definition["key"], run_id=sink.run_id,
+                             pin_code=definition.get("pin_code", ""), subcategories=subcategories)
+    except Exception as e:
+        print(f"  [WARNING] Could not append to the price history: {e}")
+
+
+@run_trace.traced("save_data")
+def finish_category(definition, sink, current_url=""):
+    """Finish a category's output files and print its summary."""
+    module = importlib.import_module(definition["script"])
+
+    print("\n[3/3] Saving all products...")
+    sink.close()
+    if len(sink):
+        subcategories = store_subcategories(definition, sink) if PARQUET_OUTPUT or PRICE_HISTORY else {}
+        if PARQUET_OUTPUT:
+            save_parquet(definition, sink, subcategories)
+        print("\n" + "=" * 60)
+        print(f"[SUCCESS] Extracted {len(sink)} total products!")
+        print("=" * 60)
+        module.print_breakdown(sink.read_products())
+        if PRICE_HISTORY:
+            save_history(definition, sink, subcategories)
+    else:
+        print("\n[ERROR] No products found!")
+        print("Make sure:")
+        print("  1. Location is set correctly (560067)")
+        print(f"  2. You're on the {definition['name']} page")
+        print("  3. Products are visible in the browser")
+        print(f"  4. Current URL: {current_url}")
+
+
+def write_run_catalog(store, run_started, pin_code=None):
+    """Writes the master catalog of the products seen since run_started (per PIN under LOCATION_OUTPUT_DIR)."""
+    paths = [product_identity.MASTER_CSV, product_identity.MASTER_JSON,
+             product_identity.MASTER_PARQUET if PARQUET_OUTPUT else None]
+    if pin_code:
+        output_dir = os.path.join(LOCATION_OUTPUT_DIR, pin_code)
+        paths = [path and os.path.join(output_dir, os.path.basename(path)) for path in paths]
+    output_csv, output_json, output_parquet = paths
+    try:
+        product_identity.write_master_catalog(store, since=run_started, pin_code=pin_code or "",
+                                              output_csv=output_csv, output_json=output_json,
+                                              output_parquet=output_parquet)
+    except Exception as e:
+        print(f"[WARNING] Could not write the master catalog: {str(e)[:80]}")
+
+
+def run_categories(keys=None, driver=None, workers=1, resume=False, incremental=False,
+                   pool=None, pin_code=None):
+    """
+    Run several categories in one process.
+
+    Args:
+        keys (list): Category keys to run (default: all, in categories.json order)
+        driver: Optional ready driver with the location already set. When
+            omitted, one warm session pool is started and shared by all
+            categories, so Chrome and the location step run only once.
+        workers (int): Parallel browser workers for subcategories (pool only)
+        resume (bool): Continue interrupted crawls from their journals
+        incremental (bool): Carry forward subcategories whose fingerprint did not change
+        pool (SessionPool): Optional started pool to use instead of starting one
+        pin_code (str): Location of the driver/pool; outputs go to
+            LOCATION_OUTPUT_DIR/<pin_code>/ with every product tagged
+
+    Returns:
+        dict: Category key -> number of products saved
+    """
+    categories = load_categories()
+    keys = keys or list(categories)
+    if pin_code:
+        categories = {key: localize_definition(categories[key], pin_code) for key in keys}
+    results = {}
+    timings = []
+    store = ProductStore() if PRODUCT_STORE else None
+    run_started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    run_trace.reset()
+    driver_accounting.LOG.reset()
+    product_identity.REGISTRY.reset()
+    if driver is not None and driver_accounting.COUNT_COMMANDS:
+        driver_accounting.instrument(driver)
+
+    def run_one(key, **crawl_kwargs):
+        definition = categories[key]
+        start = time.time()
+        # Journals and fingerprints are per location too
+        state_key = f"{key}_{pin_code}" if pin_code else key
+        journal = CrawlJournal(state_key, resume=resume)
+        sink = open_sink(definition, resume=resume, store=store)
+        if journal.finished:
+            print(f"\n[OK] {definition['name']} already finished, skipping")
+            sink.close()
+            results[key] = len(sink)
+            return
+        fingerprints = FingerprintStore(state_key, incremental=incremental)
+        try:
+            crawl_category(definition, workers=workers, sink=sink, journal=journal,
+                           fingerprints=fingerprints, **crawl_kwargs)
+            fingerprints.save()
+            unfinished = journal.unfinished()
+            if unfinished == 0:
+                journal.mark_finished(len(sink))
+            else:
+                print(f"\n[WARNING] {unfinished if unfinished else 'Some'} page(s) of {definition['name']} "
+                      f"failed - run again with --resume to continue")
+        except Exception as e:
+            # Products extracted before the error are already in the sink
+            print(f"\n[ERROR] {definition['name']}: {str(e)}")
+            import traceback
+
+            traceback.print_exc()
+        current_url = (crawl_kwargs.get("driver") and crawl_kwargs["driver"].current_url) or definition["url"]
+        finish_category(definition, sink, current_url)
+        results[key] = len(sink)
+        timings.append((definition["name"], len(sink), time.time() - start))
+
+    try:
+        if driver is not None:
+            for key in keys:
+                with run_trace.span("category", key=key):
+                    run_one(key, driver=driver)
+        elif pool is not None:
+            for key in keys:
+                with run_trace.span("category", key=key):
+                    run_one(key, pool=pool)
+        else:
+            with SessionPool(size=max(1, workers), pin_code=pin_code or scraper.WHITEFIELD_PIN) as pool:
+                for key in keys:
+                    with run_trace.span("category", key=key):
+                        run_one(key, pool=pool)
+        if store is not None:
+            write_run_catalog(store, run_started, pin_code)
+    finally:
+        if store is not None:
+            store.close()
+
+    if product_identity.REGISTRY.reused:
+        print(f"\n[INFO] {product_identity.REGISTRY.reused} card(s) reused across pages and categories")
+    if len(timings) > 1:
+        print("\n" + "=" * 60)
+        print("Catalog refresh summary")
+        print("=" * 60)
+        for name, count, seconds in timings:
+            print(f"  {name:<30} {count:>6} products {seconds:>8.1f}s")
+        print(f"  {'Total':<30} {sum(c for _, c, _ in timings):>6} products "
+              f"{sum(s for _, _, s in timings):>8.1f}s")
+    run_name = f"categories_{pin_code}" if pin_code else "categories"
+    run_trace.print_summary()
+    run_trace.save(run_name)
+    driver_accounting.report()
+    driver_accounting.save(run_name)
+    return results
+
+
+def run_categories_http(keys=None, concurrency=http_fetcher.HTTP_CONCURRENCY):
+    """
+    Run several categories over HTTP instead of driving Chrome.
+
+    One pooled browser session sets the location; its cookies are then
+    used by http_fetcher for every category and subcategory listing.
+
+    Returns:
+        dict: Category key -> number of products saved
+    """
+    categories = load_categories()
+    keys = keys or list(categories)
+
+    with SessionPool(size=1) as pool:
+        with pool.lease() as session:
+            http_session = http_fetcher.session_from_driver(session.driver)
+
+    definitions = [categories[key] for key in keys]
+    filters = {
+        key: importlib.import_module(categories[key]["script"]).is_valid_product
+        for key in keys
+    }
+    results = http_fetcher.fetch_categories(definitions, filters, http_session, concurrency=concurrency)
+    counts = {}
+    store = ProductStore() if PRODUCT_STORE else None
+    run_started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for definition in definitions:
+        sink = open_sink(definition, store=store)
+        sink.extend(results[definition["key"]])
+        finish_category(definition, sink)
+        counts[definition["key"]] = len(sink)
+    if store is not None:
+        write_run_catalog(store, run_started)
+        store.close()
+    return counts
+
+
+def select_categories(filters, categories=None):
+    """Category keys matching any of the filters (all when no filters)."""
+    categories = categories or load_categories()
+    if not filters:
+        return list(categories)
+    return [key for key in categories if any(f.lower() in key for f in filters)]
+
+
+def main():
+    global CARD_COLLECTOR, EXTRACTION_BACKEND, PARQUET_OUTPUT, PRICE_HISTORY, PRODUCT_STORE, SCROLL_HARVEST
+    parser = argparse.ArgumentParser(description="Run Zepto category scrapers on one browser.")
+    parser.add_argument("categories", nargs="*", help="Category keys (or parts of keys) to run")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel browser workers for subcategories")
+    parser.add_argument("--list", action="store_true", help="List configured categories and exit")
+    parser.add_argument("--http", action="store_true", help="Fetch listings over HTTP after the browser sets the location")
+    parser.add_argument("--profile", choices=["full", "lean"], help="Browser profile (default: scraper.BROWSER_PROFILE)")
+    parser.add_argument("--resume", action="store_true", help="Skip pages finished by an interrupted run")
+    parser.add_argument("--incremental", action="store_true", help="Skip subcategories unchanged since the last run")
+    parser.add_argument("--extraction", choices=["live", "html"], help="Card extraction backend (default: EXTRACTION_BACKEND)")
+    parser.add_argument("--html-parser", choices=["lxml", "html.parser"], help="Parser for --extraction html (default: html_extraction.HTML_PARSER)")
+    parser.add_argument("--count-commands", action="store_true", help="Count and time every WebDriver command")
+    parser.add_argument("--no-parquet", action="store_true", help="Write CSV/JSON only, without the typed Parquet copy")
+    parser.add_argument("--no-history", action="store_true", help="Do not append to the Parquet price history")
+    parser.add_argument("--no-store", action="store_true", help="Dedup in memory only, without the SQLite product store")
+    parser.add_argument("--collector", action="store_true", help="Record cards in-page as they render and poll only new ones")
+    parser.add_argument("--harvest", action="store_true", help="Extract new cards after every scroll step (virtualized lists)")
+    parser.add_argument("--record-snapshots", action="store_true", help="Save the product-grid HTML of every page for offline replay")
+    args = parser.parse_args()
+
+    categories = load_categories()
+    if args.list:
+        for key, definition in categories.items():
+            print(f"  {key:<22} {definition['name']}")
+        return
+
+    if args.profile:
+        scraper.BROWSER_PROFILE = args.profile
+    if args.extraction:
+        EXTRACTION_BACKEND = args.extraction
+    if args.html_parser:
+        html_extraction.HTML_PARSER = args.html_parser
+    if args.count_commands:
+        driver_accounting.COUNT_COMMANDS = True
+    if args.record_snapshots:
+        page_snapshots.RECORD_SNAPSHOTS = True
+    if args.no_store:
+        PRODUCT_STORE = False
+    if args.no_history:
+        PRICE_HISTORY = False
+    if args.no_parquet:
+        PARQUET_OUTPUT = False
+    if args.collector:
+        CARD_COLLECTOR = True
+    if args.harvest:
+        SCROLL_HARVEST = True
+
+    keys = select_categories(args.categories, categories)
+    if not keys:
+        print(f"No categories match: {' '.join(args.categories)}")
+        return
+    if args.http:
+        run_categories_http(keys)
+    else:
+        run_categories(keys, workers=args.workers, resume=args.resume, incremental=args.incremental)
+
+
+if __name__ == "__main__":
+    main()
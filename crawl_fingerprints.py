@@ -0,0 +1,137 @@
+"""
+Per-page fingerprints for incremental re-crawls.
+
+Right after a listing page is ready (before any scrolling) one script call
+reads the first screenful of product cards - priced product links inside
+the viewport, at most FIRST_SCREEN_MAX_CARDS of them, so headers and
+recommendation rails scrolled out of view do not count: how many there
+are and a hash of their product IDs and prices. Every crawl stores that fingerprint with
+the page's extracted products in output/fingerprints/<key>.json. In
+incremental mode a page whose fingerprint matches the previous run is not
+scrolled or extracted again; its previous products are carried forward,
+marked carried_forward=True and keeping their original scraped_at.
+
+A change in the first screenful (new/removed products, order or price)
+triggers a full re-crawl of that page. Changes further down the list are
+only picked up when FINGERPRINT_MAX_AGE_HOURS forces a full crawl.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+# Configuration
+FINGERPRINT_DIR = "output/fingerprints"
+FINGERPRINT_MAX_AGE_HOURS = 24  # Re-crawl a page at least this often, even if unchanged
+FIRST_SCREEN_MAX_CARDS = 24  # Cards hashed per page (the first grid rows)
+
+# Product IDs and prices of the priced cards visible before scrolling
+FIRST_SCREEN_SCRIPT = r"""
+var maxCards = arguments[0];
+var viewWidth = window.innerWidth || document.documentElement.clientWidth;
+var viewHeight = window.innerHeight || document.documentElement.clientHeight;
+var seen = {}, cards = [];
+var links = document.querySelectorAll("a[href*='/pn/']");
+for (var i = 0; i < links.length && cards.length < maxCards; i++) {
+    var rect = links[i].getBoundingClientRect();
+    if (!rect.width || !rect.height || rect.bottom <= 0 || rect.top >= viewHeight ||
+            rect.right <= 0 || rect.left >= viewWidth) { continue; }
+    var price = ((links[i].innerText || '').match(/₹\s*\d+/) || [''])[0].replace(/\s+/g, '');
+    if (!price) { continue; }
+    var href = links[i].getAttribute('href') || '';
+    var id = href.indexOf('/pvid/') !== -1 ? href.split('/pvid/')[1].split(/[/?#]/)[0] : href;
+    if (seen[id]) { continue; }
+    seen[id] = true;
+    cards.push(id + '|' + price);
+}
+return {count: cards.length, cards: cards};
+"""
+
+
+def page_fingerprint(driver):
+    """
+    Fingerprint of the current page's first screenful of products.
+
+    Returns:
+        str: "<count>:<sha1 of ids+prices>", or None if it could not be read
+    """
+    try:
+        result = driver.execute_script(FIRST_SCREEN_SCRIPT, FIRST_SCREEN_MAX_CARDS) or {}
+    except Exception:
+        return None
+    if not result.get("count"):
+        return None
+    digest = hashlib.sha1("\n".join(result["cards"]).encode("utf-8")).hexdigest()[:16]
+    return f"{result['count']}:{digest}"
+
+
+class FingerprintStore:
+    """
+    Fingerprints and products of every page of one category.
+
+    Args:
+        key (str): Category key (file name)
+        incremental (bool): Allow unchanged pages to be skipped
+    """
+
+    def __init__(self, key, incremental=False):
+        self.key = key
+        self.incremental = incremental
+        self.path = os.path.join(FINGERPRINT_DIR, f"{key}.json")
+        self.previous = {}
+        self.pages = {}
+        self.skipped = 0
+        self.carried = 0
+        self.crawled = 0
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.previous = json.load(f).get("pages", {})
+            except (OSError, ValueError) as e:
+                print(f"  [WARNING] Could not read {self.path}: {e}")
+
+    def unchanged(self, url, fingerprint):
+        """True if the page can be skipped: same fingerprint as last run and not too old."""
+        previous = self.previous.get(url)
+        if not (self.incremental and fingerprint and previous):
+            return False
+        if previous.get("fingerprint") != fingerprint:
+            return False
+        return time.time() - previous.get("crawled_ts", 0) < FINGERPRINT_MAX_AGE_HOURS * 3600
+
+    def carry_forward(self, url):
+        """
+        Previous products of an unchanged page (also kept for the next run).
+
+        Returns:
+            list: Copies marked carried_forward=True, with their original scraped_at
+        """
+        previous = self.previous[url]
+        self.pages[url] = previous
+        self.skipped += 1
+        products = [dict(product, carried_forward=True) for product in previous.get("products", [])]
+        self.carried += len(products)
+        return products
+
+    def update(self, url, fingerprint, products):
+        """Records a freshly crawled page."""
+        self.crawled += 1
+        if fingerprint:
+            self.pages[url] = {
+                "fingerprint": fingerprint,
+                "crawled_ts": time.time(),
+                "products": products,
+            }
+
+    def save(self):
+        """Saves this run's fingerprints (pages not visited this run are kept as they were)."""
+        pages = dict(self.previous)
+        pages.update(self.pages)
+        os.makedirs(FINGERPRINT_DIR, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"key": self.key, "pages": pages}, f, ensure_ascii=False)
+        if self.incremental:
+            print(f"  [OK] Incremental: {self.skipped} unchanged page(s) carried forward "
+                  f"({self.carried} products, not re-scraped), {self.crawled} crawled")
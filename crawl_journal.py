@@ -0,0 +1,107 @@
+"""
+Crawl journal for checkpoint/resume.
+
+Every category crawl appends its progress to output/journal/<key>.jsonl:
+the subcategory list once it is known, then one line per finished page
+(after that page's products have been flushed to the product sink). A
+--resume run reads the journal back, skips the category page and every
+finished subcategory, and continues with the first unfinished one. The
+products of the finished pages are already in the sink's NDJSON file.
+
+Journal lines:
+    {"event": "start", ...}
+    {"event": "subcategories", "urls": [...], "names": [...]}
+    {"event": "page", "url": "...", "products": 12}
+    {"event": "finished", "products": 240}
+"""
+
+import json
+import os
+from datetime import datetime
+
+# Configuration
+JOURNAL_DIR = "output/journal"
+
+
+class CrawlJournal:
+    """
+    Append-only progress log of one category crawl.
+
+    Args:
+        key (str): Category key (journal file name)
+        resume (bool): Keep and load the existing journal instead of starting over
+    """
+
+    def __init__(self, key, resume=False):
+        self.key = key
+        self.path = os.path.join(JOURNAL_DIR, f"{key}.jsonl")
+        self.subcategory_urls = None
+        self.subcategory_names = None
+        self.done = {}
+        self.finished = False
+
+        os.makedirs(JOURNAL_DIR, exist_ok=True)
+        if resume and os.path.exists(self.path):
+            self._load()
+        else:
+            open(self.path, "w", encoding="utf-8").close()
+            self._write({"event": "start"})
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Last line cut short by a crash
+                    continue
+                event = entry.get("event")
+                if event == "subcategories":
+                    self.subcategory_urls = entry["urls"]
+                    self.subcategory_names = entry["names"]
+                elif event == "page":
+                    self.done[entry["url"]] = entry.get("products", 0)
+                elif event == "finished":
+                    self.finished = True
+        print(f"  [OK] Resuming {self.key}: {len(self.done)} page(s) already done"
+              + (" (category finished)" if self.finished else ""))
+
+    def _write(self, entry):
+        entry["at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @property
+    def has_subcategories(self):
+        """True if the subcategory list was recorded by an earlier run."""
+        return self.subcategory_urls is not None
+
+    def record_subcategories(self, urls, names):
+        self.subcategory_urls = list(urls)
+        self.subcategory_names = list(names)
+        self._write({"event": "subcategories", "urls": self.subcategory_urls, "names": self.subcategory_names})
+
+    def is_done(self, url):
+        return url in self.done
+
+    def mark_done(self, url, products):
+        """Records a finished page. Call only after its products were flushed."""
+        self.done[url] = products
+        self._write({"event": "page", "url": url, "products": products})
+
+    def pending(self, urls, names):
+        """The (urls, names) that are not finished yet, in order."""
+        pairs = [(url, name) for url, name in zip(urls, names) if not self.is_done(url)]
+        return [url for url, _ in pairs], [name for _, name in pairs]
+
+    def unfinished(self):
+        """Number of recorded subcategories that are not done yet (None if the list is unknown)."""
+        if self.subcategory_urls is None:
+            return None
+        return sum(1 for url in self.subcategory_urls if not self.is_done(url))
+
+    def mark_finished(self, products):
+        self.finished = True
+        self._write({"event": "finished", "products": products})
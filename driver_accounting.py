@@ -0,0 +1,163 @@
+"""
+WebDriver command accounting.
+
+Every Selenium call - driver.get(), find_element(), element.text,
+get_attribute(), execute_script() ... - ends in one driver.execute()
+round-trip to chromedriver. instrument(driver) wraps that method, so each
+command is counted and timed by:
+
+    command   WebDriver command type (findElement, getElementAttribute, ...)
+    caller    the scraper function that issued it (module.function)
+    phase     the innermost run_trace span (extract_products, scroll_page, ...)
+    page      the last URL the driver navigated to
+
+report() prints the totals, save() writes them as JSON. Drivers from
+scraper.setup_driver() are instrumented when COUNT_COMMANDS is True (or
+python category_engine.py --count-commands).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+import run_trace
+
+# Configuration
+COUNT_COMMANDS = False  # True = instrument every driver created by scraper.setup_driver()
+COMMANDS_DIR = "output/commands"
+REPORT_TOP = 12  # Rows per table in report()
+
+# Frames from these files are not reported as the caller (browser_pool wraps driver.get
+# to count a session's pages, so its frame sits between every navigation and its caller)
+_SKIP_FILES = tuple(
+    os.path.normcase(os.path.abspath(path))
+    for path in (__file__, run_trace.__file__, os.path.join(os.path.dirname(__file__), "browser_pool.py"))
+)
+_SKIP_DIRS = (os.sep + "selenium" + os.sep, os.sep + "contextlib.py", os.sep + "functools.py")
+
+
+class CommandLog:
+    """Command counts and times, grouped by command, caller, phase and page."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.groups = {"command": {}, "caller": {}, "phase": {}, "page": {}}
+            self.caller_commands = {}
+            self.total = [0, 0.0]
+
+    def record(self, command, seconds, caller, phase, page):
+        with self._lock:
+            self.total[0] += 1
+            self.total[1] += seconds
+            for group, key in (("command", command), ("caller", caller), ("phase", phase), ("page", page)):
+                stats = self.groups[group].setdefault(key or "-", [0, 0.0])
+                stats[0] += 1
+                stats[1] += seconds
+            stats = self.caller_commands.setdefault(caller, {}).setdefault(command, [0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+
+    def snapshot(self):
+        """The totals as plain dicts (JSON-ready), largest count first."""
+        def rows(stats):
+            return {key: {"count": count, "seconds": round(seconds, 4)}
+                    for key, (count, seconds) in sorted(stats.items(), key=lambda item: -item[1][0])}
+
+        with self._lock:
+            return {
+                "commands": self.total[0],
+                "seconds": round(self.total[1], 3),
+                **{f"by_{group}": rows(stats) for group, stats in self.groups.items()},
+                "by_caller_command": {caller: rows(stats) for caller, stats in self.caller_commands.items()},
+            }
+
+
+LOG = CommandLog()
+
+
+def _caller():
+    """module.function of the first frame outside Selenium and this module."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.normcase(frame.f_code.co_filename)
+        if filename not in _SKIP_FILES and not any(part in filename for part in _SKIP_DIRS):
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "-"
+
+
+def instrument(driver, log=None):
+    """
+    Counts and times every command the driver sends from now on.
+
+    Args:
+        driver: Selenium WebDriver instance
+        log (CommandLog): Where to record (default: the shared LOG)
+
+    Returns:
+        The same driver
+    """
+    log = log or LOG
+    if getattr(driver, "_command_log", None) is not None:
+        return driver
+    original_execute = driver.execute
+    state = {"page": None}
+
+    def counted_execute(driver_command, params=None):
+        if driver_command == "get" and params:
+            state["page"] = params.get("url")
+        start = time.perf_counter()
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            log.record(driver_command, time.perf_counter() - start, _caller(),
+                       run_trace.current_span(), state["page"])
+
+    driver.execute = counted_execute
+    driver._command_log = log
+    return driver
+
+
+def report(log=None, top=REPORT_TOP):
+    """Prints the command totals by type, caller, phase and page."""
+    data = (log or LOG).snapshot()
+    if not data["commands"]:
+        return
+    print("\n" + "=" * 60)
+    print(f"WebDriver commands: {data['commands']} in {data['seconds']:.1f}s")
+    print("=" * 60)
+    for group, title in (("command", "Command"), ("caller", "Caller"), ("phase", "Phase"), ("page", "Page")):
+        rows = list(data[f"by_{group}"].items())
+        print(f"\n  {title:<46}{'Count':>8}{'Seconds':>10}")
+        for key, stats in rows[:top]:
+            label = key if len(key) <= 46 else "..." + key[-43:]
+            print(f"  {label:<46}{stats['count']:>8}{stats['seconds']:>10.2f}")
+        if len(rows) > top:
+            print(f"  ... {len(rows) - top} more")
+
+
+def save(name="run", log=None):
+    """
+    Writes the command totals to output/commands/<name>_<time>.json.
+
+    Returns:
+        str: Path of the file, or None if no commands were recorded
+    """
+    data = (log or LOG).snapshot()
+    if not data["commands"]:
+        return None
+    data["run_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    os.makedirs(COMMANDS_DIR, exist_ok=True)
+    path = os.path.join(COMMANDS_DIR, f"{name}_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"Command counts saved to {path}")
+    return path
@@ -0,0 +1,549 @@
+"""
+Product-card extraction from page HTML.
+
+The same card logic as category_engine.extract_products(), but run over
+an HTML string instead of live WebDriver elements: find the elements whose
+text contains ₹, take their closest <a> (or <div>) as the card, dedup by
+/pvid/ ID (or /pn/ slug + price), then read name, price, discount,
+quantity, image and URL from the card text.
+
+The card-parsing helpers (card_key, card_product, ...) are shared with the
+live path, so both produce the same records. Two parser backends:
+
+    lxml         C parser, XPath lookups (optional dependency)
+    html.parser  standard library only, used when lxml is not installed
+
+It is used for the "html" extraction backend of category_engine (one
+outerHTML dump per page instead of hundreds of find_element calls) and
+for replaying saved page snapshots (see page_snapshots.py).
+"""
+
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+try:
+    from lxml import etree
+except ImportError:  # Optional dependency, html.parser is used without it
+    etree = None
+
+# Configuration
+HTML_PARSER = "lxml"  # "lxml" = C parser (falls back to html.parser if missing), "html.parser" = stdlib
+NAME_SELECTORS = [
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "span[class*='name']",
+    "span[class*='title']",
+    "div[class*='name']",
+    "div[class*='title']",
+    "p[class*='name']",
+    "div[class*='product']",
+]
+BUTTON_LABELS = ["ADD", "NOTIFY", "EXPLORE", "EXPLORE NOW", "BUY NOW"]
+DEFAULT_BANNER_TERMS = ["explore", "banner", "up to"]
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+             "source", "track", "wbr"}
+SKIPPED_TAGS = {"script", "style", "template", "noscript", "svg"}
+# Tags rendered on their own line(s), as in element.text / innerText
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset",
+              "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+              "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tr",
+              "ul"}
+
+SELECTOR_PATTERN = re.compile(r"^(\w+)(?:\[class\*='([^']+)'\])?$")
+ORIGIN_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://[^/?#]*")
+QUANTITY_PATTERN = re.compile(r"(\d+\s*(?:pack|g|kg|pc|pcs|ml|l|Approx\.))", re.IGNORECASE)
+
+
+def pvid(href):
+    """Product ID from the /pvid/<id> part of a product URL, or None."""
+    if not href or "/pvid/" not in href:
+        return None
+    return href.split("/pvid/")[1].split("/")[0].split("?")[0] or None
+
+
+def card_key(href, container_text):
+    """
+    Dedup key of a product card.
+
+    Args:
+        href (str): Card link (may be None)
+        container_text (str): First 100 characters of the card text
+
+    Returns:
+        str: /pvid/ product ID, /pn/ slug + price, or first line + price
+    """
+    price_match = re.search(r"₹\s*(\d+)", container_text)
+    price = price_match.group(1) if price_match else "no_price"
+    if href and "/pn/" in href:
+        product_id = pvid(href)
+        if product_id:
+            return product_id
+        return f"{href.split('/pn/')[1].split('/')[0]}|{price}"
+    if price_match:
+        return container_text.split("\n")[0] + "|" + price_match.group(1)
+    return container_text[:50]
+
+
+def is_card_text(container_text, banner_terms):
+    """True if the card text is long enough and not a banner."""
+    if not container_text or len(container_text) <= 10:
+        return False
+    text_lower = container_text.lower()
+    return not any(term in text_lower for term in banner_terms)
+
+
+def name_from_url(href):
+    """Product name from the /pn/<slug>/ part of a product URL."""
+    if not href or "/pn/" not in href:
+        return None
+    product_slug = href.split("/pn/")[1].split("/")[0]
+    return " ".join(word.capitalize() for word in product_slug.split("-")) or None
+
+
+def is_name_text(text):
+    """True if an element's text looks like a product name (not a button or price)."""
+    return (
+        bool(text)
+        and len(text) > 3
+        and text.upper() not in BUTTON_LABELS
+        and not re.match(r"^₹\s*\d+", text)
+    )
+
+
+def name_from_lines(lines, heading_terms=None):
+    """First card text line that is not a button, price, quantity, ETA or heading."""
+    for line in lines:
+        line_clean = line.strip()
+        if line_clean.upper() in BUTTON_LABELS:
+            continue
+        if re.match(r"^₹\s*\d+", line_clean):
+            continue
+        if re.match(r"^₹\s*\d+\s*OFF", line_clean, re.IGNORECASE):
+            continue
+        if "mins" in line_clean.lower() or "min" in line_clean.lower():
+            continue
+        if re.match(r"^\d+\s*(pack|g|kg|ml|l|pc|pcs|Approx)", line_clean, re.IGNORECASE):
+            continue
+        if "price list" in line_clean.lower():
+            continue
+        # Category heading such as "Atta Rice Oil & Dals"
+        if heading_terms and all(term in line_clean.lower() for term in heading_terms):
+            continue
+        if re.match(r"^\d+[\s-]+\d+\s*(g|kg)", line_clean, re.IGNORECASE):
+            continue
+        if len(line_clean) > 3 and not line_clean.isdigit():
+            return line_clean
+    return None
+
+
+def card_product(container_text, href, image_url, heading_terms=None, find_name=None):
+    """
+    Builds a product record from one card.
+
+    Args:
+        container_text (str): Full card text (one line per rendered block)
+        href (str): Card link (may be None)
+        image_url (str): Card image URL (may be None)
+        heading_terms (list): Words of the category heading, never a product name
+        find_name: Optional callable returning a name from the card's name
+            elements; only called when the URL has no /pn/ slug
+
+    Returns:
+        dict: Product record, or None if the card has no usable name
+    """
+    lines = [l.strip() for l in container_text.split("\n") if l.strip()]
+
+    product_name = name_from_url(href)
+    if not product_name and find_name:
+        product_name = find_name()
+    if not product_name:
+        product_name = name_from_lines(lines, heading_terms)
+
+    product = {"name": product_name if product_name else "Unknown"}
+
+    price_match = re.search(r"₹\s*(\d+)", container_text)
+    product["price"] = price_match.group(1) if price_match else "N/A"
+
+    discount_match = re.search(r"₹\s*(\d+)\s*OFF", container_text, re.IGNORECASE)
+    product["discount"] = f"₹{discount_match.group(1)}" if discount_match else "N/A"
+
+    qty_match = QUANTITY_PATTERN.search(container_text)
+    product["quantity"] = qty_match.group(1) if qty_match else "N/A"
+
+    product["product_url"] = href if href else "N/A"
+    product["image_url"] = image_url or "N/A"
+
+    if product["name"] == "Unknown" or len(product["name"]) <= 2:
+        return None
+    if product["name"].upper() in ["ADD", "NOTIFY", "EXPLORE", "BUY NOW"]:
+        return None
+    return product
+
+
+class HtmlNode:
+    """One element of a parsed page: tag, attributes, children (nodes and text)."""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = attrs or {}
+        self.children = []
+        self.parent = parent
+
+    def get(self, name):
+        return self.attrs.get(name)
+
+    def iter(self):
+        """This node and every descendant element, in document order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(child for child in reversed(node.children) if isinstance(child, HtmlNode))
+
+    def descendants(self):
+        nodes = self.iter()
+        next(nodes)
+        return nodes
+
+    def first_text(self):
+        """First direct text child, as XPath text() sees it in contains(text(), ...)."""
+        for child in self.children:
+            if isinstance(child, str):
+                return child
+        return ""
+
+    def ancestor(self, tag):
+        """Closest ancestor with this tag, or None."""
+        node = self.parent
+        while node is not None:
+            if node.tag == tag:
+                return node
+            node = node.parent
+        return None
+
+    def find(self, predicate):
+        """First descendant element matching predicate, or None."""
+        for node in self.descendants():
+            if predicate(node):
+                return node
+        return None
+
+    def select_one(self, selector):
+        """First descendant matching a simple "tag" or "tag[class*='x']" selector."""
+        match = SELECTOR_PATTERN.match(selector)
+        if not match:
+            return None
+        tag, class_part = match.groups()
+        return self.find(
+            lambda node: node.tag == tag and (not class_part or class_part in (node.get("class") or ""))
+        )
+
+    @property
+    def text(self):
+        """Rendered text, one line per block element (like WebElement.text)."""
+        parts = []
+        self._collect_text(parts)
+        lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child.replace("\n", " "))
+            elif child.tag == "br":
+                parts.append("\n")
+            elif child.tag in SKIPPED_TAGS:
+                continue
+            elif child.tag in BLOCK_TAGS:
+                parts.append("\n")
+                child._collect_text(parts)
+                parts.append("\n")
+            else:
+                child._collect_text(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#document")
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open tag; ignore stray end tags
+        node = self.current
+        while node is not None and node.tag != tag:
+            node = node.parent
+        if node is not None and node.parent is not None:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+def parse_html(html):
+    """Parses an HTML string into an HtmlNode tree (root tag "#document")."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+class HtmlParserBackend:
+    """Cards from an HtmlNode tree built with the standard library's html.parser."""
+
+    name = "html.parser"
+
+    def parse(self, html):
+        return parse_html(html)
+
+    def price_elements(self, root):
+        return [node for node in root.iter()
+                if node.tag not in SKIPPED_TAGS and "₹" in node.first_text()]
+
+    def container(self, element):
+        return element.ancestor("a") or element.ancestor("div") or element
+
+    def link(self, container):
+        return container.find(lambda node: node.tag == "a" and node.get("href"))
+
+    def image(self, container):
+        return container.find(lambda node: node.tag == "img")
+
+    def text(self, element):
+        return element.text
+
+    def select_one(self, container, selector):
+        return container.select_one(selector)
+
+
+class LxmlBackend:
+    """Cards from an lxml tree (C parser, XPath for the element lookups)."""
+
+    name = "lxml"
+
+    def __init__(self):
+        self._name_xpaths = {}
+        for selector in NAME_SELECTORS:
+            tag, class_part = SELECTOR_PATTERN.match(selector).groups()
+            self._name_xpaths[selector] = etree.XPath(
+                f".//{tag}[contains(@class, '{class_part}')]" if class_part else f".//{tag}"
+            )
+        self._link_xpath = etree.XPath(".//a[@href]")
+        self._image_xpath = etree.XPath(".//img")
+        self._parser = etree.HTMLParser()
+
+    def parse(self, html):
+        return etree.fromstring(html, self._parser)
+
+    def price_elements(self, root):
+        # A Python walk: libxml2 evaluates //*[contains(text(), ...)] in quadratic time on large pages
+        elements = []
+        for element in root.iter():
+            tag = element.tag
+            if not isinstance(tag, str) or tag in SKIPPED_TAGS:
+                continue
+            text = element.text
+            if not text:
+                # XPath text() is the first text node, which may follow a child element
+                text = next((child.tail for child in element if child.tail), "")
+            if "₹" in text:
+                elements.append(element)
+        return elements
+
+    def container(self, element):
+        # lxml elements without children are falsy, so compare with None
+        for tag in ("a", "div"):
+            ancestor = next(element.iterancestors(tag), None)
+            if ancestor is not None:
+                return ancestor
+        return element
+
+    def link(self, container):
+        return next(iter(self._link_xpath(container)), None)
+
+    def image(self, container):
+        return next(iter(self._image_xpath(container)), None)
+
+    def text(self, element):
+        parts = []
+        _lxml_collect_text(element, parts)
+        lines = [" ".join(line.split()) for line in "".join(parts).split("\n")]
+        return "\n".join(line for line in lines if line)
+
+    def select_one(self, container, selector):
+        return next(iter(self._name_xpaths[selector](container)), None)
+
+
+def _lxml_collect_text(element, parts):
+    if element.text:
+        parts.append(element.text.replace("\n", " "))
+    for child in element:
+        tag = child.tag if isinstance(child.tag, str) else None
+        if tag == "br":
+            parts.append("\n")
+        elif tag is None or tag in SKIPPED_TAGS:
+            pass
+        elif tag in BLOCK_TAGS:
+            parts.append("\n")
+            _lxml_collect_text(child, parts)
+            parts.append("\n")
+        else:
+            _lxml_collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail.replace("\n", " "))
+
+
+def get_backend(name=None):
+    """
+    HTML parser backend by name.
+
+    Args:
+        name (str): "lxml" or "html.parser" (default: HTML_PARSER). "lxml"
+            falls back to "html.parser" when lxml is not installed.
+    """
+    name = name or HTML_PARSER
+    if name == "lxml":
+        if etree is not None:
+            return LxmlBackend()
+        print("  [WARNING] lxml is not installed, using html.parser")
+    elif name != "html.parser":
+        raise ValueError(f"Unknown HTML parser: {name}")
+    return HtmlParserBackend()
+
+
+def _absolute(url, base_url):
+    """Resolves a link the way the browser's href/src properties do."""
+    if not url or not base_url or "://" in url:
+        return url
+    if url.startswith("/") and not url.startswith("//"):
+        # Root-relative (every Zepto link): origin + path, without a full urljoin
+        origin = ORIGIN_PATTERN.match(base_url)
+        if origin:
+            return origin.group(0) + url
+    return urljoin(base_url, url)
+
+
+def _card_href(backend, container, base_url):
+    href = container.get("href") if container.tag == "a" else None
+    if not href:
+        a_tag = backend.link(container)
+        href = a_tag.get("href") if a_tag is not None else None
+    return _absolute(href, base_url)
+
+
+def _card_image(backend, container, base_url):
+    img = backend.image(container)
+    if img is None:
+        return None
+    return _absolute(img.get("src") or img.get("data-src"), base_url)
+
+
+def find_cards(backend, root, banner_terms=None, base_url=""):
+    """
+    Unique product cards of a parsed page.
+
+    Returns:
+        list: (container, href, text) of each card, in page order
+    """
+    banner_terms = banner_terms or DEFAULT_BANNER_TERMS
+    cards = {}
+    seen = set()
+    for element in backend.price_elements(root):
+        container = backend.container(element)
+        # Keeping the container in the set keeps lxml's element proxy alive
+        if container in seen:
+            continue
+        seen.add(container)
+        href = _card_href(backend, container, base_url)
+        text = backend.text(container)
+        container_text = text[:100]
+        if not is_card_text(container_text, banner_terms):
+            continue
+        key = card_key(href, container_text)
+        if key not in cards:
+            cards[key] = (container, href, text)
+    return list(cards.values())
+
+
+def products_from_html(html, definition, page_url="", backend=None):
+    """
+    Product records of every card in page HTML, before the category filter.
+
+    Args:
+        html (str): Page, product-grid or card HTML
+        definition (dict): Category definition from categories.json
+        page_url (str): URL the HTML came from (resolves relative links)
+        backend: Parser backend or its name (default: HTML_PARSER)
+
+    Returns:
+        list: Product dictionaries (without scraped_at), in page order
+    """
+    if not html or not html.strip():
+        return []
+    if backend is None or isinstance(backend, str):
+        backend = get_backend(backend)
+    banner_terms = definition.get("banner_terms") or DEFAULT_BANNER_TERMS
+    heading_terms = definition.get("heading_terms") or []
+
+    products = []
+    for container, href, text in find_cards(backend, backend.parse(html), banner_terms, page_url):
+        def find_name(container=container):
+            for selector in NAME_SELECTORS:
+                element = backend.select_one(container, selector)
+                if element is not None:
+                    name_text = backend.text(element).strip()
+                    if is_name_text(name_text):
+                        return name_text
+            return None
+
+        product = card_product(text, href, _card_image(backend, container, page_url),
+                               heading_terms, find_name=find_name)
+        if product:
+            products.append(product)
+    return products
+
+
+def extract_products_from_html(html, definition, is_valid_product, page_url="", verbose=False,
+                               backend=None):
+    """
+    Extracts a category's products from page HTML.
+
+    Args:
+        html (str): Page or product-grid HTML
+        definition (dict): Category definition from categories.json
+        is_valid_product: The category's product filter
+        page_url (str): URL the HTML came from (resolves relative links)
+        verbose (bool): Print every product, as the live path does
+        backend: Parser backend or its name (default: HTML_PARSER)
+
+    Returns:
+        list: Product dictionaries that passed is_valid_product()
+    """
+    scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    products = []
+    for product in products_from_html(html, definition, page_url, backend):
+        if is_valid_product(product):
+            product["scraped_at"] = scraped_at
+            products.append(product)
+            if verbose:
+                price_display = f"₹{product['price']}" if product["price"] != "N/A" else "N/A"
+                print(f"  [{len(products)}] {product['name'][:50]:<50} | {price_display}")
+    return products
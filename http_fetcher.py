@@ -0,0 +1,393 @@
+"""
+Browserless catalog fetcher.
+
+Once a browser session has set the delivery location, the category pages
+can be fetched directly over HTTP with the same cookies. This module takes
+the cookies and user agent from a configured driver once, then fetches
+category and subcategory listings with one pooled keep-alive aiohttp
+session and bounded concurrency. Products are read from the JSON embedded
+in each page (or from JSON API responses) with catalog_capture and
+reduced to the fields extract_products() gives, with prices and discounts
+in whole rupees as shown on the card, so the CSVs line up with browser runs.
+
+Usage:
+    python category_engine.py --http munchies       # browser sets location, HTTP does the rest
+    python http_fetcher.py --stand-in               # fetch from a local stand-in server (offline)
+"""
+
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from html import unescape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency, only needed for HTTP mode
+    aiohttp = None
+
+import catalog_capture
+from html_extraction import QUANTITY_PATTERN
+
+# Configuration
+HTTP_CONCURRENCY = 8  # Requests in flight at once (also the connection pool size)
+HTTP_TIMEOUT = 20  # Seconds per request
+MAX_PAGES = 5  # Listing pages to follow per category/subcategory
+PAGE_PARAM = "page_number"  # Query parameter used to page through a listing
+STAND_IN_PORT = 8765
+
+JSON_SCRIPT_PATTERN = re.compile(
+    r"<script[^>]*type=[\"']application/(?:ld\+)?json[\"'][^>]*>(.*?)</script>", re.S | re.I
+)
+EXTRACTED_FIELDS = ["name", "price", "discount", "quantity", "product_url", "image_url"]
+LINK_PATTERN = re.compile(r"href=[\"']([^\"']*/cn/[^\"']+)[\"']", re.I)
+
+
+def session_from_driver(driver):
+    """
+    Copies what an HTTP client needs from a browser that has the location set.
+
+    Returns:
+        dict: {"cookies": {name: value}, "headers": {...}}
+    """
+    cookies = {cookie["name"]: cookie["value"] for cookie in driver.get_cookies()}
+    user_agent = driver.execute_script("return navigator.userAgent")
+    print(f"  [OK] Copied {len(cookies)} cookies from the browser session")
+    return {
+        "cookies": cookies,
+        "headers": {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/json;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-IN,en;q=0.9",
+        },
+    }
+
+
+def payloads_from_body(text, content_type=""):
+    """JSON payloads in a response: the body itself, or the JSON script blocks of an HTML page."""
+    if "json" in content_type:
+        try:
+            return [json.loads(text)]
+        except ValueError:
+            return []
+
+    payloads = []
+    for block in JSON_SCRIPT_PATTERN.findall(text):
+        try:
+            payloads.append(json.loads(unescape(block)))
+        except ValueError:
+            continue
+    return payloads
+
+
+def subcategory_links(html, page_url, definition):
+    """
+    Subcategory listing URLs linked from a category page.
+
+    Same rules as the scripts' find_subcategories(): a /cn/ link of the
+    same category that matches the category's subcategory keywords and
+    none of its excluded keywords.
+    """
+    page_path = urlparse(page_url).path
+    category_slug = page_path.split("/cn/")[-1].split("/")[0]
+    include = definition.get("subcategory_keywords") or []
+    exclude = definition.get("excluded_subcategory_keywords") or []
+
+    links = []
+    for href in LINK_PATTERN.findall(html):
+        url = urljoin(page_url, unescape(href))
+        path = urlparse(url).path
+        if "/pn/" in path or path == page_path:
+            continue
+        if path.split("/cn/")[-1].split("/")[0] != category_slug:
+            continue
+        text = path.lower()
+        if include and not any(kw in text for kw in include):
+            continue
+        if any(kw in text for kw in exclude):
+            continue
+        if url not in links:
+            links.append(url)
+    return links
+
+
+def _rupees(value):
+    """Whole rupees as the card shows them ("74.50" -> "74"), or None."""
+    match = re.search(r"\d+(?:\.\d+)?", str(value or ""))
+    return str(int(float(match.group(0)))) if match else None
+
+
+def as_extracted(record):
+    """
+    Converts a catalog_capture record to the format extract_products() produces.
+
+    Args:
+        record (dict): Record from catalog_capture
+
+    Returns:
+        dict: name, price, discount, quantity, product_url and image_url only
+    """
+    price = _rupees(record.get("price"))
+    discount = _rupees(record.get("discount"))
+    qty_match = QUANTITY_PATTERN.search(record.get("quantity") or "")
+    product = {field: record.get(field) or "N/A" for field in EXTRACTED_FIELDS}
+    product["price"] = price or "N/A"
+    product["discount"] = f"₹{discount}" if discount and discount != "0" else "N/A"
+    product["quantity"] = qty_match.group(1) if qty_match else "N/A"
+    return product
+
+
+def page_url(url, page):
+    """The listing URL for page N (page 0 is the URL itself)."""
+    if page == 0:
+        return url
+    parts = urlparse(url)
+    query = dict(parse_qsl(parts.query))
+    query[PAGE_PARAM] = str(page)
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+
+class HttpCatalogClient:
+    """
+    Async HTTP client over one pooled keep-alive session.
+
+    Args:
+        session (dict): Cookies and headers from session_from_driver()
+        concurrency (int): Maximum requests in flight (and pooled connections)
+        max_pages (int): Listing pages to follow per URL
+
+    Usage:
+        async with HttpCatalogClient(session) as client:
+            products = await client.fetch_category(definition, is_valid_product)
+    """
+
+    def __init__(self, session=None, concurrency=HTTP_CONCURRENCY, max_pages=MAX_PAGES):
+        if aiohttp is None:
+            raise RuntimeError("HTTP mode needs aiohttp: pip install aiohttp")
+        session = session or {}
+        self.cookies = session.get("cookies", {})
+        self.headers = session.get("headers", {})
+        self.concurrency = concurrency
+        self.max_pages = max_pages
+        self.requests = 0
+        self.bytes_received = 0
+        self.errors = 0
+        self._http = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+        self._http = aiohttp.ClientSession(
+            connector=connector,
+            cookies=self.cookies,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._http.close()
+        return False
+
+    async def fetch(self, url):
+        """
+        Fetches one URL.
+
+        Returns:
+            tuple: (body text, content type), or (None, None) on failure
+        """
+        async with self._semaphore:
+            try:
+                async with self._http.get(url) as response:
+                    body = await response.text()
+                    self.requests += 1
+                    self.bytes_received += len(body)
+                    if response.status != 200:
+                        print(f"    [WARNING] HTTP {response.status} for {url[:80]}")
+                        self.errors += 1
+                        return None, None
+                    return body, response.headers.get("Content-Type", "")
+            except Exception as e:
+                self.errors += 1
+                print(f"    [ERROR] {url[:80]}: {str(e)[:60]}")
+                return None, None
+
+    async def fetch_listing(self, url):
+        """
+        Fetches a listing and its following pages until a page adds no products.
+
+        Returns:
+            tuple: (product records, HTML of the first page or "")
+        """
+        records = []
+        seen = set()
+        first_body = ""
+        for page in range(self.max_pages):
+            body, content_type = await self.fetch(page_url(url, page))
+            if body is None:
+                break
+            if page == 0 and "json" not in content_type:
+                first_body = body
+
+            new_records = 0
+            for payload in payloads_from_body(body, content_type):
+                for record in catalog_capture.products_from_payload(payload):
+                    if record["product_url"] in seen:
+                        continue
+                    seen.add(record["product_url"])
+                    records.append(record)
+                    new_records += 1
+            if new_records == 0:
+                break
+        return records, first_body
+
+    async def fetch_category(self, definition, is_valid_product):
+        """
+        Fetches a category page and all its subcategories concurrently.
+
+        Args:
+            definition (dict): Category definition from categories.json
+            is_valid_product: The category's product filter
+
+        Returns:
+            list: Unique products (as_extracted() format) that passed is_valid_product(),
+            with scraped_at set
+        """
+        main_records, html = await self.fetch_listing(definition["url"])
+        sub_urls = subcategory_links(html, definition["url"], definition)
+        print(f"  Main page: {len(main_records)} products, {len(sub_urls)} subcategories")
+
+        results = await asyncio.gather(*(self.fetch_listing(url) for url in sub_urls))
+
+        products = []
+        seen = set()
+        scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for records in [main_records] + [records for records, _ in results]:
+            for record in records:
+                product = as_extracted(record)
+                if product["product_url"] in seen or not is_valid_product(product):
+                    continue
+                seen.add(product["product_url"])
+                product["scraped_at"] = scraped_at
+                products.append(product)
+        return products
+
+
+def fetch_categories(definitions, filters, session, concurrency=HTTP_CONCURRENCY):
+    """
+    Fetches several categories over HTTP.
+
+    Args:
+        definitions (list): Category definitions
+        filters (dict): Category key -> is_valid_product function
+        session (dict): Cookies and headers from session_from_driver()
+        concurrency (int): Maximum requests in flight
+
+    Returns:
+        dict: Category key -> list of products
+    """
+
+    async def run():
+        results = {}
+        async with HttpCatalogClient(session, concurrency=concurrency) as client:
+            start = time.time()
+            for definition in definitions:
+                print(f"\n[HTTP] {definition['name']}...")
+                results[definition["key"]] = await client.fetch_category(
+                    definition, filters[definition["key"]]
+                )
+                print(f"  [OK] {len(results[definition['key']])} products")
+            elapsed = time.time() - start
+            print(
+                f"\n[HTTP] {client.requests} requests, {client.bytes_received / 1024:.0f} KB, "
+                f"{client.errors} errors in {elapsed:.1f}s"
+            )
+        return results
+
+    return asyncio.run(run())
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Serves recorded catalog responses as Zepto-like listing pages.
+
+    Page N of any /cn/ listing embeds response N of the fixture in a
+    __NEXT_DATA__ script block; the root category page also links to two
+    subcategories. Used to exercise the fetcher offline.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real site
+    responses = []
+
+    def do_GET(self):
+        parts = urlparse(self.path)
+        page = int(dict(parse_qsl(parts.query)).get(PAGE_PARAM, 0))
+        segments = [s for s in parts.path.split("/") if s]
+        body = self.responses[page]["body"] if page < len(self.responses) else {"layout": []}
+
+        links = ""
+        if len(segments) == 3:
+            links = "".join(
+                f'<a href="/cn/{segments[1]}/{name}/cid/1/scid/{i}">{name}</a>'
+                for i, name in enumerate(["chips-crisps", "namkeen-snacks"], 1)
+            )
+        html = (
+            "<html><body>"
+            f"{links}"
+            '<script id="__NEXT_DATA__" type="application/json">'
+            f"{json.dumps(body)}</script></body></html>"
+        ).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(html)))
+        self.end_headers()
+        self.wfile.write(html)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stand_in_server(fixture_path=catalog_capture.FIXTURE_PATH, port=STAND_IN_PORT):
+    """Starts the stand-in server in a background thread. Returns the server."""
+    StandInHandler.responses = catalog_capture.load_fixture(fixture_path)
+    server = ThreadingHTTPServer(("127.0.0.1", port), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"[OK] Stand-in server on http://127.0.0.1:{port} ({len(StandInHandler.responses)} responses)")
+    return server
+
+
+def main():
+    if "--stand-in" not in sys.argv:
+        print(__doc__)
+        return
+
+    server = start_stand_in_server()
+    definition = {
+        "key": "stand_in",
+        "name": "Stand-in Munchies",
+        "url": f"http://127.0.0.1:{STAND_IN_PORT}/cn/munchies/munchies",
+        "subcategory_keywords": [],
+        "excluded_subcategory_keywords": [],
+    }
+    try:
+        start = time.time()
+        results = fetch_categories([definition], {"stand_in": lambda product: True}, {})
+        products = results["stand_in"]
+        print("\n" + "=" * 60)
+        print(f"[SUCCESS] Fetched {len(products)} products in {time.time() - start:.2f}s")
+        print("=" * 60)
+        for idx, product in enumerate(products, 1):
+            print(f"  [{idx}] {product['name'][:50]:<50} | ₹{product['price']}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
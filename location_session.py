@@ -0,0 +1,211 @@
+"""
+Persisted delivery-location sessions.
+
+After the location has been set once (automatically or by hand), the
+cookies and localStorage of the Zepto origin are saved per PIN code. Later
+runs restore them into a fresh browser and verify them with one script
+call, so the location step takes under a second and needs no prompt.
+set_location_whitefield() only runs when there is no saved session or the
+saved one no longer works.
+
+Saved sessions contain login/location cookies - keep the sessions/ folder private.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+import run_trace
+
+# Configuration
+SESSION_DIR = "sessions"
+SESSION_MAX_AGE_HOURS = 24 * 7  # Saved sessions older than this are not restored
+# Text shown in the header for a PIN code (keep in step with multi_location.PIN_CODES)
+LOCATION_NAMES = {
+    "560067": "Whitefield",
+    "560066": "ITPL",
+    "560037": "Marathahalli",
+    "560048": "Mahadevapura",
+    "560103": "Bellandur",
+    "560102": "HSR Layout",
+    "560034": "Koramangala",
+    "560038": "Indiranagar",
+}
+COOKIE_FIELDS = ["name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite"]
+
+# One round-trip check: does the page mention the PIN code or its area name?
+VERIFY_LOCATION_SCRIPT = """
+var text = (document.body ? document.body.innerText : '').toLowerCase();
+return arguments[0].some(function (needle) { return text.indexOf(needle) !== -1; });
+"""
+
+
+def session_path(pin_code):
+    """File the session for a PIN code is saved to."""
+    return os.path.join(SESSION_DIR, f"location_{pin_code}.json")
+
+
+def save_location_session(driver, pin_code):
+    """
+    Saves the cookies and localStorage of the current Zepto page for a PIN code.
+
+    Args:
+        driver: Selenium WebDriver instance on a Zepto page with the location set
+        pin_code (str): PIN code the location was set to
+    """
+    local_storage = driver.execute_script(
+        "var items = {};"
+        "for (var i = 0; i < localStorage.length; i++) {"
+        "  var key = localStorage.key(i); items[key] = localStorage.getItem(key);"
+        "}"
+        "return items;"
+    )
+    session = {
+        "pin_code": pin_code,
+        "url": driver.current_url,
+        "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "saved_ts": time.time(),
+        "cookies": driver.get_cookies(),
+        "local_storage": local_storage or {},
+    }
+
+    os.makedirs(SESSION_DIR, exist_ok=True)
+    path = session_path(pin_code)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(session, f, indent=2, ensure_ascii=False)
+    print(f"  [OK] Saved location session for {pin_code} to {path} "
+          f"({len(session['cookies'])} cookies, {len(session['local_storage'])} storage keys)")
+
+
+def load_location_session(pin_code, max_age_hours=SESSION_MAX_AGE_HOURS):
+    """
+    Loads the saved session for a PIN code.
+
+    Returns:
+        dict: Saved session, or None if there is none or it is too old
+    """
+    path = session_path(pin_code)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            session = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"  [WARNING] Could not read {path}: {e}")
+        return None
+
+    age_hours = (time.time() - session.get("saved_ts", 0)) / 3600
+    if age_hours > max_age_hours:
+        print(f"  [INFO] Saved location session for {pin_code} is {age_hours:.0f}h old, not using it")
+        return None
+    return session
+
+
+def location_needles(pin_code):
+    """Texts that show a page is set to a PIN code: the code and its area name, if known."""
+    needles = [pin_code]
+    if LOCATION_NAMES.get(pin_code):
+        needles.append(LOCATION_NAMES[pin_code])
+    return needles
+
+
+def verify_location(driver, pin_code):
+    """Cheap check that the current page shows the PIN code or its area name."""
+    needles = [needle.lower() for needle in location_needles(pin_code)]
+    try:
+        return bool(driver.execute_script(VERIFY_LOCATION_SCRIPT, needles))
+    except Exception:
+        return False
+
+
+def restore_location_session(driver, pin_code):
+    """
+    Restores a saved session into the browser and verifies it.
+
+    The driver must already be on a Zepto page (cookies can only be set for
+    the current domain).
+
+    Returns:
+        bool: True if the location was restored and verified
+    """
+    session = load_location_session(pin_code)
+    if not session:
+        return False
+
+    start = time.time()
+    now = time.time()
+    restored = 0
+    for cookie in session.get("cookies", []):
+        if cookie.get("expiry") and cookie["expiry"] < now:
+            continue
+        cookie = {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+        if "expiry" in cookie:
+            cookie["expiry"] = int(cookie["expiry"])
+        try:
+            driver.add_cookie(cookie)
+            restored += 1
+        except Exception:
+            # Cookie for another domain (e.g. a third-party host)
+            continue
+
+    driver.execute_script(
+        "var items = arguments[0];"
+        "Object.keys(items).forEach(function (key) { localStorage.setItem(key, items[key]); });",
+        session.get("local_storage", {}),
+    )
+
+    driver.refresh()
+    try:
+        WebDriverWait(driver, 15, poll_frequency=0.25).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+            and verify_location(d, pin_code)
+        )
+    except Exception:
+        print(f"  [WARNING] Saved location session for {pin_code} did not verify")
+        return False
+
+    print(f"  [OK] Location {pin_code} restored from saved session in {time.time() - start:.1f}s "
+          f"({restored} cookies)")
+    return True
+
+
+@run_trace.traced("location")
+def ensure_location(driver, pin_code, set_location=None, interactive=True):
+    """
+    Makes sure the browser has the delivery location set, as cheaply as possible.
+
+    Order: restore the saved session, then set_location(driver, pin_code=...)
+    (e.g. scraper.set_location_whitefield), then - if interactive - ask the
+    user. A location that was set and verified is saved for the next run.
+
+    Args:
+        driver: Selenium WebDriver instance on the Zepto homepage
+        pin_code (str): Delivery PIN code
+        set_location: Function that sets the location automatically
+        interactive (bool): Ask the user if the automatic steps fail
+
+    Returns:
+        bool: True if the location is set
+    """
+    if restore_location_session(driver, pin_code):
+        return True
+
+    location_set = bool(set_location and set_location(driver, pin_code=pin_code))
+    if not location_set and interactive:
+        print("\n" + "=" * 60)
+        print("IMPORTANT: Set location manually in the browser")
+        print("=" * 60)
+        print(f"\nPlease set the location to PIN code {pin_code}, then press Enter here.")
+        with run_trace.span("location_prompt", "wait"):
+            input("Press Enter after location is set...")
+        location_set = True
+
+    if location_set:
+        if verify_location(driver, pin_code):
+            save_location_session(driver, pin_code)
+        else:
+            print(f"  [WARNING] Could not verify location {pin_code} on the page, session not saved")
+    return location_set
@@ -0,0 +1,219 @@
+"""
+Multi-location runner: scrape several delivery PIN codes at once.
+
+Each PIN code runs in its own process with its own browser pool. Every
+session uses an isolated Chrome profile (profiles/<pin>/session_<n>), and
+the location is set once per session, restored from the saved location
+session when possible. Outputs go to output/locations/<pin>/ with every
+product tagged with its PIN code. Journals, fingerprints, trace and
+command files are kept per PIN too, so the runs never share state.
+LOCATION_CONCURRENCY (or --concurrency) caps how many locations run at
+once. Each one runs `--workers` Chrome instances, so size the two together
+for the host's cores and memory.
+
+At the end a combined report is written to output/locations/:
+report.json / report.csv (products per PIN and category, run time,
+status) and all_locations.csv (every product of every PIN, with its PIN
+code and category).
+
+Usage:
+    python multi_location.py                                  # PIN_CODES, all categories
+    python multi_location.py munchies --pins 560067 560066    # some categories and PINs
+    python multi_location.py --concurrency 4 --workers 1 --headless
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+import category_engine
+import scraper
+from browser_pool import SessionPool
+
+# Configuration
+PIN_CODES = [
+    "560067",  # Whitefield
+    "560066",  # Whitefield / ITPL
+    "560037",  # Marathahalli
+    "560048",  # Mahadevapura
+    "560103",  # Bellandur
+    "560102",  # HSR Layout
+    "560034",  # Koramangala
+    "560038",  # Indiranagar
+]
+LOCATION_CONCURRENCY = max(1, min(4, (os.cpu_count() or 2) // 2))  # Locations scraped at once
+PROFILE_DIR = "profiles"  # Chrome profiles: profiles/<pin>/session_<n>
+REPORT_JSON = os.path.join(category_engine.LOCATION_OUTPUT_DIR, "report.json")
+REPORT_CSV = os.path.join(category_engine.LOCATION_OUTPUT_DIR, "report.csv")
+COMBINED_CSV = os.path.join(category_engine.LOCATION_OUTPUT_DIR, "all_locations.csv")
+
+
+def scrape_location(pin_code, keys, workers=1, driver_path=None, headless=scraper.HEADLESS_MODE,
+                    resume=False, incremental=False):
+    """
+    Scrapes the categories for one PIN code (runs in a worker process).
+
+    The process's output goes to output/locations/<pin>/run.log.
+
+    Returns:
+        dict: pin_code, status ("ok"/"error"), products per category, seconds, log, error
+    """
+    location_dir = os.path.join(category_engine.LOCATION_OUTPUT_DIR, pin_code)
+    os.makedirs(location_dir, exist_ok=True)
+    log_path = os.path.join(location_dir, "run.log")
+    result = {"pin_code": pin_code, "status": "ok", "products": {}, "log": log_path, "error": None}
+    start = time.time()
+
+    with open(log_path, "w", encoding="utf-8", buffering=1) as log:
+        sys.stdout = sys.stderr = log
+        pool = SessionPool(size=max(1, workers), pin_code=pin_code, headless=headless,
+                           interactive=False, require_location=True,
+                           profile_dir=os.path.join(PROFILE_DIR, pin_code), driver_path=driver_path)
+        try:
+            pool.start()
+            result["products"] = category_engine.run_categories(
+                keys, workers=workers, resume=resume, incremental=incremental, pool=pool, pin_code=pin_code
+            )
+        except Exception as e:
+            import traceback
+
+            traceback.print_exc()
+            result.update(status="error", error=str(e))
+        finally:
+            pool.close()
+            sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+
+    result["seconds"] = round(time.time() - start, 1)
+    return result
+
+
+def write_report(results, keys):
+    """Writes report.json, report.csv and the combined all_locations.csv."""
+    categories = category_engine.load_categories()
+    os.makedirs(category_engine.LOCATION_OUTPUT_DIR, exist_ok=True)
+
+    with open(REPORT_JSON, "w", encoding="utf-8") as f:
+        json.dump({"run_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "categories": keys,
+                   "locations": results}, f, indent=2, ensure_ascii=False)
+
+    with open(REPORT_CSV, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["pin_code", "category", "products", "status", "seconds"])
+        for result in results:
+            for key in keys:
+                writer.writerow([result["pin_code"], key, result["products"].get(key, 0),
+                                 result["status"], result["seconds"]])
+
+    combined = 0
+    fieldnames = ["pin_code", "category"] + category_engine.CSV_FIELDNAMES
+    with open(COMBINED_CSV, "w", newline="", encoding="utf-8") as out:
+        writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        for result in results:
+            for key in keys:
+                path = category_engine.localize_definition(categories[key], result["pin_code"])["output_csv"]
+                if not os.path.exists(path):
+                    continue
+                with open(path, "r", newline="", encoding="utf-8") as f:
+                    for row in csv.DictReader(f):
+                        row.update(pin_code=result["pin_code"], category=key)
+                        writer.writerow(row)
+                        combined += 1
+
+    print(f"\nReport saved to {REPORT_JSON} and {REPORT_CSV}")
+    print(f"{combined} products from {len(results)} location(s) saved to {COMBINED_CSV}")
+
+
+def run_locations(pin_codes=None, keys=None, concurrency=LOCATION_CONCURRENCY, workers=1,
+                  headless=scraper.HEADLESS_MODE, resume=False, incremental=False):
+    """
+    Scrapes several PIN codes concurrently, one process per location.
+
+    Args:
+        pin_codes (list): Delivery PIN codes (default: PIN_CODES)
+        keys (list): Category keys (default: all)
+        concurrency (int): Locations scraped at once
+        workers (int): Browser sessions per location
+        headless (bool): Run the browsers headless
+        resume (bool): Continue interrupted crawls of each location
+        incremental (bool): Skip subcategories unchanged since that location's last run
+
+    Returns:
+        list: One result dict per PIN code (see scrape_location)
+    """
+    pin_codes = pin_codes or PIN_CODES
+    keys = keys or list(category_engine.load_categories())
+    concurrency = max(1, min(concurrency, len(pin_codes)))
+
+    print("=" * 60)
+    print(f"Multi-location run: {len(pin_codes)} PIN codes, {len(keys)} categories, "
+          f"{concurrency} at a time x {workers} browser(s)")
+    print("=" * 60)
+    # Install once here instead of racing on the webdriver-manager cache in every process
+    driver_path = ChromeDriverManager().install()
+
+    results = []
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(scrape_location, pin_code, keys, workers, driver_path, headless,
+                            resume, incremental): pin_code
+            for pin_code in pin_codes
+        }
+        for future in as_completed(futures):
+            pin_code = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died
+                result = {"pin_code": pin_code, "status": "error", "products": {}, "seconds": 0,
+                          "log": None, "error": str(e)}
+            results.append(result)
+            if result["status"] == "ok":
+                print(f"  [OK] {pin_code}: {sum(result['products'].values())} products "
+                      f"in {result['seconds']:.0f}s")
+            else:
+                print(f"  [ERROR] {pin_code}: {result['error']} (see {result['log']})")
+
+    results.sort(key=lambda r: pin_codes.index(r["pin_code"]))
+    print("\n" + "=" * 60)
+    print(f"{'PIN':<10}" + "".join(f"{key[:12]:>14}" for key in keys) + f"{'Total':>10}")
+    for result in results:
+        counts = [result["products"].get(key, 0) for key in keys]
+        print(f"{result['pin_code']:<10}" + "".join(f"{count:>14}" for count in counts) + f"{sum(counts):>10}")
+    print(f"\nFinished {len(results)} location(s) in {time.time() - start:.0f}s")
+    print("=" * 60)
+
+    write_report(results, keys)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape several delivery locations concurrently.")
+    parser.add_argument("categories", nargs="*", help="Category keys (or parts of keys) to run")
+    parser.add_argument("--pins", nargs="+", help="PIN codes (default: PIN_CODES)")
+    parser.add_argument("--concurrency", type=int, default=LOCATION_CONCURRENCY, help="Locations scraped at once")
+    parser.add_argument("--workers", type=int, default=1, help="Browser sessions per location")
+    parser.add_argument("--headless", action="store_true", help="Run the browsers headless")
+    parser.add_argument("--resume", action="store_true", help="Continue interrupted crawls")
+    parser.add_argument("--incremental", action="store_true", help="Skip subcategories unchanged since the last run")
+    args = parser.parse_args()
+
+    keys = category_engine.select_categories(args.categories)
+    if not keys:
+        print(f"No categories match: {' '.join(args.categories)}")
+        return
+    run_locations(args.pins, keys, concurrency=args.concurrency, workers=args.workers,
+                  headless=args.headless or scraper.HEADLESS_MODE, resume=args.resume,
+                  incremental=args.incremental)
+
+
+if __name__ == "__main__":
+    main()
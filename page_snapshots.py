@@ -0,0 +1,198 @@
+"""
+Offline page snapshots: record the product grid, replay the extraction.
+
+Record mode (python category_engine.py --record-snapshots) saves the
+scrolled product-grid HTML of every page the crawler extracts, gzipped,
+to output/snapshots/<key>/<timestamp>_<url hash>.html.gz, with one line
+per snapshot (key, URL, time, size) in output/snapshots/index.jsonl.
+
+Replay mode runs html_extraction and each category's is_valid_product()
+over the saved snapshots - no browser, no network - and reports products
+and parse time per snapshot:
+
+    python page_snapshots.py                      # every snapshot
+    python page_snapshots.py munchies --since 2026-09-01
+    python page_snapshots.py munchies --output output/replay
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import json
+import os
+import time
+from datetime import datetime
+
+import html_extraction
+
+# Configuration
+SNAPSHOT_DIR = "output/snapshots"
+SNAPSHOT_INDEX = os.path.join(SNAPSHOT_DIR, "index.jsonl")
+RECORD_SNAPSHOTS = False  # True = save the grid HTML of every extracted page
+SNAPSHOT_COMPRESS_LEVEL = 6
+
+# Smallest element holding every product link (falls back to <body>)
+GRID_HTML_SCRIPT = r"""
+var links = document.querySelectorAll("a[href*='/pn/']");
+var grid = links.length ? links[0].parentElement : document.body;
+for (var i = 1; i < links.length && grid && grid !== document.body; i++) {
+    while (grid && !grid.contains(links[i])) { grid = grid.parentElement; }
+}
+return (grid || document.body).outerHTML;
+"""
+
+
+def grid_html(driver):
+    """outerHTML of the current page's product grid."""
+    return driver.execute_script(GRID_HTML_SCRIPT) or ""
+
+
+def save_snapshot(driver, key, url=None):
+    """
+    Saves the current page's product grid for offline replay.
+
+    Args:
+        driver: Selenium WebDriver instance on a scrolled listing page
+        key (str): Category key
+        url (str): Page URL (default: driver.current_url)
+
+    Returns:
+        str: Path of the snapshot file
+    """
+    url = url or driver.current_url
+    html = grid_html(driver)
+    now = datetime.now()
+    url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()[:10]
+    path = os.path.join(SNAPSHOT_DIR, key, f"{now.strftime('%Y%m%d-%H%M%S')}_{url_hash}.html.gz")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=SNAPSHOT_COMPRESS_LEVEL) as f:
+        f.write(html)
+    with open(SNAPSHOT_INDEX, "a", encoding="utf-8") as f:
+        f.write(json.dumps({
+            "key": key,
+            "url": url,
+            "saved_at": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "path": path,
+            "html_bytes": len(html.encode("utf-8")),
+            "gzip_bytes": os.path.getsize(path),
+        }, ensure_ascii=False) + "\n")
+    print(f"  [OK] Snapshot saved to {path} ({len(html) / 1024:.0f} KB HTML)")
+    return path
+
+
+def load_snapshots(keys=None, since=None):
+    """
+    Index entries of the saved snapshots.
+
+    Args:
+        keys (list): Only these category keys (default: all)
+        since (str): Only snapshots saved on or after this date (YYYY-MM-DD)
+
+    Returns:
+        list: Index entries whose snapshot file still exists, oldest first
+    """
+    if not os.path.exists(SNAPSHOT_INDEX):
+        return []
+    entries = []
+    with open(SNAPSHOT_INDEX, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if keys and entry["key"] not in keys:
+                continue
+            if since and entry["saved_at"] < since:
+                continue
+            if os.path.exists(entry["path"]):
+                entries.append(entry)
+    return entries
+
+
+def read_snapshot(entry):
+    """HTML of one snapshot."""
+    with gzip.open(entry["path"], "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+def replay(keys=None, since=None, output_dir=None, parser=None):
+    """
+    Runs the extraction over saved snapshots.
+
+    Args:
+        keys (list): Category keys (or parts of keys) to replay (default: all)
+        since (str): Only snapshots saved on or after this date (YYYY-MM-DD)
+        output_dir (str): Write each category's replayed products to <output_dir>/<key>.json
+        parser (str): HTML parser backend (default: html_extraction.HTML_PARSER)
+
+    Returns:
+        dict: Category key -> {"snapshots", "products", "seconds"}
+    """
+    import category_engine
+
+    categories = category_engine.load_categories()
+    if keys:
+        keys = category_engine.select_categories(keys, categories)
+    entries = load_snapshots(keys, since)
+    if not entries:
+        print(f"No snapshots found in {SNAPSHOT_INDEX}")
+        return {}
+
+    backend = html_extraction.get_backend(parser)
+    results = {}
+    products_by_key = {}
+    for entry in entries:
+        key = entry["key"]
+        if key not in categories:
+            print(f"  [SKIP] {entry['path']}: unknown category {key}")
+            continue
+        definition = categories[key]
+        module = importlib.import_module(definition["script"])
+        html = read_snapshot(entry)
+
+        start = time.perf_counter()
+        products = html_extraction.extract_products_from_html(
+            html, definition, module.is_valid_product, page_url=entry["url"], backend=backend
+        )
+        seconds = time.perf_counter() - start
+
+        stats = results.setdefault(key, {"snapshots": 0, "products": 0, "seconds": 0.0})
+        stats["snapshots"] += 1
+        stats["products"] += len(products)
+        stats["seconds"] += seconds
+        products_by_key.setdefault(key, []).extend(products)
+        print(f"  {entry['saved_at']}  {key:<22} {len(products):>5} products {seconds * 1000:>8.1f} ms"
+              f"  {entry['url'][-50:]}")
+
+    print("\n" + "=" * 60)
+    print(f"Replayed {len(entries)} snapshot(s) with {backend.name}")
+    print("=" * 60)
+    for key, stats in results.items():
+        print(f"  {key:<22} {stats['snapshots']:>4} snapshots {stats['products']:>6} products "
+              f"{stats['seconds']:>8.2f}s")
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        for key, products in products_by_key.items():
+            path = os.path.join(output_dir, f"{key}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(products, f, indent=2, ensure_ascii=False)
+            print(f"  [OK] {len(products)} products written to {path}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay saved page snapshots through the extraction.")
+    parser.add_argument("categories", nargs="*", help="Category keys to replay (default: all)")
+    parser.add_argument("--since", help="Only snapshots saved on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--output", help="Directory for the replayed products (one JSON file per category)")
+    parser.add_argument("--parser", choices=["lxml", "html.parser"], help="HTML parser backend")
+    args = parser.parse_args()
+
+    replay(args.categories or None, since=args.since, output_dir=args.output, parser=args.parser)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Parallel subcategory crawling with a pool of browser workers.
+
+The subcategory URLs returned by find_subcategories() are put on a queue
+that K worker threads drain, each leasing its own warm browser from a
+browser_pool.SessionPool. New products are merged into the caller's
+product sink under a lock; the sink (or its SQLite store) drops the
+duplicates. A per-worker throughput summary is printed at the end.
+"""
+
+import queue
+import threading
+import time
+
+import catalog_capture
+import scraper
+
+# Configuration
+PARALLEL_WORKERS = 3  # Default number of browser workers
+
+
+class WorkerStats:
+    """Throughput counters for one worker thread."""
+
+    def __init__(self, worker_id):
+        self.worker_id = worker_id
+        self.subcategories = 0
+        self.products_found = 0
+        self.products_added = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+
+def crawl_subcategories(pool, subcategory_urls, subcategory_names, scroll_page,
+                        extract_products, all_products,
+                        workers=PARALLEL_WORKERS, scroll_times=30, on_done=None,
+                        crawl_page=None):
+    """
+    Crawls subcategories concurrently and merges the results.
+
+    Args:
+        pool: browser_pool.SessionPool with at least `workers` sessions
+        subcategory_urls (list): Subcategory URLs to visit
+        subcategory_names (list): Display names matching subcategory_urls
+        scroll_page: The category script's scroll_page(driver, times)
+        extract_products: The category script's extract_products(driver)
+        all_products (ProductSink): Shared product sink, extended in place
+        workers (int): Number of worker threads
+        scroll_times (int): Maximum scrolls per subcategory
+        on_done: Optional on_done(sub_url, added_count), called under the merge
+            lock after a subcategory's products were merged (e.g. for a journal)
+        crawl_page: Optional crawl_page(driver, url) -> products that replaces
+            the built-in open/scroll/extract steps
+
+    Returns:
+        list: WorkerStats for every worker
+    """
+    tasks = queue.Queue()
+    for idx, (sub_url, sub_name) in enumerate(zip(subcategory_urls, subcategory_names), 1):
+        tasks.put((idx, sub_url, sub_name))
+
+    merge_lock = threading.Lock()
+    stats = [WorkerStats(worker_id) for worker_id in range(1, workers + 1)]
+    total = len(subcategory_urls)
+
+    def worker(worker_stats):
+        while True:
+            try:
+                idx, sub_url, sub_name = tasks.get_nowait()
+            except queue.Empty:
+                return
+
+            start = time.time()
+            try:
+                with pool.lease() as session:
+                    driver = session.driver
+                    print(f"\n  [W{worker_stats.worker_id}] [{idx}/{total}] Extracting from: {sub_name[:50]}")
+                    if crawl_page is not None:
+                        sub_products = crawl_page(driver, sub_url)
+                    else:
+                        catalog_capture.discard(driver)
+                        if not scraper.navigate_and_wait(driver, sub_url):
+                            print(f"    [W{worker_stats.worker_id}] [INFO] No price elements found initially, scrolling anyway...")
+                        scroll_page(driver, times=scroll_times)
+                        sub_products = extract_products(driver)
+
+                with merge_lock:
+                    added_count = all_products.extend(
+                        [product for product in sub_products if product.get("product_url")],
+                        subcategory=sub_name,
+                    )
+                    running_total = len(all_products)
+                    if on_done:
+                        on_done(sub_url, added_count)
+
+                worker_stats.subcategories += 1
+                worker_stats.products_found += len(sub_products)
+                worker_stats.products_added += added_count
+                print(
+                    f"    [W{worker_stats.worker_id}] Extracted {added_count} new products "
+                    f"from {sub_name[:40]} (total: {running_total})"
+                )
+            except Exception as e:
+                worker_stats.errors += 1
+                print(f"    [W{worker_stats.worker_id}] [ERROR] Failed to extract from {sub_name}: {str(e)}")
+            finally:
+                worker_stats.busy_seconds += time.time() - start
+                tasks.task_done()
+
+    print(f"\n  Crawling {total} subcategories with {workers} parallel browser workers...")
+    wall_start = time.time()
+    threads = [
+        threading.Thread(target=worker, args=(worker_stats,), name=f"crawl-worker-{worker_stats.worker_id}")
+        for worker_stats in stats
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print_throughput_summary(stats, time.time() - wall_start)
+    return stats
+
+
+def print_throughput_summary(stats, wall_seconds):
+    """Prints a per-worker throughput table."""
+    print("\n" + "=" * 60)
+    print("Parallel crawl summary")
+    print("=" * 60)
+    print(f"  {'Worker':<8}{'Subcats':>9}{'Found':>8}{'New':>7}{'Errors':>8}{'Busy s':>9}{'Subcat/min':>12}")
+    for s in stats:
+        rate = s.subcategories / (s.busy_seconds / 60) if s.busy_seconds else 0.0
+        print(
+            f"  W{s.worker_id:<7}{s.subcategories:>9}{s.products_found:>8}"
+            f"{s.products_added:>7}{s.errors:>8}{s.busy_seconds:>9.1f}{rate:>12.2f}"
+        )
+    done = sum(s.subcategories for s in stats)
+    overall = done / (wall_seconds / 60) if wall_seconds else 0.0
+    print(f"  Wall time: {wall_seconds:.1f}s, {done} subcategories, {overall:.2f} subcategories/min overall")
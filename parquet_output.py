@@ -0,0 +1,204 @@
+"""
+Typed Parquet output.
+
+The CSV/JSON files keep every field as display text ("₹45", "500 g",
+"N/A"), so every consumer has to parse them again. With pyarrow
+installed, each saved category is also written as Parquet next to its
+CSV, with typed columns:
+
+    price_paise, discount_paise     integer paise (null when missing)
+    quantity_value, quantity_unit   normalized quantity (kg -> g, l -> ml)
+    scraped_at                      timestamp
+    category, subcategory           dictionary-encoded strings
+
+    output/zepto_munchies.parquet
+    output/zepto_master_catalog.parquet   (one row per product, all its categories)
+
+A whole catalog then loads column-wise with pyarrow.parquet.read_table()
+or pandas.read_parquet(). Products are streamed from the sink in batches
+of PARQUET_BATCH_SIZE, and each file is written under a temporary name
+and renamed into place.
+
+Needs pyarrow (optional dependency); without it only CSV/JSON are written.
+
+Usage:
+    python parquet_output.py output/zepto_munchies.parquet   # schema and row count
+"""
+
+import argparse
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency, Parquet output is skipped without it
+    pa = None
+    pq = None
+
+import product_fields
+import product_store
+
+# Configuration
+PARQUET_COMPRESSION = "zstd"
+PARQUET_BATCH_SIZE = 10000  # Rows converted and written at a time
+
+
+def _dictionary():
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def catalog_schema():
+    """Arrow schema of a category's Parquet file."""
+    return pa.schema([
+        ("product_id", pa.string()),
+        ("name", pa.string()),
+        ("price_paise", pa.int64()),
+        ("discount_paise", pa.int64()),
+        ("quantity_value", pa.float64()),
+        ("quantity_unit", _dictionary()),
+        ("image_url", pa.string()),
+        ("product_url", pa.string()),
+        ("category", _dictionary()),
+        ("subcategory", _dictionary()),
+        ("pin_code", _dictionary()),
+        ("scraped_at", pa.timestamp("s")),
+    ])
+
+
+def master_schema():
+    """Arrow schema of the master catalog's Parquet file."""
+    return pa.schema([
+        ("product_id", pa.string()),
+        ("name", pa.string()),
+        ("price_paise", pa.int64()),
+        ("discount_paise", pa.int64()),
+        ("quantity_value", pa.float64()),
+        ("quantity_unit", _dictionary()),
+        ("image_url", pa.string()),
+        ("product_url", pa.string()),
+        ("categories", pa.list_(_dictionary())),
+        ("subcategories", pa.list_(_dictionary())),
+        ("pin_code", _dictionary()),
+        ("first_seen", pa.timestamp("s")),
+        ("last_seen", pa.timestamp("s")),
+    ])
+
+
+def parquet_path(output_csv):
+    """Parquet file that goes with a CSV output file."""
+    return os.path.splitext(output_csv)[0] + ".parquet"
+
+
+def _batches(rows, size=PARQUET_BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _write(rows, path, schema, to_columns):
+    """Streams rows into one Parquet file, batch by batch. Returns the row count."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    count = 0
+    with pq.ParquetWriter(path + ".tmp", schema, compression=PARQUET_COMPRESSION) as writer:
+        for batch in _batches(rows):
+            columns = {name: [] for name in schema.names}
+            for row in batch:
+                for name, value in to_columns(row).items():
+                    columns[name].append(value)
+            writer.write_table(pa.table(columns, schema=schema))
+            count += len(batch)
+    os.replace(path + ".tmp", path)
+    return count
+
+
+def write_products(products, path, category=None, subcategories=None, pin_code=""):
+    """
+    Writes a category's products as typed Parquet.
+
+    Args:
+        products (iterable): Product dictionaries (e.g. sink.iter_products())
+        path (str): Parquet file to write
+        category (str): Category key
+        subcategories (dict): Product ID -> subcategory name
+        pin_code (str): Delivery PIN code of the products
+
+    Returns:
+        int: Number of products written (0 without pyarrow)
+    """
+    if pq is None:
+        print("  [SKIP] pyarrow is not installed, Parquet output not written")
+        return 0
+    subcategories = subcategories or {}
+
+    def to_columns(product):
+        product_id = product_store.product_id(product)
+        return dict(
+            product_fields.typed_fields(product),
+            product_id=product_id,
+            name=product.get("name"),
+            image_url=product.get("image_url"),
+            product_url=product.get("product_url"),
+            category=category,
+            subcategory=subcategories.get(product_id),
+            pin_code=product.get("pin_code") or pin_code or None,
+            scraped_at=product_fields.parse_timestamp(product.get("scraped_at")),
+        )
+
+    count = _write(products, path, catalog_schema(), to_columns)
+    print(f"  - {path} ({count} rows)")
+    return count
+
+
+def write_master(rows, path):
+    """
+    Writes the master catalog (product_identity.master_catalog() rows) as typed Parquet.
+
+    Returns:
+        int: Number of products written (0 without pyarrow)
+    """
+    if pq is None:
+        print("  [SKIP] pyarrow is not installed, Parquet output not written")
+        return 0
+
+    def to_columns(row):
+        return dict(
+            product_fields.typed_fields(row),
+            product_id=row["product_id"],
+            name=row.get("name"),
+            image_url=row.get("image_url"),
+            product_url=row.get("product_url"),
+            categories=[value for value in (row.get("categories") or "").split("; ") if value],
+            subcategories=[value for value in (row.get("subcategories") or "").split("; ") if value],
+            pin_code=row.get("pin_code") or None,
+            first_seen=product_fields.parse_timestamp(row.get("first_seen")),
+            last_seen=product_fields.parse_timestamp(row.get("last_seen")),
+        )
+
+    count = _write(rows, path, master_schema(), to_columns)
+    print(f"  - {path}")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the schema and size of a Parquet output file.")
+    parser.add_argument("path", help="Parquet file")
+    args = parser.parse_args()
+
+    if pq is None:
+        print("[ERROR] pyarrow is not installed (pip install pyarrow)")
+        return
+    parquet_file = pq.ParquetFile(args.path)
+    print("=" * 60)
+    print(f"{args.path}: {parquet_file.metadata.num_rows} rows in "
+          f"{parquet_file.metadata.num_row_groups} row group(s)")
+    print("=" * 60)
+    print(parquet_file.schema_arrow)
+
+
+if __name__ == "__main__":
+    main()
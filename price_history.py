@@ -0,0 +1,317 @@
+"""
+Columnar price history.
+
+Every run's CSV/JSON output replaces the previous one. The price history
+keeps them all: after each category is saved, its products are appended
+as a new Parquet file, partitioned by date and category:
+
+    output/history/date=2026-10-17/category=munchies/part-093012-1a2b3c4d.parquet
+
+Files are never rewritten in place. Prices and discounts are integer
+paise, quantities a normalized value and unit (product_fields.py), and
+scraped_at a timestamp. Queries only open the partitions they need:
+
+    price_series(product_id)        one product over time; its category comes
+                                    from the SQLite product store, so other
+                                    categories are never read
+    snapshot(category, at)          a category as of its last run before `at`,
+                                    reading newest dates first
+
+compact() merges the part files of partitions older than
+COMPACT_AFTER_DAYS into one file each.
+
+Needs pyarrow (optional dependency); without it nothing is written.
+
+Usage:
+    python price_history.py series 1a2b3c4d-...           # price series of a product
+    python price_history.py snapshot munchies --at "2026-10-01 12:00:00"
+    python price_history.py partitions
+    python price_history.py compact --older-than 30
+"""
+
+import argparse
+import glob
+import os
+import uuid
+from datetime import datetime, timedelta
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency, the history is skipped without it
+    pa = None
+    pq = None
+
+import product_fields
+import product_store
+
+# Configuration
+HISTORY_DIR = "output/history"
+HISTORY_COMPRESSION = "zstd"
+COMPACT_AFTER_DAYS = 30  # compact() merges partitions older than this
+COMPACTED_FILE = "compacted.parquet"
+
+
+def history_schema():
+    """Arrow schema of the history files (date and category are partition keys)."""
+    return pa.schema([
+        ("product_id", pa.string()),
+        ("name", pa.string()),
+        ("price_paise", pa.int64()),
+        ("discount_paise", pa.int64()),
+        ("quantity_value", pa.float64()),
+        ("quantity_unit", pa.string()),
+        ("product_url", pa.string()),
+        ("subcategory", pa.string()),
+        ("pin_code", pa.string()),
+        ("run_id", pa.string()),
+        ("scraped_at", pa.timestamp("s")),
+    ])
+
+
+def partition_dir(date, category, root=HISTORY_DIR):
+    """Directory of one partition (date is YYYY-MM-DD)."""
+    return os.path.join(root, f"date={date}", f"category={category}")
+
+
+def partitions(category=None, start=None, end=None, root=HISTORY_DIR):
+    """
+    Partitions on disk, found from the directory names alone.
+
+    Args:
+        category (str): Only this category key
+        start (str): Only dates on or after this one (YYYY-MM-DD)
+        end (str): Only dates on or before this one (YYYY-MM-DD)
+
+    Returns:
+        list: (date, category, directory), oldest date first
+    """
+    found = []
+    for path in glob.glob(os.path.join(root, "date=*", "category=*")):
+        date = os.path.basename(os.path.dirname(path))[len("date="):]
+        key = os.path.basename(path)[len("category="):]
+        if category and key != category:
+            continue
+        if (start and date < start) or (end and date > end):
+            continue
+        found.append((date, key, path))
+    return sorted(found)
+
+
+def _files(directory):
+    return sorted(glob.glob(os.path.join(directory, "*.parquet")))
+
+
+def append(products, category, run_id=None, pin_code="", subcategories=None, root=HISTORY_DIR):
+    """
+    Appends one run's products of a category to the history.
+
+    Args:
+        products (iterable): Product dictionaries (with scraped_at)
+        category (str): Category key (partition)
+        run_id (str): Run the products came from (default: a new ID)
+        pin_code (str): Delivery PIN code of the products
+        subcategories (dict): Product ID -> subcategory name
+        root (str): History directory
+
+    Returns:
+        list: Paths of the written part files (one per scraped_at date)
+    """
+    if pq is None:
+        print("  [SKIP] pyarrow is not installed, price history not written")
+        return []
+    run_id = run_id or uuid.uuid4().hex
+    subcategories = subcategories or {}
+    now = datetime.now().replace(microsecond=0)
+
+    columns_by_date = {}
+    for product in products:
+        product_id = product_store.product_id(product)
+        scraped_at = product_fields.parse_timestamp(product.get("scraped_at")) or now
+        columns = columns_by_date.setdefault(scraped_at.strftime("%Y-%m-%d"),
+                                             {name: [] for name in history_schema().names})
+        columns["product_id"].append(product_id)
+        columns["name"].append(product.get("name"))
+        for name, value in product_fields.typed_fields(product).items():
+            columns[name].append(value)
+        columns["product_url"].append(product.get("product_url"))
+        columns["subcategory"].append(subcategories.get(product_id))
+        columns["pin_code"].append(product.get("pin_code") or pin_code)
+        columns["run_id"].append(run_id)
+        columns["scraped_at"].append(scraped_at)
+
+    paths = []
+    for date, columns in columns_by_date.items():
+        table = pa.table(columns, schema=history_schema()).sort_by("product_id")
+        directory = partition_dir(date, category, root)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{now.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet")
+        pq.write_table(table, path + ".tmp", compression=HISTORY_COMPRESSION)
+        os.replace(path + ".tmp", path)
+        paths.append(path)
+    if paths:
+        rows = sum(len(columns["product_id"]) for columns in columns_by_date.values())
+        print(f"  [OK] {rows} prices appended to the history ({category})")
+    return paths
+
+
+def _read(directories, filters=None, columns=None):
+    """Rows of every part file in the directories, as one table."""
+    tables = [
+        pq.read_table(path, filters=filters, columns=columns, schema=history_schema())
+        for directory in directories
+        for path in _files(directory)
+    ]
+    tables = [table for table in tables if table.num_rows]
+    if not tables:
+        return history_schema().empty_table().select(columns or history_schema().names)
+    return pa.concat_tables(tables)
+
+
+def _category_of(product_id, store_path=product_store.STORE_PATH):
+    """Category of a product according to the SQLite product store (None if unknown)."""
+    if not os.path.exists(store_path):
+        return None
+    with product_store.ProductStore(store_path) as store:
+        return store.category_of(product_id)
+
+
+def price_series(product_id, category=None, start=None, end=None, pin_code=None, root=HISTORY_DIR):
+    """
+    Price history of one product.
+
+    Args:
+        product_id (str): /pvid/ product ID
+        category (str): Its category key (default: looked up in the product
+            store; every category is read only if the store does not know it)
+        start (str): First date to read (YYYY-MM-DD)
+        end (str): Last date to read (YYYY-MM-DD)
+        pin_code (str): Only this PIN code
+
+    Returns:
+        list: {scraped_at, price_paise, discount_paise, quantity_value,
+            quantity_unit, name, pin_code, run_id} rows, oldest first
+    """
+    category = category or _category_of(product_id)
+    directories = [path for _, _, path in partitions(category, start, end, root)]
+    filters = [("product_id", "==", product_id)]
+    if pin_code is not None:
+        filters.append(("pin_code", "==", pin_code))
+    table = _read(directories, filters=filters)
+    rows = table.sort_by("scraped_at").to_pylist()
+    return [
+        {key: row[key] for key in ("scraped_at", "price_paise", "discount_paise", "quantity_value",
+                                   "quantity_unit", "name", "pin_code", "run_id")}
+        for row in rows
+    ]
+
+
+def snapshot(category, at=None, pin_code=None, root=HISTORY_DIR):
+    """
+    A category's products as of its last run at or before `at`.
+
+    Partitions are read newest date first, and reading stops at the first
+    date that has rows before `at`.
+
+    Args:
+        category (str): Category key
+        at (datetime or str): Point in time (default: now)
+        pin_code (str): Only this PIN code
+
+    Returns:
+        list: Product rows of that run (see history_schema())
+    """
+    at = product_fields.parse_timestamp(at) or at or datetime.now()
+    filters = [("scraped_at", "<=", at)]
+    if pin_code is not None:
+        filters.append(("pin_code", "==", pin_code))
+    dated = partitions(category, end=at.strftime("%Y-%m-%d"), root=root)
+
+    for idx in range(len(dated) - 1, -1, -1):
+        table = _read([dated[idx][2]], filters=filters)
+        if not table.num_rows:
+            continue
+        # The run with the latest row, possibly started the day before
+        latest = table.sort_by([("scraped_at", "descending")]).slice(0, 1).to_pylist()[0]
+        run_filters = filters + [("run_id", "==", latest["run_id"])]
+        directories = [path for _, _, path in dated[max(0, idx - 1):idx + 1]]
+        return _read(directories, filters=run_filters).sort_by("product_id").to_pylist()
+    return []
+
+
+def compact(older_than_days=COMPACT_AFTER_DAYS, root=HISTORY_DIR):
+    """
+    Merges each old partition's part files into one file.
+
+    The merged file is written next to the parts and only then are the
+    parts removed, so a crash can leave duplicate rows but never loses
+    any. Rows are sorted by product and time.
+
+    Returns:
+        int: Number of partitions compacted
+    """
+    if pq is None:
+        print("[ERROR] pyarrow is not installed")
+        return 0
+    cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime("%Y-%m-%d")
+    compacted = 0
+    for date, category, directory in partitions(root=root):
+        if date >= cutoff:
+            continue
+        files = _files(directory)
+        if len(files) <= 1:
+            continue
+        table = pa.concat_tables([pq.read_table(path, schema=history_schema()) for path in files])
+        table = table.sort_by([("product_id", "ascending"), ("scraped_at", "ascending")])
+        path = os.path.join(directory, COMPACTED_FILE)
+        pq.write_table(table, path + ".tmp", compression=HISTORY_COMPRESSION)
+        os.replace(path + ".tmp", path)
+        for old in files:
+            if old != path:
+                os.remove(old)
+        compacted += 1
+        print(f"  [OK] {date} {category}: {len(files)} files -> 1 ({table.num_rows} rows)")
+    print(f"Compacted {compacted} partition(s) older than {cutoff}")
+    return compacted
+
+
+def _rupees(paise):
+    return "N/A" if paise is None else f"₹{paise / 100:g}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query and compact the Parquet price history.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    series_parser = commands.add_parser("series", help="Price series of one product")
+    series_parser.add_argument("product_id", help="/pvid/ product ID")
+    series_parser.add_argument("--category", help="Category key (default: from the product store)")
+    snapshot_parser = commands.add_parser("snapshot", help="A category as of a point in time")
+    snapshot_parser.add_argument("category", help="Category key")
+    snapshot_parser.add_argument("--at", help="YYYY-MM-DD HH:MM:SS (default: now)")
+    commands.add_parser("partitions", help="List the partitions")
+    compact_parser = commands.add_parser("compact", help="Merge the part files of old partitions")
+    compact_parser.add_argument("--older-than", type=int, default=COMPACT_AFTER_DAYS, help="Age in days")
+    args = parser.parse_args()
+
+    if pq is None and args.command != "partitions":
+        print("[ERROR] pyarrow is not installed (pip install pyarrow)")
+        return
+
+    if args.command == "series":
+        for row in price_series(args.product_id, args.category):
+            print(f"  {row['scraped_at']}  {_rupees(row['price_paise']):>10}  "
+                  f"off {_rupees(row['discount_paise']):>8}  {row['pin_code'] or ''}  {row['name']}")
+    elif args.command == "snapshot":
+        rows = snapshot(args.category, args.at)
+        for row in rows:
+            print(f"  {row['product_id'][:36]:<36}  {_rupees(row['price_paise']):>10}  {row['name']}")
+        print(f"{len(rows)} products")
+    elif args.command == "partitions":
+        for date, category, directory in partitions():
+            print(f"  {date}  {category:<24} {len(_files(directory)):>4} file(s)")
+    else:
+        compact(args.older_than)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Typed values of a product record's text fields.
+
+Extraction keeps every field as display text: price "45", discount "₹12",
+quantity "500 g", scraped_at "2026-10-17 09:30:00", and "N/A" when a
+value is missing. These helpers turn them into typed values for the
+columnar stores: integer paise for money, a normalized quantity value and
+unit, and datetimes. Missing or unparseable values become None.
+"""
+
+import re
+from datetime import datetime
+
+# Configuration
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Unit as extracted -> (normalized unit, multiplier)
+QUANTITY_UNITS = {
+    "g": ("g", 1),
+    "kg": ("g", 1000),
+    "ml": ("ml", 1),
+    "l": ("ml", 1000),
+    "pc": ("pc", 1),
+    "pcs": ("pc", 1),
+    "pack": ("pack", 1),
+}
+
+MONEY_PATTERN = re.compile(r"(\d+(?:,\d{3})*(?:\.\d{1,2})?)")
+QUANTITY_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([a-zA-Z]+)")
+
+
+def to_paise(value):
+    """
+    Money text as integer paise.
+
+    Args:
+        value: "45", "₹45", "₹1,299.50", 45 or "N/A"
+
+    Returns:
+        int: Amount in paise, or None if there is no amount
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(round(value * 100))
+    match = MONEY_PATTERN.search(str(value))
+    if not match:
+        return None
+    return int(round(float(match.group(1).replace(",", "")) * 100))
+
+
+def parse_quantity(value):
+    """
+    Quantity text as a normalized value and unit.
+
+    Args:
+        value (str): "500 g", "1 kg", "2 pack", "N/A"
+
+    Returns:
+        tuple: (value, unit) with kg -> g and l -> ml, e.g. (1000.0, "g");
+            (None, None) if there is no known unit
+    """
+    match = QUANTITY_PATTERN.search(str(value or ""))
+    if not match:
+        return None, None
+    unit = QUANTITY_UNITS.get(match.group(2).lower())
+    if unit is None:
+        return None, None
+    return float(match.group(1)) * unit[1], unit[0]
+
+
+def typed_fields(product):
+    """
+    Typed money and quantity fields of a product record.
+
+    Returns:
+        dict: price_paise, discount_paise, quantity_value and quantity_unit
+    """
+    quantity_value, quantity_unit = parse_quantity(product.get("quantity"))
+    return {
+        "price_paise": to_paise(product.get("price")),
+        "discount_paise": to_paise(product.get("discount")),
+        "quantity_value": quantity_value,
+        "quantity_unit": quantity_unit,
+    }
+
+
+def parse_timestamp(value):
+    """scraped_at text as a datetime (None if missing or malformed)."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.strptime(str(value), TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,159 @@
+"""
+Cross-category product identity.
+
+The same SKU often shows up in several categories (Munchies and Sweet
+Cravings, Packaged Food and Breakfast & Sauces, ...). Products are
+identified by their /pvid/ product ID everywhere:
+
+    REGISTRY            card records captured in the current run. When a
+                        later page (of any category) shows a card whose ID is
+                        already known, extract_products() reuses the record
+                        instead of reading the card's details again.
+    product_categories  table of the SQLite product store: every category and
+                        subcategory each product was seen in.
+    master catalog      one row per product, without duplicates, listing all
+                        of its categories and subcategories - written at the
+                        end of every category_engine run:
+
+    output/zepto_master_catalog.csv / .json / .parquet
+
+Usage:
+    python product_identity.py                      # master catalog of every stored product
+    python product_identity.py --since 2026-10-17   # only products seen since then
+"""
+
+import argparse
+import csv
+import json
+import os
+import threading
+
+import parquet_output
+from product_store import STORE_PATH, ProductStore
+
+# Configuration
+REUSE_KNOWN_CARDS = True  # True = reuse card records already captured in this run
+MASTER_CSV = "output/zepto_master_catalog.csv"
+MASTER_JSON = "output/zepto_master_catalog.json"
+MASTER_PARQUET = "output/zepto_master_catalog.parquet"  # None = no typed Parquet copy
+MASTER_FIELDNAMES = [
+    "product_id",
+    "name",
+    "price",
+    "discount",
+    "quantity",
+    "image_url",
+    "product_url",
+    "categories",
+    "subcategories",
+    "pin_code",
+    "first_seen",
+    "last_seen",
+]
+
+
+class CardRegistry:
+    """Card records captured in this run, by product ID (shared by all crawl threads)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._cards = {}
+            self.reused = 0
+
+    def get(self, product_id):
+        """A copy of the product's record if it was captured in this run, else None."""
+        if not REUSE_KNOWN_CARDS or not product_id:
+            return None
+        with self._lock:
+            card = self._cards.get(product_id)
+            if card is None:
+                return None
+            self.reused += 1
+            return dict(card)
+
+    def remember(self, product_id, product):
+        """Keeps a product's card record (before the category filter) for later pages."""
+        if not product_id:
+            return
+        with self._lock:
+            if product_id not in self._cards:
+                self._cards[product_id] = {key: value for key, value in product.items() if key != "scraped_at"}
+
+    def __len__(self):
+        return len(self._cards)
+
+
+REGISTRY = CardRegistry()
+
+
+def master_catalog(store, since=None, pin_code=None):
+    """
+    One row per product with all of its categories and subcategories.
+
+    Args:
+        store (ProductStore): The product store
+        since (str): Only products seen at or after this time (e.g. this run's start)
+        pin_code (str): Only this PIN code
+
+    Returns:
+        list: Rows with MASTER_FIELDNAMES, sorted by name
+    """
+    memberships = store.memberships(since, pin_code)
+    rows = []
+    for product in store.query(since=since, pin_code=pin_code):
+        seen_in = memberships.get((product["product_id"], product["pin_code"]), [])
+        categories = list(dict.fromkeys(category for category, _ in seen_in)) or [product["category"]]
+        subcategories = list(dict.fromkeys(subcategory for _, subcategory in seen_in if subcategory))
+        row = {field: product.get(field) for field in MASTER_FIELDNAMES}
+        row["categories"] = "; ".join(category for category in categories if category)
+        row["subcategories"] = "; ".join(subcategories)
+        rows.append(row)
+    return sorted(rows, key=lambda row: ((row["name"] or "").lower(), row["pin_code"]))
+
+
+def write_master_catalog(store, since=None, pin_code=None, output_csv=MASTER_CSV, output_json=MASTER_JSON,
+                         output_parquet=MASTER_PARQUET):
+    """
+    Writes the master catalog as CSV and JSON (and typed Parquet if output_parquet is set).
+
+    Returns:
+        int: Number of products written
+    """
+    rows = master_catalog(store, since, pin_code)
+    os.makedirs(os.path.dirname(output_csv) or ".", exist_ok=True)
+    with open(output_csv, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=MASTER_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(output_json, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2, ensure_ascii=False)
+
+    shared = sum(1 for row in rows if ";" in row["categories"])
+    print(f"\nMaster catalog: {len(rows)} unique products ({shared} in several categories) saved to:")
+    print(f"  - {output_csv}")
+    print(f"  - {output_json}")
+    if output_parquet:
+        parquet_output.write_master(rows, output_parquet)
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the merged master catalog from the product store.")
+    parser.add_argument("--db", default=STORE_PATH, help="Product store database")
+    parser.add_argument("--since", help="Only products seen at or after this date (YYYY-MM-DD)")
+    parser.add_argument("--pin", help="Only this PIN code")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"No product store at {args.db}")
+        return
+    with ProductStore(args.db) as store:
+        write_master_catalog(store, since=args.since, pin_code=args.pin)
+
+
+if __name__ == "__main__":
+    main()
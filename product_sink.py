@@ -0,0 +1,254 @@
+"""
+Streaming product sink.
+
+Products are appended to an NDJSON file and to the final CSV as soon as
+they are extracted, in batches of SINK_BATCH_SIZE, instead of being kept
+in one list and written after the whole crawl. Duplicates are dropped on
+the way in (by product URL, or name+price when there is no URL), so only
+the keys are kept in memory. close() streams the NDJSON file into the
+final JSON array. A crash mid-crawl leaves everything extracted so far in
+the NDJSON and CSV files.
+
+With a product_store.ProductStore the dedup moves to SQLite: each batch
+is upserted there and only the products new to this sink's run are
+written, so no keys are kept in memory at all.
+
+Usage:
+    sink = ProductSink("output/zepto_munchies.csv", "output/zepto_munchies.json")
+    sink.extend(products)   # after each page
+    sink.close()            # writes output/zepto_munchies.json
+"""
+
+import csv
+import json
+import os
+import uuid
+
+# Configuration
+SINK_BATCH_SIZE = 50  # Products buffered before a write + flush
+MAX_STORE_BATCH = 500  # Products per store upsert when resuming
+DEFAULT_FIELDNAMES = [
+    "name",
+    "price",
+    "discount",
+    "quantity",
+    "image_url",
+    "product_url",
+    "scraped_at",
+]
+
+
+def product_key(product):
+    """Dedup key: product URL, or name+price when there is no URL."""
+    if product.get("product_url") and product["product_url"] != "N/A":
+        return product["product_url"]
+    return f"{product.get('name', '')}|{product.get('price', '')}"
+
+
+def ndjson_path(output_json):
+    """NDJSON stream that backs a JSON output file."""
+    return os.path.splitext(output_json)[0] + ".ndjson"
+
+
+class ProductSink:
+    """
+    Appends products to NDJSON and CSV as they arrive.
+
+    Also behaves like the all_products list the crawlers used to build:
+    append() and len() work, so it can be passed where a list was.
+
+    Args:
+        output_csv (str): Final CSV file (written incrementally)
+        output_json (str): Final JSON file (written by close())
+        fieldnames (list): CSV columns; extra product fields go to JSON only
+        batch_size (int): Products buffered before each write + flush
+        resume (bool): Continue an earlier run's NDJSON file instead of starting over
+        tags (dict): Fields added to every product, e.g. {"pin_code": "560067"}
+        store (ProductStore): Dedup and persist through this SQLite store
+        category (str): Category key recorded in the store
+    """
+
+    def __init__(self, output_csv, output_json, fieldnames=None, batch_size=SINK_BATCH_SIZE,
+                 resume=False, tags=None, store=None, category=None):
+        self.output_csv = output_csv
+        self.output_json = output_json
+        self.output_ndjson = ndjson_path(output_json)
+        self.fieldnames = fieldnames or DEFAULT_FIELDNAMES
+        self.batch_size = batch_size
+        self.tags = tags or {}
+        self.store = store
+        self.category = category
+        self.run_id = uuid.uuid4().hex
+        self.count = 0
+        self.duplicates = 0
+        self.closed = False
+        self._seen = set()
+        self._buffer = []
+        self._csv_file = None
+        self._csv_writer = None
+        self._ndjson_file = None
+        if resume and os.path.exists(self.output_ndjson):
+            self._resume()
+
+    def _resume(self):
+        """Reloads the keys of an earlier run and rebuilds the CSV from its NDJSON file."""
+        valid_path = self.output_ndjson + ".tmp"
+        resumed = []
+        os.makedirs(os.path.dirname(self.output_csv) or ".", exist_ok=True)
+        with open(self.output_ndjson, "r", encoding="utf-8") as src, \
+                open(valid_path, "w", encoding="utf-8") as dst, \
+                open(self.output_csv, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=self.fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for line in src:
+                try:
+                    product = json.loads(line)
+                except ValueError:
+                    # Line cut short by a crash
+                    continue
+                key = product_key(product)
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                self.count += 1
+                dst.write(json.dumps(product, ensure_ascii=False) + "\n")
+                writer.writerow(product)
+                if self.store is not None:
+                    # Mark them as seen by this run, so they are not written twice
+                    resumed.append(product)
+                    if len(resumed) >= MAX_STORE_BATCH:
+                        self._store_batch(resumed)
+                        resumed = []
+        if resumed:
+            self._store_batch(resumed)
+        if self.store is not None:
+            self._seen = set()
+        os.replace(valid_path, self.output_ndjson)
+        self._open(append=True)
+        print(f"  [OK] Resumed {self.count} products from {self.output_ndjson}")
+
+    def _open(self, append=False):
+        os.makedirs(os.path.dirname(self.output_csv) or ".", exist_ok=True)
+        os.makedirs(os.path.dirname(self.output_ndjson) or ".", exist_ok=True)
+        mode = "a" if append else "w"
+        self._csv_file = open(self.output_csv, mode, newline="", encoding="utf-8")
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.fieldnames, extrasaction="ignore")
+        if not append:
+            self._csv_writer.writeheader()
+        self._ndjson_file = open(self.output_ndjson, mode, encoding="utf-8")
+
+    def add(self, product):
+        """
+        Adds one product unless it is a duplicate.
+
+        Returns:
+            bool: True if the product was new
+        """
+        if self.store is not None:
+            return self.extend([product]) == 1
+        key = product_key(product)
+        if key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen.add(key)
+        self._add_new(product)
+        return True
+
+    def _add_new(self, product):
+        if self.tags:
+            product = dict(product, **self.tags)
+        self._buffer.append(product)
+        self.count += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def _store_batch(self, products, subcategory=None):
+        """Upserts products into the store. Returns those new to this run."""
+        return self.store.upsert(products, self.run_id, self.category, subcategory,
+                                 self.tags.get("pin_code", ""))
+
+    def append(self, product):
+        """list.append() compatibility for the crawlers."""
+        self.add(product)
+
+    def extend(self, products, subcategory=None):
+        """
+        Adds several products (one store upsert when there is a store).
+
+        Args:
+            products (list): Product dictionaries
+            subcategory (str): Subcategory they were found in (recorded in the store)
+
+        Returns:
+            int: How many were new
+        """
+        if self.store is None:
+            return sum(1 for product in products if self.add(product))
+        products = list(products)
+        new = self._store_batch(products, subcategory)
+        self.duplicates += len(products) - len(new)
+        for product in new:
+            self._add_new(product)
+        return len(new)
+
+    def flush(self):
+        """Writes the buffered products to CSV and NDJSON."""
+        if not self._buffer:
+            return
+        if self._csv_file is None:
+            self._open()
+        self._csv_writer.writerows(self._buffer)
+        for product in self._buffer:
+            self._ndjson_file.write(json.dumps(product, ensure_ascii=False) + "\n")
+        self._csv_file.flush()
+        self._ndjson_file.flush()
+        self._buffer = []
+
+    def iter_products(self):
+        """Products written so far, read back from the NDJSON file one at a time."""
+        self.flush()
+        if not os.path.exists(self.output_ndjson):
+            return
+        with open(self.output_ndjson, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def read_products(self):
+        """All products written so far, as a list."""
+        return list(self.iter_products())
+
+    def close(self):
+        """Flushes the last batch and streams the NDJSON file into the final JSON array."""
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        if self._csv_file is None:
+            print("No products to save!")
+            return
+        self._csv_file.close()
+        self._ndjson_file.close()
+
+        with open(self.output_json, "w", encoding="utf-8") as out:
+            out.write("[")
+            for idx, product in enumerate(self.iter_products()):
+                item = json.dumps(product, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                out.write(("," if idx else "") + "\n  " + item)
+            out.write("\n]" if self.count else "]")
+
+        if self.duplicates:
+            print(f"  Removed {self.duplicates} duplicate(s) before saving")
+        print(f"\nSaved {self.count} products to:")
+        print(f"  - {self.output_csv}")
+        print(f"  - {self.output_json}")
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,325 @@
+"""
+SQLite product store.
+
+One embedded database (output/products.db) holds every product the
+crawlers have seen, keyed by canonical product ID - the /pvid/ segment of
+the product URL - and PIN code. Extraction upserts each page's products
+in one batched transaction: new products are inserted, known ones get
+their fields and last_seen time refreshed. Category, subcategory and
+last_seen are indexed.
+
+The database runs in WAL mode with a busy timeout, and each batch is one
+BEGIN IMMEDIATE transaction, so several scraper processes (for example
+multi_location.py) can write to it at once.
+
+Within a crawl, the store is also the dedup: every ProductSink run has a
+run ID, and upsert() returns only the products not yet seen by that run.
+Run membership has its own table (run_products), so processes crawling
+different categories never reset each other's dedup. A product keeps the
+category it was first seen in; later sightings only refresh its fields.
+
+A product can appear in several categories; product_categories records
+every category and subcategory each product was seen in (see
+product_identity.py for the merged master catalog).
+
+Usage:
+    python product_store.py                     # products per category
+    python product_store.py --since 2026-10-01  # only products seen since then
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import html_extraction
+from product_sink import product_key
+
+# Configuration
+STORE_PATH = "output/products.db"
+STORE_BUSY_TIMEOUT = 30  # Seconds to wait for another process's write lock
+PRODUCT_FIELDS = ["name", "price", "discount", "quantity", "image_url", "product_url"]
+MAX_SQL_PARAMS = 500  # IDs per "IN (...)" lookup
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id TEXT NOT NULL,
+    pin_code TEXT NOT NULL DEFAULT '',
+    name TEXT,
+    price TEXT,
+    discount TEXT,
+    quantity TEXT,
+    image_url TEXT,
+    product_url TEXT,
+    category TEXT,
+    subcategory TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    run_id TEXT,
+    PRIMARY KEY (product_id, pin_code)
+);
+CREATE INDEX IF NOT EXISTS idx_products_category ON products (category);
+CREATE INDEX IF NOT EXISTS idx_products_subcategory ON products (category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_products_last_seen ON products (last_seen);
+CREATE TABLE IF NOT EXISTS product_categories (
+    product_id TEXT NOT NULL,
+    pin_code TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL,
+    subcategory TEXT NOT NULL DEFAULT '',
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (product_id, pin_code, category, subcategory)
+);
+CREATE INDEX IF NOT EXISTS idx_product_categories_category ON product_categories (category, subcategory);
+CREATE INDEX IF NOT EXISTS idx_product_categories_last_seen ON product_categories (last_seen);
+CREATE TABLE IF NOT EXISTS run_products (
+    run_id TEXT NOT NULL,
+    pin_code TEXT NOT NULL DEFAULT '',
+    product_id TEXT NOT NULL,
+    PRIMARY KEY (run_id, pin_code, product_id)
+);
+"""
+
+UPSERT_SQL = f"""
+INSERT INTO products (product_id, pin_code, {", ".join(PRODUCT_FIELDS)}, category, subcategory,
+                      first_seen, last_seen, run_id)
+VALUES ({", ".join("?" * (len(PRODUCT_FIELDS) + 7))})
+ON CONFLICT (product_id, pin_code) DO UPDATE SET
+    {", ".join(f"{field} = excluded.{field}" for field in PRODUCT_FIELDS)},
+    category = COALESCE(products.category, excluded.category),
+    subcategory = CASE WHEN products.category IS NULL OR products.category = excluded.category
+                       THEN COALESCE(excluded.subcategory, products.subcategory)
+                       ELSE products.subcategory END,
+    last_seen = excluded.last_seen
+"""
+
+RUN_SQL = "INSERT OR IGNORE INTO run_products (run_id, pin_code, product_id) VALUES (?, ?, ?)"
+
+MEMBERSHIP_SQL = """
+INSERT INTO product_categories (product_id, pin_code, category, subcategory, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (product_id, pin_code, category, subcategory) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+
+def product_id(product):
+    """Canonical product ID: the /pvid/ segment, else product URL or name+price."""
+    return html_extraction.pvid(product.get("product_url")) or product_key(product)
+
+
+class ProductStore:
+    """
+    Products in SQLite, upserted in batches.
+
+    Args:
+        path (str): Database file (created with its directory if missing)
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit mode; batches open their own transactions. Parallel
+        # crawl workers share the connection, so it is used under a lock.
+        self.conn = sqlite3.connect(path, timeout=STORE_BUSY_TIMEOUT, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+    def upsert(self, products, run_id, category=None, subcategory=None, pin_code=""):
+        """
+        Inserts or refreshes a batch of products in one transaction.
+
+        Args:
+            products (list): Product dictionaries
+            run_id (str): Crawl run the batch belongs to (see ProductSink)
+            category (str): Category key
+            subcategory (str): Subcategory name (None keeps the stored one)
+            pin_code (str): Delivery PIN code of the products
+
+        Returns:
+            list: The products not seen before by this run, in batch order
+        """
+        batch = {}
+        for product in products:
+            batch.setdefault(product_id(product), product)
+        if not batch:
+            return []
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (key, pin_code, *[_text(product.get(field)) for field in PRODUCT_FIELDS],
+             category, subcategory, now, now, run_id)
+            for key, product in batch.items()
+        ]
+
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                seen = set()
+                keys = list(batch)
+                for start in range(0, len(keys), MAX_SQL_PARAMS):
+                    chunk = keys[start:start + MAX_SQL_PARAMS]
+                    seen.update(row[0] for row in self.conn.execute(
+                        f"SELECT product_id FROM run_products WHERE run_id = ? AND pin_code = ? "
+                        f"AND product_id IN ({', '.join('?' * len(chunk))})",
+                        [run_id, pin_code, *chunk],
+                    ))
+                self.conn.executemany(UPSERT_SQL, rows)
+                self.conn.executemany(RUN_SQL, [(run_id, pin_code, key) for key in keys if key not in seen])
+                if category:
+                    self.conn.executemany(MEMBERSHIP_SQL, [
+                        (key, pin_code, category, subcategory or "", now, now) for key in batch
+                    ])
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return [product for key, product in batch.items() if key not in seen]
+
+    def query(self, category=None, subcategory=None, since=None, pin_code=None):
+        """
+        Stored products, most recently seen first.
+
+        Args:
+            category (str): Only this category key
+            subcategory (str): Only this subcategory name
+            since (str): Only products seen at or after this time (YYYY-MM-DD[ HH:MM:SS])
+            pin_code (str): Only this PIN code
+
+        Returns:
+            list: Product dictionaries with product_id, category, subcategory,
+                pin_code, first_seen and last_seen. With a category, every
+                product seen in it is returned (from product_categories),
+                with its latest subcategory there and its last_seen time
+                in that category.
+        """
+        if category is None and subcategory is None:
+            clauses, params = [], []
+            if pin_code is not None:
+                clauses.append("pin_code = ?")
+                params.append(pin_code)
+            if since:
+                clauses.append("last_seen >= ?")
+                params.append(since)
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            with self._lock:
+                rows = self.conn.execute(f"SELECT * FROM products{where} ORDER BY last_seen DESC", params).fetchall()
+            return [dict(row) for row in rows]
+
+        clauses, params = [], []
+        for column, value in (("m.category", category), ("m.subcategory", subcategory), ("m.pin_code", pin_code)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("m.last_seen >= ?")
+            params.append(since)
+        # Bare columns come from the row with the latest sighting (SQLite MAX() rule)
+        sql = (
+            f"SELECT p.product_id, p.pin_code, {', '.join(f'p.{field}' for field in PRODUCT_FIELDS)}, "
+            f"m.category, NULLIF(m.subcategory, '') AS subcategory, p.first_seen, MAX(m.last_seen) AS last_seen, "
+            f"p.run_id FROM product_categories m "
+            f"JOIN products p ON p.product_id = m.product_id AND p.pin_code = m.pin_code "
+            f"WHERE {' AND '.join(clauses)} GROUP BY m.product_id, m.pin_code ORDER BY last_seen DESC"
+        )
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def category_of(self, product_id):
+        """Category the product was last seen in (None if unknown)."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT category FROM product_categories WHERE product_id = ? ORDER BY last_seen DESC LIMIT 1",
+                (product_id,),
+            ).fetchone() or self.conn.execute(
+                "SELECT category FROM products WHERE product_id = ? ORDER BY last_seen DESC LIMIT 1",
+                (product_id,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def memberships(self, since=None, pin_code=None):
+        """
+        Every category and subcategory each product was seen in.
+
+        Args:
+            since (str): Only sightings at or after this time
+            pin_code (str): Only this PIN code
+
+        Returns:
+            dict: (product ID, PIN code) -> list of (category, subcategory), oldest first
+        """
+        clauses, params = [], []
+        if since:
+            clauses.append("last_seen >= ?")
+            params.append(since)
+        if pin_code is not None:
+            clauses.append("pin_code = ?")
+            params.append(pin_code)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        found = {}
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT product_id, pin_code, category, subcategory FROM product_categories{where} "
+                f"ORDER BY first_seen", params
+            ).fetchall()
+        for product_id, pin, category, subcategory in rows:
+            found.setdefault((product_id, pin), []).append((category, subcategory))
+        return found
+
+    def summary(self, since=None):
+        """
+        Product counts per category.
+
+        Returns:
+            list: (category, products, last seen) rows, largest first (a product
+                seen in several categories counts in each)
+        """
+        where, params = ("WHERE last_seen >= ?", [since]) if since else ("", [])
+        with self._lock:
+            return [tuple(row) for row in self.conn.execute(
+                f"SELECT category, COUNT(DISTINCT product_id || '|' || pin_code), MAX(last_seen) "
+                f"FROM product_categories {where} GROUP BY category ORDER BY 2 DESC", params
+            )]
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def _text(value):
+    return None if value is None else str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize the SQLite product store.")
+    parser.add_argument("--db", default=STORE_PATH, help="Database file")
+    parser.add_argument("--since", help="Only products seen at or after this date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"No product store at {args.db}")
+        return
+    with ProductStore(args.db) as store:
+        rows = store.summary(args.since)
+    print("=" * 60)
+    print(f"Product store: {args.db}")
+    print("=" * 60)
+    for category, count, last_seen in rows:
+        print(f"  {category or '-':<24} {count:>7} products  last seen {last_seen}")
+    print(f"  {'Total':<24} {sum(row[1] for row in rows):>7} products")
+
+
+if __name__ == "__main__":
+    main()
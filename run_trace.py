@@ -0,0 +1,191 @@
+"""
+Per-phase timing spans and run trace files.
+
+Phases of a run (browser start, location, navigation, scrolling,
+find_subcategories, extraction, saving, each category and subcategory) are
+wrapped in spans. Sleeps go through run_trace.sleep(), so every span knows
+how much of its time was spent sleeping rather than working. Waits for
+the browser (page readiness, in-page scroll loops) are spans of category
+"wait".
+
+At the end of a run, save() writes a trace file in the Chrome Trace Event
+format to output/traces/ - open it in https://ui.perfetto.dev or
+chrome://tracing - and print_summary() prints the time per phase. Spans
+from parallel workers appear on their own thread rows.
+
+Usage:
+    with run_trace.span("extract_products", url=url):
+        ...
+    run_trace.sleep(2)
+
+    @run_trace.traced("setup_driver")
+    def setup_driver(...): ...
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# Configuration
+TRACE_DIR = "output/traces"
+TRACE_ENABLED = True  # False = no spans are recorded (sleep() still sleeps)
+
+_lock = threading.Lock()
+_local = threading.local()
+_events = []
+_thread_ids = {}
+_origin = time.perf_counter()
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _tid():
+    ident = threading.get_ident()
+    with _lock:
+        if ident not in _thread_ids:
+            _thread_ids[ident] = (len(_thread_ids) + 1, threading.current_thread().name)
+        return _thread_ids[ident][0]
+
+
+def reset():
+    """Drops the recorded spans and starts a new trace."""
+    global _origin
+    with _lock:
+        _events.clear()
+        _origin = time.perf_counter()
+
+
+@contextmanager
+def span(name, category="phase", **args):
+    """
+    Times the enclosed block as one span.
+
+    Args:
+        name (str): Phase name (rows of the summary table)
+        category (str): "phase", "wait" or "sleep"
+        **args: Extra details shown in the trace viewer (URL, counts, ...)
+    """
+    if not TRACE_ENABLED:
+        yield args
+        return
+    entry = {"name": name, "sleep": 0.0}
+    stack = _stack()
+    stack.append(entry)
+    start = time.perf_counter()
+    try:
+        yield args
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - _origin) * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": os.getpid(),
+            "tid": _tid(),
+            "args": dict(args, sleep_ms=round(entry["sleep"] * 1000)),
+        }
+        with _lock:
+            _events.append(event)
+
+
+def traced(name, category="phase"):
+    """Decorator form of span()."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_span():
+    """Name of the innermost open span of this thread, or None."""
+    stack = _stack()
+    return stack[-1]["name"] if stack else None
+
+
+def sleep(seconds):
+    """time.sleep() that is recorded as sleep time of every open span."""
+    if not TRACE_ENABLED:
+        time.sleep(seconds)
+        return
+    start = time.perf_counter()
+    with span("sleep", category="sleep"):
+        time.sleep(seconds)
+    slept = time.perf_counter() - start
+    for entry in _stack():
+        entry["sleep"] += slept
+
+
+def summary():
+    """
+    Time per span name.
+
+    Returns:
+        list: (name, category, count, total seconds, sleep seconds), slowest first
+    """
+    totals = {}
+    with _lock:
+        events = list(_events)
+    for event in events:
+        if event["cat"] == "sleep":
+            continue
+        key = (event["name"], event["cat"])
+        count, total, slept = totals.get(key, (0, 0.0, 0.0))
+        totals[key] = (count + 1, total + event["dur"] / 1e6, slept + event["args"]["sleep_ms"] / 1000)
+    rows = [(name, category, count, total, slept) for (name, category), (count, total, slept) in totals.items()]
+    return sorted(rows, key=lambda row: row[3], reverse=True)
+
+
+def print_summary():
+    """Prints the time per phase, split into sleep and the rest."""
+    rows = summary()
+    if not rows:
+        return
+    print("\n" + "=" * 60)
+    print("Time per phase (spans may nest, so totals overlap)")
+    print("=" * 60)
+    print(f"  {'Phase':<22}{'Count':>6}{'Total s':>10}{'Sleep s':>10}{'Other s':>10}")
+    for name, category, count, total, slept in rows:
+        label = name if category == "phase" else f"{name} ({category})"
+        print(f"  {label[:22]:<22}{count:>6}{total:>10.1f}{slept:>10.1f}{max(0.0, total - slept):>10.1f}")
+    with _lock:
+        sleep_total = sum(e["dur"] for e in _events if e["cat"] == "sleep") / 1e6
+    print(f"  {'All sleeps':<22}{'':>6}{sleep_total:>10.1f}")
+
+
+def save(name="run"):
+    """
+    Writes the recorded spans as a Chrome trace file.
+
+    Returns:
+        str: Path of the trace file, or None if nothing was recorded
+    """
+    with _lock:
+        events = list(_events)
+        threads = dict(_thread_ids)
+    if not events:
+        return None
+    metadata = [
+        {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": thread_name}}
+        for tid, thread_name in threads.values()
+    ]
+    os.makedirs(TRACE_DIR, exist_ok=True)
+    path = os.path.join(TRACE_DIR, f"{name}_{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+                   "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+    print(f"Trace saved to {path} (open in https://ui.perfetto.dev)")
+    return path
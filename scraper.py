@@ -23,6 +23,12 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
+import catalog_capture
+import driver_accounting
+import location_session
+import run_trace
+from product_sink import ProductSink
+
 
 # Configuration
 ZEPTO_URL = "https://www.zepto.com"
@@ -30,6 +36,35 @@ WHITEFIELD_PIN = "560067"
 OUTPUT_CSV = "output/zepto_whitefield_products.csv"
 OUTPUT_JSON = "output/zepto_whitefield_products.json"
 HEADLESS_MODE = False  # Set to True to run in background
+CSV_FIELDNAMES = ['name', 'price', 'original_price', 'discount_amount', 'discount_percent', 'quantity', 'image_url', 'product_url', 'scraped_at']
+# "live" = per-element WebDriver calls (default), "script" = one injected script per page.
+# "script" drops repeated containers in the price-symbol strategy, so it can
+# return fewer cards than "live" on pages that fall through to that strategy.
+EXTRACTION_MODE = "live"
+BROWSER_PROFILE = "full"  # "full" = load every asset, "lean" = block images/media/fonts/trackers, eager page load
+CAPTURE_MODE = False  # True = build products from the catalog JSON responses (falls back to the DOM)
+PAGE_READY_TIMEOUT = 20  # Seconds to wait for the product grid after a navigation
+SCROLL_MODE = "async"  # "async" = one in-page scroll loop, "loop" = fixed sleep after every scroll
+SCROLL_QUIET_MS = 400  # async: content has settled after this long without DOM changes
+SCROLL_SETTLE_MS = 1500  # async: a scroll that adds nothing within this long counts as idle
+SCROLL_MAX_WAIT_MS = 8000  # async: longest wait for one scroll to settle
+SCROLL_IDLE_ROUNDS = 2  # async: stop after this many scrolls without growth
+
+# Requests blocked by the "lean" profile (Network.setBlockedURLs patterns).
+# Blocking happens at the network layer, so img src attributes stay readable.
+LEAN_BLOCKED_URLS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    # Media
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Analytics and trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*connect.facebook*", "*clarity.ms*", "*hotjar*",
+    "*segment.io*", "*mixpanel*", "*branch.io*", "*moengage*", "*appsflyer*",
+    "*sentry.io*", "*newrelic*", "*nr-data.net*",
+]
 
 # Category URLs (updated with working URLs)
 FRUITS_VEGETABLES_URL = "https://www.zepto.com/cn/fruits-vegetables/fruits-vegetables/cid/64374cfe-d06f-4a01-898e-c07c46462c36/scid/e78a8422-5f20-4e4b-9a9f-22a0e53962e3"
@@ -53,7 +88,9 @@ def clear_webdriver_cache():
     return False
 
 
-def setup_driver(headless=False, retry_count=2):
+@run_trace.traced("setup_driver")
+def setup_driver(headless=False, retry_count=2, driver_path=None, capture=None, profile=None,
+                 user_data_dir=None):
     """
     Sets up and returns a Chrome WebDriver instance with optimized settings.
     Includes error handling for ChromeDriver compatibility issues.
@@ -61,6 +98,10 @@ def setup_driver(headless=False, retry_count=2):
     Args:
         headless (bool): Whether to run browser in headless mode
         retry_count (int): Number of retry attempts if driver setup fails
+        driver_path (str): Already-installed ChromeDriver path (skips webdriver-manager)
+        capture (bool): Record network responses for catalog capture (default: CAPTURE_MODE)
+        profile (str): "full" or "lean" (default: BROWSER_PROFILE)
+        user_data_dir (str): Chrome profile directory to use (default: a fresh temporary profile)
         
     Returns:
         webdriver.Chrome: Configured Chrome driver instance
@@ -89,6 +130,24 @@ def setup_driver(headless=False, retry_count=2):
     if headless:
         chrome_options.add_argument("--headless")
     
+    # Own profile directory, e.g. one per location (cookies and storage persist there)
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+    
+    # Lean profile: don't wait for subresources. Images are blocked only by
+    # apply_lean_profile() below - a content-settings pref would be saved into
+    # a persistent user_data_dir and keep images off for later "full" runs.
+    profile = profile or BROWSER_PROFILE
+    if profile == "lean":
+        chrome_options.page_load_strategy = "eager"
+    
+    # Network log for catalog_capture
+    if capture is None:
+        capture = CAPTURE_MODE
+    if capture:
+        catalog_capture.enable_capture(chrome_options)
+    
     # Try to setup driver with retry mechanism
     for attempt in range(retry_count + 1):
         try:
@@ -96,16 +155,14 @@ def setup_driver(headless=False, retry_count=2):
                 print(f"Retry attempt {attempt}/{retry_count}...")
                 # Clear cache on retry
                 clear_webdriver_cache()
-                time.sleep(2)  # Wait a bit before retrying
+                run_trace.sleep(2)  # Wait a bit before retrying
             
             # Initialize driver using webdriver-manager
             # Use cache_valid_range to force fresh download if needed
-            driver_manager = ChromeDriverManager()
-            if attempt > 0:
+            if driver_path is None or attempt > 0:
+                driver_manager = ChromeDriverManager()
                 # Force fresh download on retry
                 driver_path = driver_manager.install()
-            else:
-                driver_path = driver_manager.install()
             
             print(f"ChromeDriver path: {driver_path}")
             
@@ -119,10 +176,15 @@ def setup_driver(headless=False, retry_count=2):
             # Try to create the driver
             print("Initializing Chrome browser...")
             driver = webdriver.Chrome(service=service, options=chrome_options)
+            if driver_accounting.COUNT_COMMANDS:
+                driver_accounting.instrument(driver)
             
             # Execute script to remove webdriver property
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
+            if profile == "lean":
+                apply_lean_profile(driver)
+            
             print("Chrome driver initialized successfully!")
             return driver
             
@@ -157,6 +219,108 @@ def setup_driver(headless=False, retry_count=2):
                 raise
 
 
+def apply_lean_profile(driver, blocked_urls=None):
+    """
+    Blocks image, media, font and analytics requests at the network layer.
+    
+    The elements keep their src attributes, so image URLs can still be read.
+    
+    Args:
+        driver: Selenium WebDriver instance (Chrome)
+        blocked_urls (list): URL patterns to block (default: LEAN_BLOCKED_URLS)
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls or LEAN_BLOCKED_URLS})
+        print(f"[OK] Lean profile: blocking {len(blocked_urls or LEAN_BLOCKED_URLS)} URL patterns")
+    except Exception as e:
+        print(f"[WARNING] Could not apply lean profile: {e}")
+
+
+# State of the current page for the readiness waits: document state and the
+# number of price (₹) elements, i.e. rendered product cards.
+PAGE_STATE_SCRIPT = """
+return {
+    ready: document.readyState !== 'loading',
+    prices: document.evaluate("count(//*[contains(text(), '₹')])", document, null,
+                              XPathResult.NUMBER_TYPE, null).numberValue
+};
+"""
+
+
+@run_trace.traced("wait_for_page_ready", "wait")
+def wait_for_page_ready(driver, timeout=PAGE_READY_TIMEOUT):
+    """
+    Waits until the document has been parsed (readyState is not "loading").
+    
+    Returns:
+        bool: True if the page became ready within the timeout
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+@run_trace.traced("wait_for_product_grid", "wait")
+def wait_for_product_grid(driver, timeout=PAGE_READY_TIMEOUT, stable_polls=2):
+    """
+    Waits until the product grid is rendered and has stopped changing.
+    
+    The grid counts as ready once the document is parsed, at least one price
+    is shown and the number of prices stayed the same for `stable_polls`
+    polls (250 ms apart), so the wait lasts only as long as the page needs.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        timeout (float): Maximum seconds to wait
+        stable_polls (int): Consecutive polls with an unchanged price count
+        
+    Returns:
+        int: Number of price elements, or 0 if the grid did not appear in time
+    """
+    history = []
+
+    def grid_ready(d):
+        state = d.execute_script(PAGE_STATE_SCRIPT) or {}
+        history.append(int(state.get("prices") or 0))
+        recent = history[-(stable_polls + 1):]
+        if state.get("ready") and recent[-1] > 0 and len(recent) > stable_polls and len(set(recent)) == 1:
+            return recent[-1]
+        return False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.25).until(grid_ready)
+    except TimeoutException:
+        return 0
+
+
+@run_trace.traced("navigate")
+def navigate_and_wait(driver, url, timeout=PAGE_READY_TIMEOUT):
+    """
+    Opens a listing page and returns as soon as its product grid is ready.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        url (str): Page to open
+        timeout (float): Maximum seconds to wait for the grid
+        
+    Returns:
+        int: Number of price elements, or 0 if no products appeared in time
+    """
+    start = time.time()
+    driver.get(url)
+    prices = wait_for_product_grid(driver, timeout=timeout)
+    if prices:
+        print(f"  [OK] Page ready in {time.time() - start:.1f}s ({prices} prices)")
+    else:
+        print(f"  [WARNING] No products after {timeout}s")
+    return prices
+
+
 def human_like_delay(min_seconds=1, max_seconds=3):
     """
     Adds a random human-like delay between actions.
@@ -168,12 +332,13 @@ def human_like_delay(min_seconds=1, max_seconds=3):
     """
     import random
     delay = random.uniform(min_seconds, max_seconds)
-    time.sleep(delay)
+    run_trace.sleep(delay)
 
 
+@run_trace.traced("set_location")
 def set_location_whitefield(driver, pin_code=WHITEFIELD_PIN):
     """
-    Sets the delivery location to Whitefield, Bangalore using PIN code.
+    Sets the delivery location by PIN code (Whitefield, Bangalore by default).
     
     This function handles the location modal that appears when visiting Zepto.
     It looks for common location input patterns and submits the PIN code.
@@ -185,9 +350,13 @@ def set_location_whitefield(driver, pin_code=WHITEFIELD_PIN):
     Returns:
         bool: True if location was set successfully, False otherwise
     """
+    needles = location_session.location_needles(pin_code)
+    area = location_session.LOCATION_NAMES.get(pin_code, pin_code)
+    # Case-sensitive XPath match on the PIN code or the area name as shown
+    location_xpath = "//*[" + " or ".join(f"contains(text(), '{needle}')" for needle in needles) + "]"
     try:
         print("=" * 60)
-        print(f"SETTING LOCATION: Whitefield, Bangalore (PIN: {pin_code})")
+        print(f"SETTING LOCATION: {area}, Bangalore (PIN: {pin_code})")
         print("=" * 60)
         
         # Wait for page to load initially
@@ -201,14 +370,14 @@ def set_location_whitefield(driver, pin_code=WHITEFIELD_PIN):
         page_text = driver.page_source.lower()
         current_url = driver.current_url.lower()
         
-        # Check for Whitefield or PIN in page
-        if "whitefield" in page_text or pin_code in page_text or "560067" in current_url:
-            print(f"  [OK] Location appears to be already set to Whitefield ({pin_code})")
+        # Check for the area name or PIN in page
+        if any(needle.lower() in page_text for needle in needles) or pin_code in current_url:
+            print(f"  [OK] Location appears to be already set to {area} ({pin_code})")
             # Double-check by looking for location display
             try:
-                location_display = driver.find_elements(By.XPATH, "//*[contains(text(), 'Whitefield') or contains(text(), '560067')]")
+                location_display = driver.find_elements(By.XPATH, location_xpath)
                 if location_display:
-                    print("  [OK] Verified: Whitefield location found on page")
+                    print(f"  [OK] Verified: {area} location found on page")
                     return True
             except:
                 pass
@@ -387,14 +556,14 @@ def set_location_whitefield(driver, pin_code=WHITEFIELD_PIN):
                 page_text_after = driver.page_source.lower()
                 current_url_after = driver.current_url.lower()
                 
-                if pin_code in page_text_after or "whitefield" in page_text_after or pin_code in current_url_after:
-                    print(f"  [SUCCESS] Location set to Whitefield ({pin_code})!")
+                if any(needle.lower() in page_text_after for needle in needles) or pin_code in current_url_after:
+                    print(f"  [SUCCESS] Location set to {area} ({pin_code})!")
                     return True
                 else:
                     print("  [WARNING] Location may not have been set. Checking page...")
                     # Check for location display
                     try:
-                        location_display = driver.find_elements(By.XPATH, f"//*[contains(text(), '{pin_code}') or contains(text(), 'Whitefield')]")
+                        location_display = driver.find_elements(By.XPATH, location_xpath)
                         if location_display:
                             print("  [OK] Found location indicator on page")
                             return True
@@ -421,7 +590,111 @@ def set_location_whitefield(driver, pin_code=WHITEFIELD_PIN):
         return False
 
 
-def scroll_and_load_products(driver, max_scrolls=10, scroll_pause=2):
+# Scrolls to the bottom until the product list stops growing, all inside the
+# page. A MutationObserver tells it when new nodes arrive, so each scroll
+# waits only until the DOM has been quiet for quietMs (or settleMs if nothing
+# arrives at all) instead of a fixed sleep. "Growth" means more price (₹)
+# elements or a taller page. Run with execute_async_script.
+ASYNC_SCROLL_SCRIPT = r"""
+var maxScrolls = arguments[0], quietMs = arguments[1], settleMs = arguments[2],
+    maxWaitMs = arguments[3], maxIdle = arguments[4];
+var done = arguments[arguments.length - 1];
+
+function priceCount() {
+    return document.evaluate("count(//*[contains(text(), '₹')])", document, null,
+                             XPathResult.NUMBER_TYPE, null).numberValue;
+}
+
+var mutations = 0, lastMutation = 0;
+var observer = new MutationObserver(function (records) {
+    for (var i = 0; i < records.length; i++) {
+        if (records[i].addedNodes.length) {
+            mutations++;
+            lastMutation = performance.now();
+            return;
+        }
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+
+var start = performance.now();
+var count = priceCount(), height = document.body.scrollHeight;
+var scrolls = 0, idle = 0, steps = [];
+
+function finish(reason) {
+    observer.disconnect();
+    window.scrollTo(0, 0);
+    done({reason: reason, scrolls: scrolls, count: count, height: height, steps: steps,
+          elapsed_ms: Math.round(performance.now() - start)});
+}
+
+function scrollOnce() {
+    if (scrolls >= maxScrolls) { return finish('max_scrolls'); }
+    var before = mutations, t0 = performance.now();
+    window.scrollTo(0, document.body.scrollHeight);
+    scrolls++;
+
+    (function wait() {
+        var now = performance.now(), changed = mutations > before;
+        var settled = changed ? now - lastMutation >= quietMs : now - t0 >= settleMs;
+        if (!settled && now - t0 < maxWaitMs) { return setTimeout(wait, 50); }
+
+        var newCount = priceCount(), newHeight = document.body.scrollHeight;
+        steps.push(newCount);
+        if (newCount > count || newHeight > height) {
+            count = Math.max(count, newCount);
+            height = Math.max(height, newHeight);
+            idle = 0;
+        } else if (++idle >= maxIdle) {
+            return finish('idle');
+        }
+        scrollOnce();
+    })();
+}
+
+try { scrollOnce(); } catch (e) { observer.disconnect(); done({error: String(e)}); }
+"""
+
+
+@run_trace.traced("scroll_async", "wait")
+def scroll_page_async(driver, max_scrolls=30, quiet_ms=SCROLL_QUIET_MS,
+                      settle_ms=SCROLL_SETTLE_MS, max_wait_ms=SCROLL_MAX_WAIT_MS,
+                      idle_rounds=SCROLL_IDLE_ROUNDS):
+    """
+    Scrolls the page with ASYNC_SCROLL_SCRIPT in a single WebDriver call.
+
+    Args:
+        driver: Selenium WebDriver instance
+        max_scrolls (int): Maximum number of scroll actions to perform
+        quiet_ms (int): DOM quiet period that ends the wait after a scroll
+        settle_ms (int): Wait after a scroll that adds nothing
+        max_wait_ms (int): Longest wait for one scroll
+        idle_rounds (int): Scrolls without growth before stopping
+
+    Returns:
+        dict: Script result (reason, scrolls, count, height, steps, elapsed_ms),
+            or None if the script failed and the caller should fall back
+    """
+    driver.set_script_timeout(max_scrolls * max_wait_ms / 1000 + 10)
+    try:
+        result = driver.execute_async_script(
+            ASYNC_SCROLL_SCRIPT, max_scrolls, quiet_ms, settle_ms, max_wait_ms, idle_rounds
+        ) or {}
+    except Exception as e:
+        print(f"  [WARNING] Async scroll failed ({str(e)[:60]}), falling back to scroll loop")
+        return None
+
+    if result.get("error"):
+        print(f"  [WARNING] Async scroll failed ({result['error'][:60]}), falling back to scroll loop")
+        return None
+
+    print(f"  [OK] {result['scrolls']} scrolls in {result['elapsed_ms'] / 1000:.1f}s - "
+          f"{result['count']} price elements, stopped: {result['reason']}")
+    return result
+
+
+@run_trace.traced("scroll_page")
+def scroll_and_load_products(driver, max_scrolls=10, scroll_pause=2, mode=None):
     """
     Scrolls the page to trigger lazy loading of products.
     
@@ -431,9 +704,12 @@ def scroll_and_load_products(driver, max_scrolls=10, scroll_pause=2):
     Args:
         driver: Selenium WebDriver instance
         max_scrolls (int): Maximum number of scroll actions to perform
-        scroll_pause (float): Seconds to wait after each scroll
+        scroll_pause (float): Seconds to wait after each scroll ("loop" mode)
+        mode (str): "async" or "loop" (default: SCROLL_MODE)
     """
     print("Scrolling to load products...")
+    if (mode or SCROLL_MODE) == "async" and scroll_page_async(driver, max_scrolls=max_scrolls):
+        return
     
     # Get initial page height
     last_height = driver.execute_script("return document.body.scrollHeight")
@@ -459,10 +735,11 @@ def scroll_and_load_products(driver, max_scrolls=10, scroll_pause=2):
     human_like_delay(1, 2)
 
 
-def extract_product_data(driver):
+@run_trace.traced("extract_products")
+def extract_product_data(driver, mode=None):
     """
     Extracts product information from the current page.
-    
+
     This function looks for product cards/containers and extracts:
     - Product Name
     - Price
@@ -470,13 +747,22 @@ def extract_product_data(driver):
     - Quantity/Size
     - Product Image URL
     - Product Page URL
-    
+
     Args:
         driver: Selenium WebDriver instance
-        
+        mode (str): "script" or "live" (default: EXTRACTION_MODE)
+
     Returns:
         list: List of dictionaries containing product data
     """
+    if CAPTURE_MODE:
+        captured = catalog_capture.collect_products(driver)
+        if captured:
+            return captured
+
+    if (mode or EXTRACTION_MODE) == "script":
+        return extract_product_data_script(driver)
+
     products = []
     
     print("=" * 60)
@@ -495,8 +781,8 @@ def extract_product_data(driver):
         print("[ERROR] Page did not load properly")
         return products
     
-    # Wait a bit more for dynamic content
-    human_like_delay(2, 3)
+    # Wait for dynamic content
+    wait_for_product_grid(driver, timeout=10)
     
     # Zepto-specific selectors - try multiple strategies
     print("\nSearching for product elements...")
@@ -963,6 +1249,319 @@ def extract_product_data(driver):
     return products
 
 
+# Selectors used by the card collector script (same order as extract_product_data)
+CARD_FIELD_SELECTORS = {
+    "name": ["h1", "h2", "h3", "h4", "[class*='title']", "[class*='name']",
+             "[data-testid*='name']", "[data-testid*='title']"],
+    "price": ["[class*='price']", "[class*='Price']", "[data-testid*='price']", "span", "div"],
+    "original": ["[class*='original']", "[class*='strike']", "s", "del", "[style*='line-through']"],
+    "discount_amount": ["[class*='discount']", "[class*='off']", "[class*='save']"],
+    "discount_percent": ["[class*='discount']", "[class*='Discount']", "[class*='off']", "span:contains('%')"],
+    "quantity": ["[class*='quantity']", "[class*='size']", "[class*='weight']", "[class*='unit']"],
+}
+
+# Collects the raw fields of every product card in a single round-trip.
+# It applies the same 5 container strategies as extract_product_data() and
+# returns plain text/attribute values; all parsing happens in Python.
+CARD_COLLECTOR_SCRIPT = r"""
+var sel = arguments[0];
+
+function text(el) { return el ? (el.innerText || '').trim() : ''; }
+function attr(el, name) {
+    if (!el) { return ''; }
+    var value = el[name];
+    if (typeof value === 'string' && value) { return value; }
+    return el.getAttribute(name) || '';
+}
+function first(root, selector) {
+    try { return root.querySelector(selector); } catch (e) { return null; }
+}
+function all(root, selector) {
+    try { return Array.prototype.slice.call(root.querySelectorAll(selector)); } catch (e) { return []; }
+}
+function xpathFirst(context, xpath) {
+    try {
+        return document.evaluate(xpath, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } catch (e) { return null; }
+}
+function xpathAll(xpath) {
+    var snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+    return nodes;
+}
+function hasAny(value, terms) {
+    return terms.some(function (term) { return value.indexOf(term) !== -1; });
+}
+
+var strategy = null;
+var elements = [];
+var links = all(document, 'a');
+
+// Strategy 1: product links
+elements = links.filter(function (link) {
+    var href = attr(link, 'href');
+    var hrefLower = href.toLowerCase();
+    var isProductLink = false;
+    if (href) {
+        if (hasAny(hrefLower, ['/product', '/p/', '/item', 'product'])) {
+            isProductLink = true;
+        } else if (hrefLower.indexOf('zepto.com') !== -1 && href.length > 30) {
+            isProductLink = !hasAny(hrefLower, ['/category/', '/home', '/search', '/cn/']);
+        }
+    }
+    return isProductLink && !hasAny(text(link).toLowerCase(), ['explore', 'explore now', 'banner']);
+});
+if (elements.length) { strategy = 'product links'; }
+
+// Strategy 2: product cards by class
+if (!elements.length) {
+    var cardSelectors = [
+        "[class*='ProductCard']", "[class*='product-card']", "[class*='ProductCard__']",
+        "[data-testid*='product']", "[data-testid*='ProductCard']", "article[class*='product']",
+        "div[class*='Product']", "[class*='product-item']", "[data-product-id]",
+        "a[href*='zepto.com'][href*='/']"
+    ];
+    for (var s = 0; s < cardSelectors.length && !elements.length; s++) {
+        elements = all(document, cardSelectors[s]).filter(function (el) {
+            var hrefLower = (el.getAttribute('href') ? attr(el, 'href') : '').toLowerCase();
+            if (hasAny(text(el).toLowerCase(), ['explore', 'explore now', 'banner', 'up to 30% off'])) { return false; }
+            return hrefLower.indexOf('/category/') === -1 && hrefLower.indexOf('/cn/') === -1;
+        });
+        if (elements.length) { strategy = 'card selector ' + cardSelectors[s]; }
+    }
+}
+
+// Strategy 3: product containers via images
+if (!elements.length) {
+    var seenHrefs = {};
+    all(document, 'img').forEach(function (img) {
+        var src = attr(img, 'src').toLowerCase();
+        var parent = xpathFirst(img, './ancestor::a[1]');
+        if (parent) {
+            var href = attr(parent, 'href');
+            if (href && seenHrefs[href]) { return; }
+            var parentText = text(parent).toLowerCase();
+            if (hasAny(parentText, ['explore', 'banner', 'up to 30%'])) { return; }
+            if (hasAny(src, ['product', 'item', 'cdn', 'image']) || parentText.indexOf('₹') !== -1) {
+                elements.push(parent);
+                if (href) { seenHrefs[href] = true; }
+            }
+        } else {
+            parent = xpathFirst(img, './ancestor::*[@onclick or @href][1]');
+            if (parent) { elements.push(parent); }
+        }
+    });
+    if (elements.length) { strategy = 'images'; }
+}
+
+// Strategy 4: containers of elements containing the price symbol
+if (!elements.length) {
+    var seen = new Set();
+    xpathAll("//*[contains(text(), '₹')]").forEach(function (priceEl) {
+        var container = xpathFirst(priceEl,
+            "./ancestor::a[1] | ./ancestor::div[contains(@class, 'card') or contains(@class, 'item')][1]");
+        if (!container || seen.has(container)) { return; }
+        var containerText = text(container).toLowerCase();
+        if (hasAny(containerText, ['explore', 'banner', 'up to 30% off'])) { return; }
+        if (containerText.length > 10) {
+            seen.add(container);
+            elements.push(container);
+        }
+    });
+    if (elements.length) { strategy = 'price elements'; }
+}
+
+// Strategy 5: grid items as last resort
+if (!elements.length) {
+    var gridSelectors = ["[class*='grid'] [class*='item']", "[class*='Grid'] [class*='Item']", "div[class*='card']"];
+    for (var g = 0; g < gridSelectors.length; g++) {
+        var items = all(document, gridSelectors[g]);
+        if (items.length > 3) {
+            elements = items;
+            strategy = 'grid items';
+            break;
+        }
+    }
+}
+
+function firstTexts(el, selectors) {
+    return selectors.map(function (selector) { return text(first(el, selector)); });
+}
+
+var cards = elements.map(function (el) {
+    var img = first(el, 'img');
+    var link = first(el, 'a');
+    return {
+        text: text(el),
+        names: firstTexts(el, sel.name),
+        price_texts: sel.price.map(function (selector) {
+            return all(el, selector).map(text).filter(function (t) { return t.indexOf('₹') !== -1; });
+        }),
+        original_texts: firstTexts(el, sel.original),
+        discount_amount_texts: firstTexts(el, sel.discount_amount),
+        discount_percent_texts: firstTexts(el, sel.discount_percent),
+        quantity_texts: firstTexts(el, sel.quantity),
+        image_url: img ? (attr(img, 'src') || img.getAttribute('data-src') || '') : '',
+        href: link ? attr(link, 'href') : ''
+    };
+});
+
+return {strategy: strategy, total_links: links.length, cards: cards};
+"""
+
+
+def parse_card_fields(raw_card):
+    """
+    Builds a product dictionary from the raw fields collected by
+    CARD_COLLECTOR_SCRIPT, using the same rules as extract_product_data().
+
+    Args:
+        raw_card (dict): Raw card fields returned by the collector script
+
+    Returns:
+        dict: Product data (without 'scraped_at')
+    """
+    import re
+
+    product_data = {}
+
+    # Name: first non-empty name selector, then the first meaningful text line
+    product_name = next((name for name in raw_card.get('names') or [] if name), None)
+    if not product_name:
+        element_text = raw_card.get('text') or ""
+        lines = [line.strip() for line in element_text.split('\n') if line.strip()]
+        for line in lines:
+            if not any(skip in line.lower() for skip in ['₹', 'off', '%', 'mins', 'pack', 'g', 'kg', 'pc']):
+                if len(line) > 3:
+                    product_name = line
+                    break
+        if not product_name and lines:
+            product_name = lines[0]
+    if product_name:
+        product_name = ' '.join(product_name.strip().split())
+    product_data['name'] = product_name if product_name else "Unknown"
+
+    # Price: first in-range "₹ N" in the price selectors, then in the whole card text
+    price = None
+    for price_texts in raw_card.get('price_texts') or []:
+        for price_text in price_texts:
+            price_match = re.search(r'₹\s*(\d+(?:[.,]\d+)?)', price_text)
+            if price_match:
+                price = price_match.group(1).replace(',', '').replace('.', '')
+                if price and 1 <= int(price) <= 100000:
+                    break
+        if price:
+            break
+    if not price:
+        price_match = re.search(r'₹\s*(\d+(?:[.,]\d+)?)', raw_card.get('text') or "")
+        if price_match:
+            price = price_match.group(1).replace(',', '').replace('.', '')
+            if not (price and 1 <= int(price) <= 100000):
+                price = None
+    product_data['price'] = price if price else "N/A"
+
+    original_price = None
+    for orig_text in raw_card.get('original_texts') or []:
+        orig_match = re.search(r'₹?\s*(\d+[.,]?\d*)', orig_text or "")
+        if orig_match:
+            original_price = orig_match.group(1).replace(',', '')
+            break
+    product_data['original_price'] = original_price if original_price else "N/A"
+
+    discount_amount = None
+    for disc_text in raw_card.get('discount_amount_texts') or []:
+        disc_match = re.search(r'₹?\s*(\d+)\s*OFF', disc_text or "", re.IGNORECASE)
+        if disc_match:
+            discount_amount = f"₹{disc_match.group(1)}"
+            break
+
+    discount_percent = None
+    for discount_text in raw_card.get('discount_percent_texts') or []:
+        discount_match = re.search(r'(\d+)%', discount_text or "")
+        if discount_match:
+            discount_percent = discount_match.group(1)
+            break
+
+    product_data['discount_amount'] = discount_amount if discount_amount else "N/A"
+    product_data['discount_percent'] = f"{discount_percent}%" if discount_percent else "N/A"
+
+    quantity = next((qty for qty in raw_card.get('quantity_texts') or [] if qty), None)
+    product_data['quantity'] = quantity if quantity else "N/A"
+
+    product_data['image_url'] = raw_card.get('image_url') or "N/A"
+
+    href = raw_card.get('href')
+    if href:
+        product_data['product_url'] = ZEPTO_URL + href if href.startswith("/") else href
+    else:
+        product_data['product_url'] = "N/A"
+
+    return product_data
+
+
+def extract_product_data_script(driver):
+    """
+    Extracts product information with a single injected script.
+
+    Instead of several WebDriver calls per card, CARD_COLLECTOR_SCRIPT
+    collects the raw fields of every card as a JSON array in one round-trip
+    and parse_card_fields() turns them into the usual product dictionaries.
+
+    Args:
+        driver: Selenium WebDriver instance
+
+    Returns:
+        list: List of dictionaries containing product data
+    """
+    products = []
+
+    print("=" * 60)
+    print("EXTRACTING PRODUCT DATA (single-script mode)")
+    print("=" * 60)
+
+    try:
+        result = driver.execute_script(CARD_COLLECTOR_SCRIPT, CARD_FIELD_SELECTORS) or {}
+    except Exception as e:
+        print(f"[ERROR] Card collector script failed: {e}")
+        return products
+
+    raw_cards = result.get('cards') or []
+    print(f"  [INFO] Total links on page: {result.get('total_links', 0)}")
+    print(f"  [INFO] Strategy used: {result.get('strategy') or 'none'}")
+    print(f"\n{'='*60}")
+    print(f"Total product elements found: {len(raw_cards)}")
+    print(f"{'='*60}\n")
+
+    if not raw_cards:
+        print("[WARNING] No product elements found!")
+        print("This could mean:")
+        print("  - Products haven't loaded yet (try scrolling)")
+        print("  - Selectors need to be updated")
+        print("  - Page structure has changed")
+        return products
+
+    scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for idx, raw_card in enumerate(raw_cards):
+        try:
+            product_data = parse_card_fields(raw_card)
+            if product_data['name'] != "Unknown" and len(product_data['name']) > 2:
+                product_data['scraped_at'] = scraped_at
+                products.append(product_data)
+                price_display = f"₹{product_data['price']}" if product_data['price'] != "N/A" else "N/A"
+                print(f"  [{idx+1}] [OK] {product_data['name'][:40]:<40} | {price_display}")
+            else:
+                print(f"  [{idx+1}] [SKIP] Name: '{product_data['name'][:30]}' | Price: {product_data['price']}")
+        except Exception as e:
+            print(f"  [{idx+1}] [ERROR] {str(e)[:50]}")
+            continue
+
+    print(f"\n{'='*60}")
+    print(f"EXTRACTION COMPLETE: {len(products)} products extracted!")
+    print(f"{'='*60}\n")
+    return products
+
+
 def save_to_csv(products, filename=OUTPUT_CSV):
     """
     Saves product data to a CSV file.
@@ -978,11 +1577,8 @@ def save_to_csv(products, filename=OUTPUT_CSV):
     import os
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
-    # Get all unique keys from products
-    fieldnames = ['name', 'price', 'original_price', 'discount_amount', 'discount_percent', 'quantity', 'image_url', 'product_url', 'scraped_at']
-    
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
         writer.writeheader()
         writer.writerows(products)
     
@@ -1056,14 +1652,13 @@ def navigate_to_fruits_vegetables_category(driver, use_direct_url=True):
         if use_direct_url:
             # Use the known working URL directly
             print(f"Navigating directly to Fruits & Vegetables category...")
-            driver.get(FRUITS_VEGETABLES_URL)
-            human_like_delay(3, 5)
+            navigate_and_wait(driver, FRUITS_VEGETABLES_URL)
             
             # Verify we're not on a 404 page
             if check_for_404(driver):
                 print("[ERROR] Direct URL returned 404. Trying to find category link from homepage...")
                 driver.get(ZEPTO_URL)
-                human_like_delay(3, 5)
+                wait_for_page_ready(driver)
                 return navigate_to_fruits_vegetables_category(driver, use_direct_url=False)
             
             # Check if page loaded successfully (look for product elements or category indicators)
@@ -1105,7 +1700,7 @@ def navigate_to_fruits_vegetables_category(driver, use_direct_url=True):
                     if category_link and category_link.is_displayed():
                         print(f"Found category link: {link_text}")
                         category_link.click()
-                        human_like_delay(3, 5)
+                        wait_for_product_grid(driver)
                         
                         # Verify we're not on a 404 page
                         if check_for_404(driver):
@@ -1136,15 +1731,14 @@ def navigate_to_category_or_search(driver, search_term=None, category_url=None):
     """
     if category_url:
         print(f"Navigating to category URL: {category_url}")
-        driver.get(category_url)
-        human_like_delay(3, 5)
+        navigate_and_wait(driver, category_url)
         
         # Check if we got a 404
         if check_for_404(driver):
             print("[ERROR] Category URL returned 404 error!")
             print("Trying to find category link from homepage instead...")
             driver.get(ZEPTO_URL)
-            human_like_delay(3, 5)
+            wait_for_page_ready(driver)
             navigate_to_fruits_vegetables_category(driver)
     elif search_term:
         print(f"Searching for: {search_term}")
@@ -1172,7 +1766,7 @@ def navigate_to_category_or_search(driver, search_term=None, category_url=None):
             human_like_delay(1, 2)
             from selenium.webdriver.common.keys import Keys
             search_input.send_keys(Keys.RETURN)
-            human_like_delay(3, 5)
+            wait_for_product_grid(driver)
         else:
             print("Search input not found. Please search manually.")
     else:
@@ -1200,12 +1794,14 @@ def main():
         # Step 2: Open Zepto homepage
         print("\n[2/5] Opening Zepto homepage...")
         driver.get(ZEPTO_URL)
-        human_like_delay(3, 5)
+        wait_for_page_ready(driver)
         print("[OK] Homepage loaded")
         
         # Step 3: Set location to Whitefield
         print("\n[3/5] Setting delivery location...")
-        location_set = set_location_whitefield(driver)
+        location_set = location_session.ensure_location(
+            driver, WHITEFIELD_PIN, set_location=set_location_whitefield, interactive=False
+        )
         if not location_set:
             print("\n" + "=" * 60)
             print("[IMPORTANT] Location was not set automatically!")
@@ -1216,7 +1812,9 @@ def main():
             print("3. Enter PIN code: 560067")
             print("4. Click Apply/Confirm/Go")
             print("\nAfter setting location, press Enter here to continue...")
-            input("Press Enter after location is set to Whitefield (560067)...")
+            with run_trace.span("location_prompt", "wait"):
+                input("Press Enter after location is set to Whitefield (560067)...")
+            location_session.save_location_session(driver, WHITEFIELD_PIN)
             print("\n[OK] Continuing with scraping...")
         else:
             print("\n[OK] Location set successfully! Continuing...")
@@ -1236,14 +1834,13 @@ def main():
         if check_for_404(driver):
             print("\n[ERROR] Page is showing 404 error!")
             print("Trying direct URL again...")
-            driver.get(FRUITS_VEGETABLES_URL)
-            human_like_delay(3, 5)
+            navigate_and_wait(driver, FRUITS_VEGETABLES_URL)
             if check_for_404(driver):
                 print("[ERROR] Still getting 404. Please navigate manually.")
                 input("Press Enter after you've navigated to the category page...")
         
         # Wait for products to load
-        human_like_delay(3, 5)
+        wait_for_product_grid(driver)
         
         # Step 5: Scroll to load all products
         print("\n[5/5] Scrolling to load all products...")
@@ -1256,8 +1853,9 @@ def main():
         if products:
             # Step 7: Save to files
             print("\nSaving data...")
-            save_to_csv(products)
-            save_to_json(products)
+            with run_trace.span("save_data"):
+                with ProductSink(OUTPUT_CSV, OUTPUT_JSON, fieldnames=CSV_FIELDNAMES) as sink:
+                    sink.extend(products)
             print(f"\n[SUCCESS] Successfully scraped {len(products)} products!")
         else:
             print("\n[WARNING] No products found. This could be because:")
@@ -1273,7 +1871,7 @@ def main():
         # Keep browser open for a few seconds to verify
         if not HEADLESS_MODE:
             print("\nBrowser will close in 10 seconds...")
-            time.sleep(10)
+            run_trace.sleep(10)
     
     except Exception as e:
         print(f"\n[ERROR] Error during scraping: {str(e)}")
@@ -1284,6 +1882,10 @@ def main():
         if driver:
             driver.quit()
             print("Browser closed.")
+        run_trace.print_summary()
+        run_trace.save("scraper")
+        driver_accounting.report()
+        driver_accounting.save("scraper")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+"""Shared pytest setup: the scraper modules live at the repository root."""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def categories():
+    """Category definitions from categories.json."""
+    import category_engine
+
+    return category_engine.load_categories(os.path.join(ROOT, "categories.json"))
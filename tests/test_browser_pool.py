@@ -0,0 +1,73 @@
+import pytest
+
+from browser_pool import SessionPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.pages = []
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("browser is gone")
+        return "complete"
+
+    def quit(self):
+        self.alive = False
+
+
+class FakePool(SessionPool):
+    """SessionPool with fake browsers; `failures` launches raise before one succeeds."""
+
+    def __init__(self, **kwargs):
+        super().__init__(driver_path="fake-chromedriver", **kwargs)
+        self.failures = 0
+        self.launched = []
+
+    def _launch(self, session_id, slot):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError(f"Session {session_id}: could not set location {self.pin_code}")
+        driver = FakeDriver()
+        self.launched.append((session_id, slot))
+        return driver
+
+
+def test_sessions_are_recycled_after_max_pages():
+    with FakePool(size=1, max_pages=2) as pool:
+        for _ in range(3):
+            with pool.lease() as session:
+                session.driver.get("https://www.zepto.com/cn/munchies")
+        assert pool.sessions_recycled == 1
+        assert pool.launched == [(1, 1), (2, 1)]
+
+
+def test_pool_recovers_when_a_replacement_cannot_be_launched():
+    pool = FakePool(size=1).start()
+    with pool.lease() as session:
+        session.driver.quit()  # Browser crashed
+
+    pool.failures = 1
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            pass
+    assert pool._all_sessions == []
+
+    # The next lease launches a new session for the same slot
+    with pool.lease() as session:
+        assert session.is_healthy() and session.slot == 1
+    assert len(pool._all_sessions) == 1
+    pool.close()
+
+
+def test_recycle_tolerates_a_session_already_removed():
+    pool = FakePool(size=1).start()
+    session = pool._all_sessions[0]
+    pool._all_sessions.clear()
+    replacement = pool._recycle(session, "test")
+    assert pool._all_sessions == [replacement]
+    pool.close()
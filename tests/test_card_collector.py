@@ -0,0 +1,41 @@
+from benchmark_suite import PAGE_URL, render_page, synthetic_cards
+from card_collector import CardCollector
+
+PAGE = "https://www.zepto.com/cn/munchies"
+
+
+def poll_result(entries, total, url=PAGE, fresh=False):
+    return {"url": url, "total": total, "pending": 0, "entries": entries, "fresh": fresh}
+
+
+def test_absorb_moves_the_cursor_and_skips_known_cards():
+    collector = CardCollector()
+    assert collector.absorb(poll_result([["a", "<a>A</a>"], ["b", "<a>B</a>"]], 2, fresh=True)) == [
+        ("a", "<a>A</a>"), ("b", "<a>B</a>")]
+    assert collector.cursor == 2
+    assert collector.absorb(poll_result([["b", "<a>B</a>"], ["c", "<a>C</a>"]], 4)) == [("c", "<a>C</a>")]
+    assert collector.cursor == 4
+    assert list(collector.cards) == ["a", "b", "c"]
+    assert len(collector) == 3
+
+
+def test_absorb_resets_on_a_new_page_or_agent():
+    collector = CardCollector()
+    collector.absorb(poll_result([["a", "<a>A</a>"]], 1, fresh=True))
+    collector.absorb(poll_result([["x", "<a>X</a>"]], 1, url=PAGE + "/chips"))
+    assert list(collector.cards) == ["x"] and collector.url == PAGE + "/chips"
+    # Same URL, but the page was reloaded and the agent reinstalled
+    collector.absorb(poll_result([["y", "<a>Y</a>"]], 1, url=PAGE + "/chips", fresh=True))
+    assert list(collector.cards) == ["y"] and collector.cursor == 1
+
+
+def test_products_parse_collected_cards(categories):
+    definition = categories["munchies"]
+    cards = synthetic_cards(definition, 10)
+    collector = CardCollector()
+    entries = [[card["pvid"], render_page([card])] for card in cards]
+    collector.absorb(poll_result(entries, len(entries), url=PAGE_URL.format(key="munchies"), fresh=True))
+    products = collector.products(definition)
+    assert [product["name"] for product in products] == [
+        " ".join(word.capitalize() for word in card["slug"].split("-")) for card in cards]
+    assert len(collector.products(definition, list(collector.cards.items())[:3])) == 3
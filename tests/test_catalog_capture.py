@@ -0,0 +1,23 @@
+import os
+
+import catalog_capture
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), catalog_capture.FIXTURE_PATH)
+
+
+def test_products_from_the_recorded_responses():
+    products = catalog_capture.products_from_responses(catalog_capture.load_fixture(FIXTURE))
+    assert len(products) == len({product["variant_id"] for product in products})
+    chips = next(product for product in products if product["name"].startswith("Lay's"))
+    assert chips["price"] == "20" and chips["quantity"] == "52 g"
+    assert chips["product_url"].endswith("/pvid/" + chips["variant_id"])
+    bhujia = next(product for product in products if product["name"] == "Haldiram's Aloo Bhujia")
+    assert (bhujia["original_price"], bhujia["discount"], bhujia["discount_percent"]) == ("115", "₹16", "13%")
+
+
+def test_unknown_wrappers_are_walked_through():
+    payload = {"layout": [{"widget": {"items": [{"product": {"name": "Kurkure Masala Munch"},
+                                                 "productVariant": {"id": "v1", "formattedPacksize": "90 g"},
+                                                 "sellingPrice": 2000, "mrp": 2000}]}}]}
+    records = catalog_capture.products_from_payload(payload)
+    assert [record["name"] for record in records] == ["Kurkure Masala Munch"]
@@ -0,0 +1,24 @@
+import types
+
+import card_harvest
+import category_engine
+import page_snapshots
+
+
+def test_harvest_mode_filters_and_records_snapshots(monkeypatch):
+    saved = []
+    monkeypatch.setattr(category_engine, "SCROLL_HARVEST", True)
+    monkeypatch.setattr(page_snapshots, "RECORD_SNAPSHOTS", True)
+    monkeypatch.setattr(page_snapshots, "save_snapshot", lambda driver, key: saved.append(key))
+    monkeypatch.setattr(card_harvest, "harvest_page", lambda driver, definition: [
+        {"name": "Lays Classic Salted", "price": "20"}, {"name": "Dettol Soap", "price": "45"}])
+    def extract_products(driver):
+        raise AssertionError("harvest mode must not re-extract the page")
+
+    module = types.SimpleNamespace(is_valid_product=lambda product: "Lays" in product["name"],
+                                   extract_products=extract_products)
+
+    products = category_engine.scroll_and_extract(object(), {"key": "munchies", "name": "Munchies"}, module)
+    assert [product["name"] for product in products] == ["Lays Classic Salted"]
+    assert "scraped_at" in products[0]
+    assert saved == ["munchies"]
@@ -0,0 +1,41 @@
+import pytest
+
+import crawl_fingerprints
+from crawl_fingerprints import FingerprintStore
+
+URL = "https://www.zepto.com/cn/munchies/chips"
+PRODUCTS = [{"name": "Lays Classic Salted", "price": "20", "scraped_at": "2026-10-16 09:30:00"}]
+
+
+@pytest.fixture(autouse=True)
+def fingerprint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_fingerprints, "FINGERPRINT_DIR", str(tmp_path / "fingerprints"))
+
+
+def crawled_store():
+    store = FingerprintStore("munchies")
+    store.update(URL, "24:abc", PRODUCTS)
+    store.save()
+    return FingerprintStore("munchies", incremental=True)
+
+
+def test_unchanged_page_is_carried_forward_and_marked():
+    store = crawled_store()
+    assert store.unchanged(URL, "24:abc")
+    assert not store.unchanged(URL, "24:def")
+    carried = store.carry_forward(URL)
+    assert carried == [dict(PRODUCTS[0], carried_forward=True)]
+    assert store.carried == 1 and store.skipped == 1
+    # The stored products stay unmarked for the next run
+    assert "carried_forward" not in store.pages[URL]["products"][0]
+
+
+def test_full_crawl_outside_incremental_mode():
+    crawled_store()
+    assert not FingerprintStore("munchies").unchanged(URL, "24:abc")
+
+
+def test_old_fingerprints_force_a_crawl(monkeypatch):
+    store = crawled_store()
+    monkeypatch.setattr(crawl_fingerprints, "FINGERPRINT_MAX_AGE_HOURS", 0)
+    assert not store.unchanged(URL, "24:abc")
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+import crawl_journal
+from crawl_journal import CrawlJournal
+
+URLS = ["https://www.zepto.com/cn/munchies/chips", "https://www.zepto.com/cn/munchies/namkeens",
+        "https://www.zepto.com/cn/munchies/nachos"]
+NAMES = ["Chips", "Namkeens", "Nachos"]
+
+
+@pytest.fixture(autouse=True)
+def journal_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_journal, "JOURNAL_DIR", str(tmp_path / "journal"))
+
+
+def test_resume_skips_finished_pages():
+    journal = CrawlJournal("munchies")
+    journal.record_subcategories(URLS, NAMES)
+    journal.mark_done(URLS[0], 12)
+
+    resumed = CrawlJournal("munchies", resume=True)
+    assert resumed.has_subcategories and not resumed.finished
+    assert resumed.pending(URLS, NAMES) == (URLS[1:], NAMES[1:])
+    assert resumed.unfinished() == 2
+
+
+def test_resume_ignores_a_line_cut_short_by_a_crash():
+    journal = CrawlJournal("munchies")
+    journal.record_subcategories(URLS, NAMES)
+    journal.mark_done(URLS[1], 5)
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"event": "page", "url": URLS[2], "products": 3})[:20])
+
+    resumed = CrawlJournal("munchies", resume=True)
+    assert resumed.done == {URLS[1]: 5}
+    assert resumed.pending(URLS, NAMES) == ([URLS[0], URLS[2]], [NAMES[0], NAMES[2]])
+
+
+def test_finished_category_and_fresh_start():
+    journal = CrawlJournal("munchies")
+    journal.record_subcategories(URLS, NAMES)
+    for url in URLS:
+        journal.mark_done(url, 1)
+    journal.mark_finished(3)
+    assert CrawlJournal("munchies", resume=True).finished
+
+    # Without resume the journal starts over
+    fresh = CrawlJournal("munchies")
+    assert not fresh.has_subcategories and fresh.unfinished() is None
+    assert not CrawlJournal("munchies", resume=True).done
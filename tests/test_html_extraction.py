@@ -0,0 +1,45 @@
+import pytest
+
+import html_extraction
+from benchmark_suite import PAGE_URL, card_products, render_page, synthetic_cards
+
+BACKENDS = ["html.parser", pytest.param("lxml", marks=pytest.mark.skipif(
+    html_extraction.etree is None, reason="lxml is not installed"))]
+
+
+FIELDS = ["name", "price", "discount", "image_url", "product_url"]
+
+
+def fields(products):
+    return [{key: product.get(key) for key in FIELDS} for product in products]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("key", ["munchies", "fruits_vegetables", "dairy_bread_eggs"])
+def test_backend_reads_every_synthetic_card(categories, key, backend):
+    definition = categories[key]
+    cards = synthetic_cards(definition, 60)
+    page_url = PAGE_URL.format(key=key)
+    products = html_extraction.products_from_html(render_page(cards), definition, page_url, backend)
+    assert fields(products) == fields(card_products(cards, page_url))
+
+
+@pytest.mark.skipif(html_extraction.etree is None, reason="lxml is not installed")
+def test_backends_agree(categories):
+    definition = categories["munchies"]
+    html = render_page(synthetic_cards(definition, 200, seed=3))
+    page_url = PAGE_URL.format(key="munchies")
+    assert (html_extraction.products_from_html(html, definition, page_url, "lxml")
+            == html_extraction.products_from_html(html, definition, page_url, "html.parser"))
+
+
+def test_pvid_and_card_key():
+    href = "https://www.zeptonow.com/pn/lays-classic/pvid/1a2b-3c?ref=grid"
+    assert html_extraction.pvid(href) == "1a2b-3c"
+    assert html_extraction.pvid("/pn/lays-classic") is None
+    assert html_extraction.card_key(href, "Lays Classic ₹20") == "1a2b-3c"
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        html_extraction.get_backend("html5lib")
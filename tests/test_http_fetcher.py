@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+import catalog_capture
+import http_fetcher
+
+pytest.importorskip("aiohttp")
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(__file__)), catalog_capture.FIXTURE_PATH)
+
+
+@pytest.fixture
+def stand_in():
+    server = http_fetcher.start_stand_in_server(fixture_path=FIXTURE, port=0)
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(base_url):
+    definition = {
+        "key": "stand_in",
+        "name": "Stand-in Munchies",
+        "url": f"{base_url}/cn/munchies/munchies",
+        "subcategory_keywords": [],
+        "excluded_subcategory_keywords": [],
+    }
+    return http_fetcher.fetch_categories([definition], {"stand_in": lambda product: True}, {})["stand_in"]
+
+
+def test_stand_in_records_match_dom_format(stand_in):
+    products = fetch(stand_in)
+
+    assert products
+    assert all(set(product) == set(http_fetcher.EXTRACTED_FIELDS) | {"scraped_at"} for product in products)
+    assert all(product["price"] == "N/A" or product["price"].isdigit() for product in products)
+    assert len({product["product_url"] for product in products}) == len(products)
+
+    by_name = {product["name"]: product for product in products}
+    cornitos = next(product for name, product in by_name.items() if name.startswith("Cornitos"))
+    assert cornitos["price"] == "74"
+    assert cornitos["discount"] == "₹15"
+
+
+def test_as_extracted_uses_card_rules():
+    record = {"name": "Chips", "price": "74.50", "original_price": "90", "discount": "₹15.50",
+              "quantity": "1 pack (40 g)", "product_url": "/pn/chips/pvid/1", "image_url": "x.jpg",
+              "product_id": "1"}
+    assert http_fetcher.as_extracted(record) == {
+        "name": "Chips", "price": "74", "discount": "₹15", "quantity": "1 pack",
+        "product_url": "/pn/chips/pvid/1", "image_url": "x.jpg",
+    }
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import price_history
+
+
+def product(pvid, price, scraped_at, name="Lays Classic Salted"):
+    return {"name": name, "price": price, "discount": "N/A", "quantity": "52 g",
+            "product_url": f"https://www.zepto.com/pn/x/pvid/{pvid}", "scraped_at": scraped_at}
+
+
+@pytest.fixture
+def history(tmp_path):
+    root = str(tmp_path / "history")
+    price_history.append([product("a", "20", "2026-10-01 10:00:00"), product("b", "10", "2026-10-01 10:00:01")],
+                         "munchies", run_id="run-1", root=root)
+    # A run that starts before midnight and ends after it
+    price_history.append([product("a", "22", "2026-10-02 23:59:30"), product("b", "11", "2026-10-03 00:00:10")],
+                         "munchies", run_id="run-2", root=root)
+    price_history.append([product("c", "99", "2026-10-02 12:00:00")], "sweet_cravings", run_id="run-3", root=root)
+    return root
+
+
+def test_partitions_by_date_and_category(history):
+    found = [(date, category) for date, category, _ in price_history.partitions(root=history)]
+    assert found == [("2026-10-01", "munchies"), ("2026-10-02", "munchies"),
+                     ("2026-10-02", "sweet_cravings"), ("2026-10-03", "munchies")]
+    assert len(price_history.partitions("munchies", start="2026-10-02", root=history)) == 2
+
+
+def test_price_series(history):
+    series = price_history.price_series("a", category="munchies", root=history)
+    assert [(row["scraped_at"], row["price_paise"]) for row in series] == [
+        (datetime(2026, 10, 1, 10, 0), 2000), (datetime(2026, 10, 2, 23, 59, 30), 2200)]
+    assert series[0]["quantity_value"] == 52.0 and series[0]["quantity_unit"] == "g"
+
+
+def test_snapshot_returns_the_last_run_before_the_time(history):
+    rows = price_history.snapshot("munchies", "2026-10-02 12:00:00", root=history)
+    assert [(row["product_id"], row["price_paise"], row["run_id"]) for row in rows] == [
+        ("a", 2000, "run-1"), ("b", 1000, "run-1")]
+
+
+def test_snapshot_spans_midnight(history):
+    rows = price_history.snapshot("munchies", "2026-10-04 00:00:00", root=history)
+    assert [(row["product_id"], row["price_paise"]) for row in rows] == [("a", 2200), ("b", 1100)]
+    assert price_history.snapshot("munchies", "2026-09-30 00:00:00", root=history) == []
+
+
+def test_compact_keeps_every_row(history):
+    price_history.append([product("a", "21", "2026-10-01 18:00:00")], "munchies", run_id="run-4", root=history)
+    assert price_history.compact(older_than_days=0, root=history) == 1
+    series = price_history.price_series("a", category="munchies", end="2026-10-01", root=history)
+    assert [row["price_paise"] for row in series] == [2000, 2100]
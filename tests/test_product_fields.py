@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+
+from product_fields import parse_quantity, parse_timestamp, to_paise, typed_fields
+
+
+@pytest.mark.parametrize("value, paise", [
+    ("45", 4500),
+    ("₹45", 4500),
+    ("₹1,299.50", 129950),
+    ("₹12 OFF", 1200),
+    (45, 4500),
+    (12.5, 1250),
+    ("N/A", None),
+    (None, None),
+])
+def test_to_paise(value, paise):
+    assert to_paise(value) == paise
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("500 g", (500.0, "g")),
+    ("1 kg", (1000.0, "g")),
+    ("1.5 L", (1500.0, "ml")),
+    ("200ml", (200.0, "ml")),
+    ("6 pcs", (6.0, "pc")),
+    ("2 pack", (2.0, "pack")),
+    ("N/A", (None, None)),
+    ("3 dozen", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_quantity(value, expected):
+    assert parse_quantity(value) == expected
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2026-10-17 09:30:00") == datetime(2026, 10, 17, 9, 30)
+    assert parse_timestamp("yesterday") is None
+    assert parse_timestamp(None) is None
+
+
+def test_typed_fields():
+    assert typed_fields({"price": "45", "discount": "N/A", "quantity": "1 kg"}) == {
+        "price_paise": 4500, "discount_paise": None, "quantity_value": 1000.0, "quantity_unit": "g"}
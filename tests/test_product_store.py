@@ -0,0 +1,92 @@
+import benchmark_suite
+import category_engine
+from product_sink import ProductSink
+from product_store import ProductStore, product_id
+
+
+def product(pvid, name="Lays Classic Salted", price="20"):
+    return {"name": name, "price": price, "product_url": f"https://www.zeptonow.com/pn/x/pvid/{pvid}"}
+
+
+def test_product_id_prefers_pvid():
+    assert product_id(product("abc-123")) == "abc-123"
+    assert product_id({"name": "Lays", "price": "20"}) == "Lays|20"
+
+
+def test_upsert_returns_only_products_new_to_the_run(tmp_path):
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        first = store.upsert([product("a"), product("b"), product("a")], "run-1", "munchies")
+        assert [product_id(p) for p in first] == ["a", "b"]
+        assert [product_id(p) for p in store.upsert([product("b"), product("c")], "run-1", "munchies")] == ["c"]
+        # Another run sees every product as new again
+        assert len(store.upsert([product("a"), product("b")], "run-2", "munchies")) == 2
+        assert len(store.query(category="munchies")) == 3
+
+
+def test_upsert_refreshes_fields_and_keeps_pin_codes_apart(tmp_path):
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        store.upsert([product("a", price="20")], "run-1", "munchies", pin_code="560067")
+        store.upsert([product("a", price="25")], "run-2", "munchies", pin_code="560067")
+        store.upsert([product("a", price="22")], "run-2", "munchies", pin_code="560102")
+        prices = {row["pin_code"]: row["price"] for row in store.query()}
+        assert prices == {"560067": "25", "560102": "22"}
+
+
+def test_memberships_record_every_category(tmp_path):
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        store.upsert([product("a")], "run-1", "munchies", "Chips")
+        store.upsert([product("a")], "run-1", "sweet_cravings", "Snacks")
+        assert store.memberships()[("a", "")] == [("munchies", "Chips"), ("sweet_cravings", "Snacks")]
+
+
+def test_add_unique_products_dedups_through_a_sink(tmp_path):
+    sink = ProductSink(str(tmp_path / "out.csv"), str(tmp_path / "out.json"))
+    assert category_engine.add_unique_products([product("a"), product("b")], sink) == 2
+    assert category_engine.add_unique_products([product("b"), {"name": "No URL"}], sink, subcategory="Chips") == 0
+    sink.close()
+    assert [p["product_url"][-1] for p in sink.read_products()] == ["a", "b"]
+
+
+def test_add_unique_products_with_store(tmp_path):
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        sink = ProductSink(str(tmp_path / "out.csv"), str(tmp_path / "out.json"), store=store, category="munchies")
+        assert category_engine.add_unique_products([product("a"), product("b")], sink, subcategory="Chips") == 2
+        assert category_engine.add_unique_products([product("a"), product("c")], sink, subcategory="Namkeens") == 1
+        sink.close()
+        assert {row["product_id"]: row["subcategory"] for row in store.query()} == {
+            "a": "Namkeens", "b": "Chips", "c": "Namkeens"}
+
+
+def test_benchmark_category_runs(categories, tmp_path):
+    # Regression: the benchmark's dedup step must keep up with add_unique_products()
+    results = {}
+    benchmark_suite.bench_category("munchies", categories["munchies"], [40], 1, results, str(tmp_path))
+    assert results["dedup/munchies/40"]["items"] == results["is_valid_product/munchies/40"]["items"]
+    assert results["save_data/munchies/40"]["items"] > 0
+
+
+def test_runs_sharing_a_database_keep_their_own_dedup(tmp_path):
+    # Two processes (connections) crawling different categories into one store
+    path = str(tmp_path / "products.db")
+    with ProductStore(path) as store_a, ProductStore(path) as store_b:
+        sink_a = ProductSink(str(tmp_path / "munchies.csv"), str(tmp_path / "munchies.json"),
+                             store=store_a, category="munchies")
+        sink_b = ProductSink(str(tmp_path / "sweets.csv"), str(tmp_path / "sweets.json"),
+                             store=store_b, category="sweet_cravings")
+        assert sink_a.extend([product("x"), product("y")], subcategory="Chips") == 2
+        assert sink_b.extend([product("x")], subcategory="Snacks") == 1
+        assert sink_a.extend([product("x"), product("z")], subcategory="Chips") == 1
+        assert sink_b.extend([product("x"), product("y")], subcategory="Snacks") == 1
+        sink_a.close()
+        sink_b.close()
+        assert [product_id(p) for p in sink_a.read_products()] == ["x", "y", "z"]
+        assert [product_id(p) for p in sink_b.read_products()] == ["x", "y"]
+
+        munchies = {row["product_id"]: row["subcategory"] for row in store_a.query(category="munchies")}
+        sweets = {row["product_id"]: row["subcategory"] for row in store_a.query(category="sweet_cravings")}
+        assert munchies == {"x": "Chips", "y": "Chips", "z": "Chips"}
+        assert sweets == {"x": "Snacks", "y": "Snacks"}
+        # The product keeps the category it was first seen in
+        assert {row["product_id"]: row["category"] for row in store_b.query()}["x"] == "munchies"
+        assert dict((category, count) for category, count, _ in store_a.summary()) == {
+            "munchies": 3, "sweet_cravings": 2}
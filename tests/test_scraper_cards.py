@@ -0,0 +1,34 @@
+import scraper
+
+
+def test_parse_card_fields_applies_the_live_rules():
+    raw_card = {
+        "names": ["", "  Lay's   India's Magic Masala  "],
+        "text": "Lay's India's Magic Masala\n52 g\n₹20\n₹25\n₹5 OFF",
+        "price_texts": [[], ["MRP", "₹ 20"], ["₹25"]],
+        "original_texts": ["₹25"],
+        "discount_amount_texts": ["₹5 OFF"],
+        "discount_percent_texts": ["20% off"],
+        "quantity_texts": ["", "52 g"],
+        "image_url": "https://cdn.zeptonow.com/lays.jpeg",
+        "href": "/pn/lays-magic-masala/pvid/a4b1d7c2",
+    }
+    assert scraper.parse_card_fields(raw_card) == {
+        "name": "Lay's India's Magic Masala",
+        "price": "20",
+        "original_price": "25",
+        "discount_amount": "₹5",
+        "discount_percent": "20%",
+        "quantity": "52 g",
+        "image_url": "https://cdn.zeptonow.com/lays.jpeg",
+        "product_url": scraper.ZEPTO_URL + "/pn/lays-magic-masala/pvid/a4b1d7c2",
+    }
+
+
+def test_parse_card_fields_falls_back_to_the_card_text():
+    product = scraper.parse_card_fields({"text": "₹45 OFF\nAmul Taaza Milk\n500 ml\n₹ 1,299.50"})
+    assert product["name"] == "Amul Taaza Milk"
+    # First "₹ N" in the text, with separators dropped as in the live path
+    assert product["price"] == "45"
+    assert (product["quantity"], product["image_url"], product["product_url"]) == ("N/A", "N/A", "N/A")
+